@@ -0,0 +1,142 @@
+"""
+Memory and speed of the compact extracted DataFrames against the object-dtype frames they replaced.
+
+Synthetic faculty and papers from the generator's scale mode are turned into frames the way
+the extractors build them, once with the categorical / Int16 columns and once with every such
+column converted back to Python objects. The script reports the bytes per row of both, and the
+time of the analysis transforms and of a department by year group-by on each.
+
+Usage: python -m benchmarks.bench_dtypes [--scale 20] [--papers-factor 5]
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+import pandas as pd
+import dummy_data_generator
+from etl_engine.extractors.mongo_extractor import MongoExtractor
+from etl_engine.transformers import FacultyTransformer, ResearchTransformer
+from etl_engine.utils.dataframes import compact_dtypes, concat_frames
+
+CHUNK_SIZE = 50000
+
+
+def read_ndjson(path: str):
+    with open(path) as f:
+        for line in f:
+            yield json.loads(line)
+
+
+def research_frame(papers_path: str) -> pd.DataFrame:
+    """Unwind the papers as the extractor's aggregation pipeline does and build the chunks"""
+    chunks, rows = [], []
+    for document in read_ndjson(papers_path):
+        for paper in document['papers']:
+            rows.append({
+                'faculty_id': document['faculty_id'],
+                'faculty_name': document['faculty_name'],
+                'department': document['department'],
+                'school': document['school'],
+                'research_area': document['research_area'],
+                'paper_title': paper['title'],
+                'published_year': paper['year'],
+                'journal': paper['journal'],
+                'coauthors': paper['co_authors'],
+            })
+            if len(rows) >= CHUNK_SIZE:
+                chunks.append(MongoExtractor._build_chunk(rows))
+                rows = []
+    if rows:
+        chunks.append(MongoExtractor._build_chunk(rows))
+    return concat_frames(chunks)
+
+
+def faculty_frame(faculty_path: str) -> pd.DataFrame:
+    records = [
+        {
+            'faculty_id': int(faculty['faculty_id']),
+            'first_name': faculty['first_name'],
+            'middle_name': None if faculty['middle_name'] == "NULL" else faculty['middle_name'],
+            'last_name': faculty['last_name'],
+            'department_name': faculty['school'] if faculty['department'] in (None, "NULL") else faculty['department'],
+            'school_name': faculty['school'],
+            'position': faculty['position'],
+        }
+        for faculty in read_ndjson(faculty_path)
+    ]
+    return compact_dtypes(pd.DataFrame(records))
+
+
+def as_objects(df: pd.DataFrame) -> pd.DataFrame:
+    """The frame as the extractors used to return it"""
+    converted = df.copy()
+    for column in converted.columns:
+        if isinstance(converted[column].dtype, pd.CategoricalDtype) or converted[column].dtype == 'Int16':
+            converted[column] = converted[column].astype(object)
+    return converted
+
+
+def timed(function, repeat: int = 3) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def compare(label: str, compact_df: pd.DataFrame, operations):
+    object_df = as_objects(compact_df)
+    object_bytes = object_df.memory_usage(deep=True).sum() / len(object_df)
+    compact_bytes = compact_df.memory_usage(deep=True).sum() / len(compact_df)
+    print(f"{label}: {len(compact_df)} rows")
+    print(
+        f"  {'memory per row':<28} {object_bytes:>9.0f} B {compact_bytes:>9.0f} B "
+        f"{object_bytes / compact_bytes:>6.1f}x"
+    )
+
+    for name, operation in operations:
+        expected, result = operation(object_df.copy()), operation(compact_df.copy())
+        assert expected == result, f"{name} differs between the object and the compact frame"
+        object_seconds = timed(lambda: operation(object_df.copy()))
+        compact_seconds = timed(lambda: operation(compact_df.copy()))
+        print(
+            f"  {name:<28} {object_seconds:>9.3f} s {compact_seconds:>9.3f} s "
+            f"{object_seconds / compact_seconds:>6.1f}x"
+        )
+
+
+def department_year_counts(df: pd.DataFrame):
+    return {
+        (str(department), int(year)): int(count)
+        for (department, year), count in df.groupby(['department', 'published_year'], observed=True).size().items()
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scale", type=int, default=20, help="Copies of faculties.json to generate")
+    parser.add_argument("--papers-factor", type=int, default=5, help="Multiplier of the papers per faculty")
+    parser.add_argument("--faculty-file", default="faculties.json", help="Base faculty list of the generator")
+    args = parser.parse_args()
+
+    with open(args.faculty_file) as f:
+        base_faculty = json.load(f)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        generated = dummy_data_generator.generate_scaled_data(
+            base_faculty, workdir, args.scale, args.papers_factor, workers=os.cpu_count()
+        )
+        research_df = research_frame(generated['papers_path'])
+        faculty_df = faculty_frame(generated['faculty_path'])
+
+    print(f"{'':<30} {'object':>11} {'compact':>11} {'gain':>7}")
+    compare("research papers", research_df, [
+        ("transform_research_data", ResearchTransformer.transform_research_data),
+        ("department x year group-by", department_year_counts),
+    ])
+    compare("faculty", faculty_df, [
+        ("transform_facutly_data", FacultyTransformer.transform_facutly_data),
+    ])
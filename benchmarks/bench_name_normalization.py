@@ -0,0 +1,79 @@
+"""
+Micro-benchmark of the row-wise name normalization against the vectorized normalize_names.
+
+Usage: python -m benchmarks.bench_name_normalization [--sizes 10000 100000 1000000]
+"""
+import argparse
+import time
+import numpy as np
+import pandas as pd
+from etl_engine.transformers.name_normalizer import normalize_names
+
+FIRST_NAMES = ["Kanhaiya", "Jyoti", "Dil", "Ram", "Sita", "Hari", " Bishnu", "Anita "]
+MIDDLE_NAMES = [None, None, None, "Bahadur", "Prasad", "Kumari", " ", ""]
+LAST_NAMES = ["Jha", "Upadhyaya", "Gurung", "Sharma", "Thapa", "Shrestha ", "Adhikari"]
+
+
+def make_names(rows: int, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'first_name': rng.choice(np.array(FIRST_NAMES, dtype=object), rows),
+        'middle_name': rng.choice(np.array(MIDDLE_NAMES, dtype=object), rows),
+        'last_name': rng.choice(np.array(LAST_NAMES, dtype=object), rows),
+    })
+
+
+def faculty_row_wise(df: pd.DataFrame) -> pd.Series:
+    """The per-row lambda FacultyTransformer.normalize_faculty_names used to run"""
+    return df.apply(
+        lambda row: " ".join(filter(None, [
+            row['first_name'].lower().strip() if 'first_name' in row else '',
+            row['middle_name'].lower().strip() if 'middle_name' in row and row['middle_name'] else '',
+            row['last_name'].lower().strip() if 'last_name' in row else '',
+        ])),
+        axis=1
+    )
+
+
+def research_row_wise(df: pd.DataFrame) -> pd.Series:
+    """The per-row lambda ResearchTransformer.transform_research_data used to run"""
+    return df.apply(
+        lambda row: " ".join(filter(None, [
+            str(row['first_name']).lower().strip() if pd.notna(row['first_name']) else '',
+            str(row['middle_name']).lower().strip() if pd.notna(row['middle_name']) else '',
+            str(row['last_name']).lower().strip() if pd.notna(row['last_name']) else ''
+        ])),
+        axis=1
+    )
+
+
+def timed(function, df: pd.DataFrame):
+    start = time.perf_counter()
+    result = function(df)
+    return result, time.perf_counter() - start
+
+
+def run(sizes):
+    print(f"{'rows':>10} {'faculty apply':>14} {'research apply':>15} {'vectorized':>11} {'speedup':>8}")
+    for rows in sizes:
+        df = make_names(rows)
+
+        faculty_result, faculty_seconds = timed(faculty_row_wise, df)
+        research_result, research_seconds = timed(research_row_wise, df)
+        vectorized_result, vectorized_seconds = timed(normalize_names, df)
+
+        assert vectorized_result.equals(faculty_result), "vectorized output differs from faculty normalization"
+        assert vectorized_result.equals(research_result), "vectorized output differs from research normalization"
+
+        speedup = min(faculty_seconds, research_seconds) / vectorized_seconds
+        print(
+            f"{rows:>10} {faculty_seconds:>13.3f}s {research_seconds:>14.3f}s "
+            f"{vectorized_seconds:>10.3f}s {speedup:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+    run(args.sizes)
@@ -0,0 +1,108 @@
+"""
+Benchmark the full text search queries against the ILIKE queries they replaced.
+
+Runs against the loaded analytics database (POSTGRES_URL, or --url). The search indexes are
+created by the ETL; run it once, or call PostgreSQLLoader().create_search_indexes(), before
+benchmarking. For every term the script reports the median and p95 latency of both paths, the
+number of rows each returns and whether PostgreSQL planned the search with an index.
+
+Usage: python -m benchmarks.bench_search [--url postgresql://...] [--repeat 50] [--area learning] [--name ram] [--title topology]
+"""
+import argparse
+import statistics
+import time
+from typing import Callable, List
+from sqlalchemy import create_engine, func, or_, select, text
+from sqlalchemy.orm import Session
+from etl_engine.core.config import settings
+from etl_engine.loaders.postgres_loader import AnalyticsFaculty, ResearchArea, Publication
+from etl_engine.search.full_text import (
+    faculty_by_research_area, faculty_by_name, publication_search, research_area_search
+)
+
+
+def legacy_supervisor_search(db: Session, term: str) -> int:
+    """Faculty of the first research area matching term, as the API used to find them"""
+    area = db.execute(select(ResearchArea).where(ResearchArea.area_name.ilike(f"%{term}%")).limit(1)).scalar()
+    if area is None:
+        return 0
+    return len(db.execute(select(AnalyticsFaculty.faculty_id).where(AnalyticsFaculty.research_areas.contains(area))).all())
+
+
+def supervisor_search(db: Session, term: str) -> int:
+    if db.execute(research_area_search(term).limit(1)).first() is None:
+        return 0
+    matches = faculty_by_research_area(term)
+    return len(db.execute(select(matches.c.faculty_id).order_by(matches.c.relevance.desc())).all())
+
+
+def legacy_name_search(db: Session, term: str) -> int:
+    pattern = f"%{term}%"
+    return len(db.execute(select(AnalyticsFaculty.faculty_id).where(or_(
+        AnalyticsFaculty.first_name.ilike(pattern),
+        AnalyticsFaculty.last_name.ilike(pattern),
+        func.concat(AnalyticsFaculty.first_name, ' ', AnalyticsFaculty.last_name).ilike(pattern)
+    ))).all())
+
+
+def name_search(db: Session, term: str) -> int:
+    matches = faculty_by_name(term)
+    return len(db.execute(select(matches.c.faculty_id).order_by(matches.c.relevance.desc())).all())
+
+
+def legacy_title_search(db: Session, term: str) -> int:
+    return len(db.execute(select(Publication.id).where(Publication.paper_title.ilike(f"%{term}%"))).all())
+
+
+def title_search(db: Session, term: str) -> int:
+    return len(db.execute(publication_search(term)).all())
+
+
+def uses_index(db: Session, statement) -> bool:
+    compiled = statement.compile(dialect=db.get_bind().dialect, compile_kwargs={'literal_binds': True})
+    plan = "\n".join(row[0] for row in db.execute(text(f"EXPLAIN {compiled}")))
+    return "Index Scan" in plan
+
+
+def measure(db: Session, search: Callable[[Session, str], int], term: str, repeat: int):
+    rows = search(db, term)
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        search(db, term)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return rows, statistics.median(timings) * 1000, timings[int(0.95 * (len(timings) - 1))] * 1000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", default=settings.POSTGRES_URL, help="Analytics database to search")
+    parser.add_argument("--repeat", type=int, default=50, help="Timed runs per query")
+    parser.add_argument("--area", action="append", help="Research area term, repeatable")
+    parser.add_argument("--name", action="append", help="Faculty name term, repeatable")
+    parser.add_argument("--title", action="append", help="Paper title term, repeatable")
+    args = parser.parse_args()
+
+    cases = [
+        ("research area", args.area or ["learning", "vision"], legacy_supervisor_search, supervisor_search,
+         lambda term: research_area_search(term)),
+        ("faculty name", args.name or ["ram", "sharma"], legacy_name_search, name_search,
+         lambda term: select(faculty_by_name(term))),
+        ("paper title", args.title or ["topology", "analysis"], legacy_title_search, title_search,
+         lambda term: publication_search(term)),
+    ]
+
+    engine = create_engine(args.url)
+    with Session(engine) as db:
+        for label, terms, legacy, search, statement in cases:
+            for term in terms:
+                legacy_rows, legacy_median, legacy_p95 = measure(db, legacy, term, args.repeat)
+                rows, median, p95 = measure(db, search, term, args.repeat)
+                print(f"{label} '{term}':")
+                print(f"  ILIKE      {legacy_rows:>6} rows  median {legacy_median:7.2f}ms  p95 {legacy_p95:7.2f}ms")
+                print(
+                    f"  full text  {rows:>6} rows  median {median:7.2f}ms  p95 {p95:7.2f}ms  "
+                    f"index used: {'yes' if uses_index(db, statement(term)) else 'no'}"
+                )
+    engine.dispose()
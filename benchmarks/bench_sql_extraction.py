@@ -0,0 +1,105 @@
+"""
+Benchmark ORM hydration (query(Model).all() + as_dict()) against fetching the columns straight into pandas.
+
+By default a temporary SQLite database is seeded with synthetic rows. Pass --url to point the
+benchmark at a copy of the real MySQL source instead.
+
+Usage: python -m benchmarks.bench_sql_extraction [--rows 100000] [--url mysql+pymysql://...]
+"""
+import argparse
+import os
+import tempfile
+import time
+import pandas as pd
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from etl_engine.core.sql_database import Base
+from etl_engine.models import Faculty, Department, School
+from etl_engine.extractors.sql_extractor import faculty_query, DEPARTMENT_QUERY, SCHOOL_QUERY
+
+POSITIONS = ["Professor", "Associate Professor", "Assistant Professor", "Lecturer", "Visiting Faculty"]
+
+
+def seed(engine, rows: int):
+    """Create the source tables and fill them with synthetic schools, departments and faculty"""
+    Base.metadata.create_all(engine)
+    school_count = max(1, rows // 1000)
+    department_count = max(1, rows // 100)
+
+    with engine.begin() as connection:
+        connection.execute(School.__table__.insert(), [
+            {'school_name': f"School {i}"} for i in range(school_count)
+        ])
+        connection.execute(Department.__table__.insert(), [
+            {'department_name': f"Department {i}", 'school': f"School {i % school_count}", 'number_of_faculty': 100}
+            for i in range(department_count)
+        ])
+        connection.execute(Faculty.__table__.insert(), [
+            {
+                'faculty_id': i,
+                'first_name': f"First{i}",
+                'middle_name': None if i % 3 else f"Middle{i}",
+                'last_name': f"Last{i}",
+                # Every tenth faculty belongs to a school without departments.
+                'department': None if i % 10 == 0 else f"Department {i % department_count}",
+                'school': f"School {i % school_count}",
+                'position': POSITIONS[i % len(POSITIONS)],
+            }
+            for i in range(1, rows + 1)
+        ])
+
+
+def orm_hydration(session_factory, model) -> pd.DataFrame:
+    with session_factory() as db:
+        return pd.DataFrame([instance.as_dict() for instance in db.query(model).all()])
+
+
+def column_fetch(engine, query, chunk_size: int = 50000) -> pd.DataFrame:
+    with engine.connect() as connection:
+        connection = connection.execution_options(stream_results=True)
+        return pd.concat(pd.read_sql(query, connection, chunksize=chunk_size), ignore_index=True)
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def run(engine, repeat: int):
+    session_factory = sessionmaker(bind=engine)
+    tables = [
+        ('faculties', Faculty, faculty_query()),
+        ('departments', Department, DEPARTMENT_QUERY),
+        ('schools', School, SCHOOL_QUERY),
+    ]
+
+    print(f"{'table':<12} {'rows':>8} {'orm':>9} {'columns':>9} {'speedup':>8}")
+    for name, model, query in tables:
+        orm_seconds = min(timed(orm_hydration, session_factory, model)[1] for _ in range(repeat))
+        column_seconds = float('inf')
+        for _ in range(repeat):
+            result, seconds = timed(column_fetch, engine, query)
+            column_seconds = min(column_seconds, seconds)
+
+        print(
+            f"{name:<12} {len(result):>8} {orm_seconds:>8.3f}s {column_seconds:>8.3f}s "
+            f"{orm_seconds / column_seconds:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="Faculty rows to seed the SQLite database with")
+    parser.add_argument("--url", help="Benchmark an existing database instead of a seeded SQLite file")
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs per measurement")
+    args = parser.parse_args()
+
+    if args.url:
+        run(create_engine(args.url), args.repeat)
+    else:
+        with tempfile.TemporaryDirectory() as directory:
+            engine = create_engine(f"sqlite:///{os.path.join(directory, 'bench.db')}")
+            seed(engine, args.rows)
+            run(engine, args.repeat)
+            engine.dispose()
@@ -0,0 +1,76 @@
+"""
+Benchmark the single-process analysis transforms against the partitioned process-pool transforms.
+
+Both paths run on the same synthetic research papers and faculty, and the script checks that
+they produce identical analyses. The speedup depends on the cores available to the pool.
+
+Usage: python -m benchmarks.bench_transform [--sizes 100000 1000000 3000000] [--workers 4]
+"""
+import argparse
+import os
+import time
+import numpy as np
+import pandas as pd
+from etl_engine.transformers import FacultyTransformer, ResearchTransformer, PartitionedTransformer
+
+AREAS = ["Machine Learning", "Computer Vision", "Topology", "Hydrology", "Microbiology", "Finance, Accounting"]
+DEPARTMENTS = ["Computer Science", "Mathematics", "Civil Engineering", "Biotechnology", "Management"]
+SCHOOLS = ["School of Engineering", "School of Science", "School of Management"]
+POSITIONS = ["Professor", "Associate Professor", "Assistant Professor", "Lecturer"]
+
+
+def make_research(rows: int, faculty: int, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'faculty_id': rng.integers(1, faculty + 1, rows).astype(str),
+        'first_name': rng.choice(np.array(["ram", "sita", "hari"], dtype=object), rows),
+        'middle_name': rng.choice(np.array([None, "bahadur"], dtype=object), rows),
+        'last_name': rng.choice(np.array(["sharma", "thapa"], dtype=object), rows),
+        'department': rng.choice(np.array(DEPARTMENTS, dtype=object), rows),
+        'school': rng.choice(np.array(SCHOOLS, dtype=object), rows),
+        'research_area': rng.choice(np.array(AREAS, dtype=object), rows),
+        'published_year': rng.integers(1990, 2025, rows),
+    })
+
+
+def make_faculty(rows: int, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'faculty_id': np.arange(1, rows + 1),
+        'position': rng.choice(np.array(POSITIONS, dtype=object), rows),
+        'department_name': rng.choice(np.array(DEPARTMENTS, dtype=object), rows),
+        'school_name': rng.choice(np.array(SCHOOLS, dtype=object), rows),
+    })
+
+
+def timed(function, df: pd.DataFrame):
+    start = time.perf_counter()
+    result = function(df)
+    return result, time.perf_counter() - start
+
+
+def run(sizes, workers: int):
+    partitioned = PartitionedTransformer(workers, min_rows=0)
+    print(f"{'transform':<10} {'rows':>10} {'single':>9} {f'{workers} workers':>11} {'speedup':>8}")
+    for rows in sizes:
+        cases = [
+            ('research', make_research(rows, max(rows // 30, 1)),
+             ResearchTransformer.transform_research_data, partitioned.transform_research_data),
+            ('faculty', make_faculty(rows), FacultyTransformer.transform_facutly_data, partitioned.transform_facutly_data),
+        ]
+        for label, df, single, pooled in cases:
+            expected, single_seconds = timed(single, df.copy())
+            result, pooled_seconds = timed(pooled, df)
+            assert result == expected, f"partitioned {label} analysis differs from the single-process one"
+            print(
+                f"{label:<10} {rows:>10} {single_seconds:>8.3f}s {pooled_seconds:>10.3f}s "
+                f"{single_seconds / pooled_seconds:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000, 3_000_000])
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Processes of the partitioned transform")
+    args = parser.parse_args()
+    run(args.sizes, max(args.workers, 2))
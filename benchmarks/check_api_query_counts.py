@@ -0,0 +1,149 @@
+"""
+Check that the FastAPI faculty endpoints issue a constant number of SQL statements per request.
+
+The API is pointed at a temporary SQLite database seeded with synthetic faculty, research areas
+and publications. Each endpoint is called with growing page sizes and the statements it sends are
+counted; the script exits non-zero if the count changes with the number of rows returned.
+
+Usage: python -m benchmarks.check_api_query_counts [--faculty 2000]
+"""
+import argparse
+import os
+import re
+import sys
+import tempfile
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+from etl_engine.api.main import app, get_db, supervisor_index
+from etl_engine.loaders.postgres_loader import (
+    PostgresBase, AnalyticsFaculty, ResearchArea, Publication, FacultyPublicationStats,
+    faculty_research_areas, RECENT_PUBLICATION_YEAR
+)
+from etl_engine.utils.query_counter import QueryCounter
+
+PAGE_SIZES = [1, 10, 100, 1000]
+AREA_NAMES = ["Machine Learning", "Computer Vision", "Hydrology", "Public Health", "Linguistics"]
+
+
+def seed(engine, faculty: int):
+    PostgresBase.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(ResearchArea.__table__.insert(), [
+            {'id': i + 1, 'area_name': name} for i, name in enumerate(AREA_NAMES)
+        ])
+        connection.execute(AnalyticsFaculty.__table__.insert(), [
+            {
+                'faculty_id': i,
+                'first_name': f"First{i}",
+                'middle_name': None,
+                'last_name': f"Last{i}",
+                'normalized_name': f"first{i} last{i}",
+                'department_name': "Department of Computer Science and Engineering",
+                'school_name': "School of Engineering",
+                'position': "Professor" if i % 2 else "Assistant Professor",
+            }
+            for i in range(1, faculty + 1)
+        ])
+        connection.execute(faculty_research_areas.insert(), [
+            {'faculty_id': i, 'research_area_id': area_id}
+            for i in range(1, faculty + 1)
+            for area_id in (i % len(AREA_NAMES) + 1, (i + 1) % len(AREA_NAMES) + 1)
+        ])
+        connection.execute(Publication.__table__.insert(), [
+            {
+                'faculty_id': i,
+                'paper_title': f"Paper {i}-{n}",
+                'published_year': 2010 + n,
+                'journal': "Journal",
+                'coauthors': "[]",
+            }
+            for i in range(1, faculty + 1)
+            for n in range(i % 12)
+        ])
+        # The ETL derives these from the publications with PUBLICATION_STATS_SQL, which is PostgreSQL only.
+        connection.execute(FacultyPublicationStats.__table__.insert(), [
+            {
+                'faculty_id': i,
+                'publication_count': i % 12,
+                'recent_publication_count': sum(1 for n in range(i % 12) if 2010 + n >= RECENT_PUBLICATION_YEAR),
+                'publications_by_year': {str(2010 + n): 1 for n in range(i % 12)},
+                'most_recent_year': 2010 + i % 12 - 1,
+                'collaborative_count': 0,
+            }
+            for i in range(1, faculty + 1)
+            if i % 12
+        ])
+
+
+def register_search_functions(dbapi_connection, connection_record):
+    """Stand-ins for the PostgreSQL full text search functions, matching every query word as a prefix"""
+    def ts_match(vector, query):
+        words = re.findall(r"\w+", vector.lower())
+        prefixes = [prefix.lower() for prefix in re.findall(r"(\w+):\*", query)]
+        return all(any(word.startswith(prefix) for word in words) for prefix in prefixes)
+
+    dbapi_connection.create_function("to_tsvector", 2, lambda config, value: value)
+    dbapi_connection.create_function("to_tsquery", 2, lambda config, value: value)
+    dbapi_connection.create_function("ts_match", 2, ts_match)
+    dbapi_connection.create_function("ts_rank", 2, lambda vector, query: 1.0)
+
+
+def count_statements(client: TestClient, engine, url: str) -> int:
+    with QueryCounter(engine) as counter:
+        response = client.get(url)
+    response.raise_for_status()
+    return counter.count
+
+
+def main(faculty: int, path: str) -> bool:
+    seed_engine = create_engine(f"sqlite:///{path}")
+    seed(seed_engine, faculty)
+
+    # Supervisor searches are answered by the in-memory index, which is loaded from the seeded rows.
+    supervisor_index.session_factory = sessionmaker(bind=seed_engine)
+    supervisor_index.generation_reader = lambda: None
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    engine = async_engine.sync_engine
+    event.listen(engine, "connect", register_search_functions)
+    session_factory = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+    async def get_test_db():
+        async with session_factory() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = get_test_db
+
+    endpoints = {
+        '/faculty': [f"/faculty?limit={size}" for size in PAGE_SIZES],
+        '/faculty/{id}': [f"/faculty/{faculty_id}" for faculty_id in (1, faculty // 2, faculty)],
+        '/faculty/search/supervisor': [
+            f"/faculty/search/supervisor?research_area={area}" for area in ("Hydrology", "Learning", "Health")
+        ],
+        '/search/faculty': [f"/search/faculty?q=first&limit={size}" for size in PAGE_SIZES],
+    }
+
+    passed = True
+    with TestClient(app) as client:
+        for endpoint, urls in endpoints.items():
+            counts = [count_statements(client, engine, url) for url in urls]
+            constant = len(set(counts)) == 1
+            passed = passed and constant
+            print(f"{endpoint:<28} statements per request: {counts} {'OK' if constant else 'FAIL'}")
+
+    app.dependency_overrides.clear()
+    seed_engine.dispose()
+    return passed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--faculty", type=int, default=2000, help="Number of synthetic faculty rows to seed")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        passed = main(args.faculty, os.path.join(directory, 'api.db'))
+
+    sys.exit(0 if passed else 1)
@@ -0,0 +1,184 @@
+"""
+Check that an incremental run leaves PostgreSQL exactly as a full run of the same sources does.
+
+The sources are the benchmark suite's stand-ins (SQLite for MySQL, mongomock or --mongo-url for
+MongoDB) seeded from the generator, and the loads go to the suite's etl_benchmark database.
+After a full run the sources are changed: faculty are edited, added and deleted, a faculty
+gets a second research paper document, another loses one of its two documents, and faculty
+with several comma separated research areas change their papers or areas. The tables
+after run_incremental() are compared with those of a full run, the script exits non-zero on
+any difference.
+
+Usage: python -m benchmarks.check_incremental [--mongo-url URL] [--mongo-database etl_benchmark]
+"""
+import argparse
+import contextlib
+import copy
+import io
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime
+from typing import Dict, List
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+
+import dummy_data_generator
+from benchmarks.run_suite import (
+    MONGO_DATABASE, benchmark_postgres_engine, mongo_client_for, seed_mongo_source, seed_sql_source,
+    sqlite_source_engine, use_sources
+)
+from etl_engine.core.config import settings
+
+# Loaded tables without their generated ids, in a stable order.
+TABLE_QUERIES = {
+    'analytics_faculty': "SELECT * FROM analytics_faculty ORDER BY faculty_id",
+    'publicaionts': """
+        SELECT faculty_id, paper_title, published_year, journal, coauthors FROM publicaionts
+        ORDER BY faculty_id, paper_title, published_year, journal, coauthors
+    """,
+    'faculty_research_area': """
+        SELECT fra.faculty_id, ra.area_name FROM faculty_research_area fra
+        JOIN research_areas ra ON ra.id = fra.research_area_id ORDER BY 1, 2
+    """,
+    'research_areas': "SELECT area_name FROM research_areas ORDER BY 1",
+    'faculty_analytics': "SELECT metric_name, metric_value, count FROM faculty_analytics ORDER BY 1, 2",
+    'research_analytics': "SELECT metric_name, metric_value, count FROM research_analytics ORDER BY 1, 2",
+    'faculty_publication_stats': "SELECT * FROM faculty_publication_stats ORDER BY faculty_id",
+}
+
+
+def snapshot(postgres_engine) -> Dict[str, List[tuple]]:
+    with postgres_engine.connect() as connection:
+        return {
+            table: [
+                # JSON columns come back as dicts, compare them as text.
+                tuple(json.dumps(value, sort_keys=True) if isinstance(value, dict) else value for value in row)
+                for row in connection.execute(text(query))
+            ]
+            for table, query in TABLE_QUERIES.items()
+        }
+
+
+def change_sources(sql_engine, collection):
+    """Edit, add and delete faculty and research paper documents"""
+    documents = list(collection.find({}).sort('faculty_id', 1))
+    faculty_ids = sorted({int(document['faculty_id']) for document in documents})
+
+    with sql_engine.begin() as connection:
+        connection.execute(text("UPDATE faculties SET position = 'Professor' WHERE faculty_id IN (:a, :b)"), {
+            'a': faculty_ids[0], 'b': faculty_ids[1]
+        })
+        connection.execute(text("DELETE FROM faculties WHERE faculty_id = :id"), {'id': faculty_ids[-1]})
+    collection.delete_many({'faculty_id': str(faculty_ids[-1])})
+
+    # A faculty that gets a second document.
+    added = copy.deepcopy(documents[10])
+    added.pop('_id')
+    added['papers'] = added['papers'][:1]
+    collection.insert_one(added)
+
+    # A faculty that had two documents loses one of them.
+    collection.delete_one({'_id': documents[20]['_id']})
+
+    for document in documents[30:35]:
+        collection.update_one({'_id': document['_id']}, {'$set': {
+            'papers': document['papers'][:1], UPDATED_AT_FIELD: datetime.now()
+        }})
+
+    # Faculty with several research areas change their papers or areas.
+    for document in documents[40:43]:
+        collection.update_one({'_id': document['_id']}, {'$set': {
+            'papers': document['papers'][:1], UPDATED_AT_FIELD: datetime.now()
+        }})
+    collection.update_one({'_id': documents[46]['_id']}, {'$set': {
+        'research_area': "Finance, Accounting", UPDATED_AT_FIELD: datetime.now()
+    }})
+
+
+def prepare_sources(collection):
+    """Give a faculty a second document and a few faculty several research areas before the first full run"""
+    documents = list(collection.find({}).sort('faculty_id', 1))
+    second = copy.deepcopy(documents[20])
+    second.pop('_id')
+    collection.insert_one(second)
+
+    for document in documents[40:45]:
+        collection.update_one({'_id': document['_id']}, {'$set': {'research_area': "Finance, Accounting"}})
+
+
+def compare(incremental: Dict[str, List[tuple]], full: Dict[str, List[tuple]]) -> List[str]:
+    differences = []
+    for table, rows in full.items():
+        if incremental[table] != rows:
+            missing = set(rows) - set(incremental[table])
+            extra = set(incremental[table]) - set(rows)
+            differences.append(
+                f"{table}: {len(missing)} rows only after the full run, {len(extra)} only after the incremental run"
+                f"{'' if not (missing or extra) else f', e.g. {sorted(missing or extra, key=str)[0]}'}"
+            )
+    return differences
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--faculty-file", default="faculties.json", help="Base faculty list of the generator")
+    parser.add_argument("--mongo-url", help="Seed this MongoDB server instead of mongomock")
+    parser.add_argument(
+        "--mongo-database",
+        default=MONGO_DATABASE,
+        help="MongoDB database the research papers are seeded into, its collection is replaced"
+    )
+    parser.add_argument(
+        "--postgres-url",
+        default=str(make_url(settings.POSTGRES_URL).set(database="etl_benchmark").render_as_string(hide_password=False)),
+        help="PostgreSQL database the runs write to, its tables are replaced"
+    )
+    args = parser.parse_args()
+
+    # The seeding drops research_papers_v2, never do that to the database the ETL reads.
+    if args.mongo_url and args.mongo_database == os.getenv("MONGO_DATABASE"):
+        print(f"Refusing to seed {args.mongo_database}, it is the configured MONGO_DATABASE. Pick another --mongo-database")
+        sys.exit(2)
+    os.environ["MONGO_DATABASE"] = args.mongo_database
+
+    from etl_engine.extractors.mongo_extractor import UPDATED_AT_FIELD
+    from etl_engine.main import main, run_incremental
+
+    with open(args.faculty_file) as f:
+        base_faculty = json.load(f)
+
+    postgres_engine = benchmark_postgres_engine(args.postgres_url)
+    mongo_client = mongo_client_for(args.mongo_url)
+    state_file = settings.ETL_STATE_FILE
+    with tempfile.TemporaryDirectory() as workdir:
+        settings.ETL_STATE_FILE = os.path.join(workdir, "etl_state.json")
+        try:
+            generated = dummy_data_generator.generate_scaled_data(base_faculty, workdir, workers=1)
+            sql_engine = sqlite_source_engine(os.path.join(workdir, "source.db"))
+            seed_sql_source(sql_engine, generated['faculty_path'])
+            seed_mongo_source(mongo_client, args.mongo_database, generated['papers_path'])
+            use_sources(sql_engine, mongo_client, postgres_engine)
+            collection = mongo_client[args.mongo_database].research_papers_v2
+            prepare_sources(collection)
+
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                main()
+                change_sources(sql_engine, collection)
+                run_incremental()
+                incremental = snapshot(postgres_engine)
+                main()
+                full = snapshot(postgres_engine)
+            sql_engine.dispose()
+        finally:
+            settings.ETL_STATE_FILE = state_file
+
+    failures = [line for line in output.getvalue().splitlines() if "failed" in line.lower()]
+    differences = compare(incremental, full)
+    for line in failures + differences:
+        print(line)
+    if failures or differences:
+        sys.exit(1)
+    print(f"Incremental run matches the full run on {', '.join(TABLE_QUERIES)}")
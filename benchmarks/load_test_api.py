@@ -0,0 +1,106 @@
+"""
+Load-test a running API server with concurrent clients and report latency percentiles.
+
+Start the server (python3 -m etl_engine.main api) and point the script at it. Run it once against
+the synchronous-session build and once against the async build to compare p50/p99 under load.
+
+Usage: python -m benchmarks.load_test_api [--url http://localhost:8000] [--clients 50] [--requests 2000]
+"""
+import argparse
+import asyncio
+import itertools
+import statistics
+import time
+from typing import Dict, List
+import httpx
+
+DEFAULT_PATHS = [
+    "/faculty?limit=100",
+    "/faculty/search/supervisor?research_area=learning",
+    "/publications?limit=100",
+    "/analytics/research",
+    "/statistics/summary",
+]
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+async def client_worker(client: httpx.AsyncClient, paths, latencies: List[float], errors: Dict[str, int]):
+    for path in paths:
+        start = time.perf_counter()
+        try:
+            response = await client.get(path)
+            if response.status_code >= 400:
+                errors[str(response.status_code)] = errors.get(str(response.status_code), 0) + 1
+        except httpx.HTTPError as e:
+            errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+        latencies.append(time.perf_counter() - start)
+
+
+async def run(url: str, paths: List[str], clients: int, requests: int, timeout: float) -> Dict[str, float]:
+    # Every client walks the shared request list, so the mix is the same for any client count.
+    request_paths = list(itertools.islice(itertools.cycle(paths), requests))
+    per_client = [request_paths[i::clients] for i in range(clients)]
+
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+
+    async with httpx.AsyncClient(base_url=url, timeout=timeout, limits=limits) as client:
+        # Warm up connections and server-side pools before measuring.
+        await asyncio.gather(*(client.get(path) for path in paths))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(client_worker(client, chunk, latencies, errors) for chunk in per_client))
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': sum(errors.values()),
+        'error_breakdown': errors,
+        'seconds': elapsed,
+        'requests_per_sec': len(latencies) / elapsed if elapsed > 0 else 0.0,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p90_ms': percentile(latencies, 0.90) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'max_ms': latencies[-1] * 1000 if latencies else 0.0,
+        'mean_ms': statistics.fmean(latencies) * 1000 if latencies else 0.0,
+    }
+
+
+def print_report(label: str, clients: int, report: Dict[str, float]):
+    print(
+        f"{label}: {report['requests']} requests from {clients} clients in {report['seconds']:.2f}s "
+        f"({report['requests_per_sec']:.0f} req/s), {report['errors']} errors"
+    )
+    print(
+        f"  p50 {report['p50_ms']:.1f}ms  p90 {report['p90_ms']:.1f}ms  "
+        f"p99 {report['p99_ms']:.1f}ms  max {report['max_ms']:.1f}ms  mean {report['mean_ms']:.1f}ms"
+    )
+    if report['error_breakdown']:
+        print(f"  errors: {report['error_breakdown']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:8000", help="Base URL of the running API")
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 10, 50], help="Concurrent client counts to run")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per run, spread over the clients")
+    parser.add_argument("--path", action="append", dest="paths", help="Request path, repeatable (default: a mixed set)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    args = parser.parse_args()
+
+    for clients in args.clients:
+        try:
+            report = asyncio.run(run(args.url, args.paths or DEFAULT_PATHS, clients, args.requests, args.timeout))
+        except httpx.HTTPError as e:
+            print(f"Load test against {args.url} failed: {e}")
+            break
+        print_report(args.url, clients, report)
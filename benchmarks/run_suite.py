@@ -0,0 +1,372 @@
+"""
+End-to-end ETL benchmark suite with a stored baseline to catch performance regressions.
+
+For every scale the generator (dummy_data_generator.py scale mode) writes synthetic faculty
+and research papers, which are seeded into stand-ins for the sources: a SQLite file for the
+MySQL source and mongomock for MongoDB (or the --mongo-database database of a real server with
+--mongo-url). The loader needs PostgreSQL, by default a separate etl_benchmark database next to
+POSTGRES_URL that is created if missing; the loader and end-to-end benchmarks are skipped when
+it cannot be reached. Watermarks of the end-to-end runs go to a temporary state file.
+
+Each extractor, both transformers and PostgreSQLLoader are run separately, then the whole
+pipeline through etl_engine.main.main(). Throughput is the best of --repeat runs, memory the
+peak RSS seen while the benchmark ran. Results are compared with the baseline file, and the
+script exits non-zero when throughput dropped or memory grew by more than the tolerance.
+
+Usage: python -m benchmarks.run_suite [--scales 1 10] [--papers-factor 2] [--save-baseline]
+"""
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import sys
+import tempfile
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import make_url
+
+import dummy_data_generator
+import etl_engine.core.mongo_database as mongo_database
+import etl_engine.core.sql_database as sql_database
+import etl_engine.extractors.mongo_extractor as mongo_extractor_module
+import etl_engine.loaders.postgres_loader as postgres_loader_module
+from etl_engine.core.config import settings
+from etl_engine.extractors.sql_extractor import SQLExtractor
+from etl_engine.extractors.mongo_extractor import MongoExtractor
+from etl_engine.transformers.faculty_transformer import FacultyTransformer
+from etl_engine.transformers.research_transformer import ResearchTransformer
+from etl_engine.loaders.postgres_loader import PostgreSQLLoader
+from etl_engine.models import Faculty, Department, School
+from etl_engine.utils.profiler import StageProfiler
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+MONGO_DATABASE = "etl_benchmark"
+INSERT_BATCH_SIZE = 10000
+
+
+def read_ndjson(path: str) -> Iterator[Dict[str, Any]]:
+    with open(path) as f:
+        for line in f:
+            yield json.loads(line)
+
+
+def batches(records, size: int = INSERT_BATCH_SIZE) -> Iterator[List[Dict[str, Any]]]:
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def sqlite_source_engine(path: str):
+    """SQLite stand-in of the MySQL source, with the MySQL functions the watermark query needs"""
+    engine = create_engine(f"sqlite:///{path}")
+
+    @event.listens_for(engine, "connect")
+    def register_functions(dbapi_connection, _):
+        dbapi_connection.create_function(
+            "MD5", 1, lambda value: None if value is None else hashlib.md5(value.encode()).hexdigest()
+        )
+        dbapi_connection.create_function(
+            "CONCAT_WS", -1, lambda separator, *values: separator.join(str(v) for v in values if v is not None)
+        )
+
+    return engine
+
+
+def seed_sql_source(engine, faculty_path: str):
+    """Fill the SQLite stand-in of the MySQL source from the generated faculty"""
+    sql_database.Base.metadata.drop_all(engine)
+    sql_database.Base.metadata.create_all(engine)
+
+    def source_value(value):
+        return None if value in (None, "NULL") else value
+
+    schools, departments = set(), {}
+    for faculty in read_ndjson(faculty_path):
+        schools.add(faculty["school"])
+        if source_value(faculty["department"]):
+            departments[faculty["department"]] = faculty["school"]
+
+    with engine.begin() as connection:
+        connection.execute(School.__table__.insert(), [{'school_name': school} for school in sorted(schools)])
+        connection.execute(Department.__table__.insert(), [
+            {'department_name': department, 'school': school, 'number_of_faculty': 0}
+            for department, school in sorted(departments.items())
+        ])
+        for batch in batches(read_ndjson(faculty_path)):
+            connection.execute(Faculty.__table__.insert(), [
+                {
+                    'faculty_id': int(faculty["faculty_id"]),
+                    'first_name': faculty["first_name"],
+                    'middle_name': source_value(faculty["middle_name"]),
+                    'last_name': faculty["last_name"],
+                    'department': source_value(faculty["department"]),
+                    'school': faculty["school"],
+                    'position': faculty["position"],
+                }
+                for faculty in batch
+            ])
+
+
+def seed_mongo_source(client, database: str, papers_path: str):
+    collection = client[database].research_papers_v2
+    collection.drop()
+    for batch in batches(read_ndjson(papers_path)):
+        collection.insert_many(batch)
+
+
+def use_sources(sql_engine, mongo_client, postgres_engine):
+    """Point the extractors and the loader at the benchmark databases"""
+    sql_database.session_local.configure(bind=sql_engine)
+    mongo_database.client = mongo_client
+    mongo_extractor_module.client = mongo_client
+    if postgres_engine is not None:
+        postgres_loader_module.postgres_engine = postgres_engine
+        postgres_loader_module.PostgresSessionLocal.configure(bind=postgres_engine)
+
+
+def benchmark_postgres_engine(url: str):
+    """Engine of the benchmark database, created first if it does not exist yet"""
+    url = make_url(url)
+    admin_engine = create_engine(url.set(database="postgres"), isolation_level="AUTOCOMMIT")
+    try:
+        with admin_engine.connect() as connection:
+            exists = connection.scalar(text("SELECT 1 FROM pg_database WHERE datname = :name"), {'name': url.database})
+            if not exists:
+                connection.execute(text(f'CREATE DATABASE "{url.database}" ENCODING \'UTF8\' TEMPLATE template0'))
+    finally:
+        admin_engine.dispose()
+    return create_engine(url)
+
+
+def mongo_client_for(url: Optional[str]):
+    if url:
+        from pymongo import MongoClient
+        return MongoClient(url, serverselectiontimeoutms=3000)
+
+    import mongomock
+    return mongomock.MongoClient()
+
+
+def measure(
+    profiler: StageProfiler,
+    name: str,
+    benchmark: Callable[[], int],
+    repeat: int
+) -> Dict[str, Any]:
+    """Run benchmark repeat times, it returns the rows it processed. Keep the fastest run"""
+    best = None
+    peak_rss_mb = 0.0
+    for _ in range(repeat):
+        # The code under test prints progress, keep the report readable.
+        with profiler.stage(name) as stage, contextlib.redirect_stdout(io.StringIO()):
+            stage.rows_in = benchmark()
+        entry = stage.as_dict()
+        peak_rss_mb = max(peak_rss_mb, entry['peak_rss_mb'] or 0.0)
+        if best is None or entry['wall_seconds'] < best['wall_seconds']:
+            best = entry
+
+    return {
+        'rows': best['rows_in'],
+        'wall_seconds': best['wall_seconds'],
+        'cpu_seconds': best['cpu_seconds'],
+        'rows_per_sec': best['rows_per_sec'],
+        'peak_rss_mb': peak_rss_mb,
+    }
+
+
+def run_scale(scale: int, args, workdir: str, mongo_client, postgres_engine) -> Dict[str, Dict[str, Any]]:
+    with open(args.faculty_file) as f:
+        base_faculty = json.load(f)
+
+    generated = dummy_data_generator.generate_scaled_data(
+        base_faculty, os.path.join(workdir, f"scale_{scale}"), scale, args.papers_factor, args.seed, args.workers
+    )
+    print(f"Scale {scale}: {generated['faculty']} faculty, {generated['papers']} papers")
+
+    sql_engine = sqlite_source_engine(os.path.join(workdir, f"source_{scale}.db"))
+    seed_sql_source(sql_engine, generated['faculty_path'])
+    seed_mongo_source(mongo_client, args.mongo_database, generated['papers_path'])
+    use_sources(sql_engine, mongo_client, postgres_engine)
+
+    sql_extractor = SQLExtractor()
+    mongo_extractor = MongoExtractor()
+    faculty_transformer = FacultyTransformer()
+    research_transformer = ResearchTransformer()
+
+    # Inputs of the later benchmarks, extracted once up front.
+    raw_faculty_df = sql_extractor.extract_faculty()
+    faculty_df = faculty_transformer.normalize_faculty_names(raw_faculty_df.copy())
+    research_df = mongo_extractor.extract()
+    faculty_analysis = faculty_transformer.transform_facutly_data(faculty_df)
+    research_analysis = research_transformer.transform_research_data(research_df)
+    research_by_faculty, research_edges = research_transformer.get_research_areas_by_faculty(
+        research_df, return_edges=True
+    )
+
+    def extract_sql() -> int:
+        faculty, departments, schools = sql_extractor.extract()
+        return len(faculty) + len(departments) + len(schools)
+
+    def extract_mongo() -> int:
+        return len(mongo_extractor.extract())
+
+    def transform_faculty() -> int:
+        normalized = faculty_transformer.normalize_faculty_names(raw_faculty_df.copy())
+        faculty_transformer.transform_facutly_data(normalized)
+        return len(normalized)
+
+    def transform_research() -> int:
+        research_transformer.transform_research_data(research_df)
+        research_transformer.get_research_areas_by_faculty(research_df, return_edges=True)
+        return len(research_df)
+
+    def load_postgres() -> int:
+        loader = PostgreSQLLoader()
+        loader.create_tables()
+        loader.load_faculty_data(faculty_df, research_by_faculty, research_edges)
+        loader.load_publication_data(research_df)
+        loader.load_analytics_data(faculty_analysis, research_analysis)
+        return len(faculty_df) + len(research_df)
+
+    def end_to_end() -> int:
+        # Imported late so that it sees the patched sources.
+        from etl_engine.main import main
+        pipeline = StageProfiler()
+        main(profiler=pipeline)
+        failed = [stage.name for stage in pipeline.stages if stage.status != "ok"]
+        if failed or not any(stage.name == "finish" for stage in pipeline.stages):
+            raise RuntimeError(f"The ETL run did not finish, failed stages: {', '.join(failed) or 'none'}")
+        return len(faculty_df) + len(research_df)
+
+    benchmarks = [
+        ('extract.sql', extract_sql),
+        ('extract.mongo', extract_mongo),
+        ('transform.faculty', transform_faculty),
+        ('transform.research', transform_research),
+    ]
+    if postgres_engine is not None:
+        benchmarks += [('load.postgres', load_postgres), ('end_to_end', end_to_end)]
+
+    profiler = StageProfiler()
+    results = {name: measure(profiler, name, benchmark, args.repeat) for name, benchmark in benchmarks}
+    sql_engine.dispose()
+    return results
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float, memory_tolerance: float) -> List[str]:
+    """Describe every benchmark that is slower or uses more memory than the baseline allows"""
+    regressions = []
+    for key, result in results.items():
+        expected = baseline.get(key)
+        if expected is None:
+            continue
+        if expected['rows_per_sec'] and result['rows_per_sec'] < expected['rows_per_sec'] * (1 - tolerance):
+            regressions.append(
+                f"{key}: {result['rows_per_sec']:,.0f} rows/s, baseline {expected['rows_per_sec']:,.0f} rows/s"
+            )
+        if expected['peak_rss_mb'] and result['peak_rss_mb'] > expected['peak_rss_mb'] * (1 + memory_tolerance):
+            regressions.append(
+                f"{key}: peak RSS {result['peak_rss_mb']:.0f}MB, baseline {expected['peak_rss_mb']:.0f}MB"
+            )
+    return regressions
+
+
+def print_results(results: Dict[str, Any], baseline: Dict[str, Any]):
+    print(f"{'benchmark':<24} {'rows':>9} {'best s':>8} {'rows/s':>11} {'baseline':>11} {'change':>8} {'peak MB':>8}")
+    for key, result in results.items():
+        expected = baseline.get(key)
+        change = ""
+        if expected and expected['rows_per_sec']:
+            change = f"{(result['rows_per_sec'] / expected['rows_per_sec'] - 1) * 100:+.0f}%"
+        print(
+            f"{key:<24} {result['rows']:>9} {result['wall_seconds']:>8.3f} {result['rows_per_sec']:>11,.0f} "
+            f"{(format(expected['rows_per_sec'], ',.0f') if expected else '-'):>11} {change:>8} {result['peak_rss_mb']:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10], help="Copies of faculties.json to generate")
+    parser.add_argument("--papers-factor", type=int, default=2, help="Multiplier of the papers per faculty")
+    parser.add_argument("--seed", type=int, default=42, help="Generator seed")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Generator worker processes")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark, the fastest counts")
+    parser.add_argument("--faculty-file", default="faculties.json", help="Base faculty list of the generator")
+    parser.add_argument("--mongo-url", help="Seed this MongoDB server instead of mongomock")
+    parser.add_argument(
+        "--mongo-database",
+        default=MONGO_DATABASE,
+        help="MongoDB database the research papers are seeded into, its collection is replaced"
+    )
+    parser.add_argument(
+        "--postgres-url",
+        default=str(make_url(settings.POSTGRES_URL).set(database="etl_benchmark").render_as_string(hide_password=False)),
+        help="PostgreSQL database the loader benchmarks write to, its tables are replaced"
+    )
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline results to compare with")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed throughput drop, as a fraction")
+    parser.add_argument("--memory-tolerance", type=float, default=0.5, help="Allowed peak RSS growth, as a fraction")
+    parser.add_argument("--report", help="Also write the results as JSON here")
+    args = parser.parse_args()
+
+    # The seeding drops research_papers_v2, never do that to the database the ETL reads.
+    if args.mongo_url and args.mongo_database == os.getenv("MONGO_DATABASE"):
+        print(f"Refusing to seed {args.mongo_database}, it is the configured MONGO_DATABASE. Pick another --mongo-database")
+        sys.exit(2)
+    os.environ["MONGO_DATABASE"] = args.mongo_database
+
+    try:
+        postgres_engine = benchmark_postgres_engine(args.postgres_url)
+        with postgres_engine.connect():
+            pass
+    except Exception as e:
+        print(f"PostgreSQL is not reachable, skipping the loader and end-to-end benchmarks: {e}")
+        postgres_engine = None
+
+    results = {}
+    mongo_client = mongo_client_for(args.mongo_url)
+    state_file = settings.ETL_STATE_FILE
+    with tempfile.TemporaryDirectory() as workdir:
+        # The end-to-end runs record the watermarks of the synthetic sources, keep them away from the real ones.
+        settings.ETL_STATE_FILE = os.path.join(workdir, "etl_state.json")
+        try:
+            for scale in args.scales:
+                for name, result in run_scale(scale, args, workdir, mongo_client, postgres_engine).items():
+                    results[f"scale_{scale}:{name}"] = result
+        finally:
+            settings.ETL_STATE_FILE = state_file
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+
+    print_results(results, baseline)
+
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump({'results': results}, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump({
+                'papers_factor': args.papers_factor,
+                'seed': args.seed,
+                'repeat': args.repeat,
+                'results': results,
+            }, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        sys.exit(0)
+
+    regressions = compare(results, baseline, args.tolerance, args.memory_tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    sys.exit(1 if regressions else 0)
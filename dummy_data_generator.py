@@ -1,5 +1,9 @@
+import argparse
 import json
+import multiprocessing
+import os
 import random
+import time
 from faker import Faker
 from datetime import datetime
 
@@ -705,7 +709,7 @@ department_generators = {
 
 # ==================== MAIN GENERATION FUNCTION ====================
 
-def generate_faculty_research_data(faculty_list):
+def generate_faculty_research_data(faculty_list, papers_factor=1):
     output_data = []
     for faculty in faculty_list:
         department = faculty["department"]
@@ -716,8 +720,8 @@ def generate_faculty_research_data(faculty_list):
         area_generator = research_area_generators.get(department, lambda: "Interdisciplinary Studies")
         research_area = area_generator()
 
-        # Determine how many papers to generate (1-3)
-        num_papers = random.choices([1, 2, 3], weights=[0.6, 0.3, 0.1])[0]
+        # Determine how many papers to generate (1-3, times papers_factor in scale mode)
+        num_papers = random.choices([1, 2, 3], weights=[0.6, 0.3, 0.1])[0] * papers_factor
         
         # Get the appropriate paper generator
         generator = department_generators.get(department, lambda area: {
@@ -754,18 +758,174 @@ def generate_faculty_research_data(faculty_list):
         output_data.append(faculty_record)
     return output_data
 
+# ==================== SCALE MODE ====================
+
+# Faculty per unit of work. Shards are seeded by their number, so the output does not depend
+# on how many worker processes share them.
+SHARD_SIZE = 256
+
+# Distinct co-author names and cities each worker draws from.
+NAME_POOL_SIZE = 5000
+
+
+class PooledFaker:
+    """Stand-in for Faker that draws names and cities from pools generated once per process"""
+
+    def __init__(self, seed, size=NAME_POOL_SIZE):
+        faker = Faker()
+        faker.seed_instance(seed)
+        self.names = [faker.name() for _ in range(size)]
+        self.cities = [faker.city() for _ in range(size // 10)]
+
+    def name(self):
+        return random.choice(self.names)
+
+    def city(self):
+        return random.choice(self.cities)
+
+
+_base_faculty = []
+_id_stride = 0
+_scale_seed = 0
+_papers_factor = 1
+
+
+def _init_scale_worker(base_faculty, id_stride, seed, papers_factor):
+    global fake, _base_faculty, _id_stride, _scale_seed, _papers_factor
+    fake = PooledFaker(seed)
+    _base_faculty = base_faculty
+    _id_stride = id_stride
+    _scale_seed = seed
+    _papers_factor = papers_factor
+
+
+def scaled_faculty(index, rng):
+    """
+    Faculty number index of the scaled population.
+
+    Copy 0 is the base faculty list unchanged; later copies get new ids and names drawn
+    from the base list, but keep the department, school and position of the faculty they copy.
+    """
+    copy, base_index = divmod(index, len(_base_faculty))
+    faculty = dict(_base_faculty[base_index])
+    if copy:
+        faculty["faculty_id"] = str(copy * _id_stride + int(faculty["faculty_id"]))
+        faculty["first_name"] = rng.choice(_base_faculty)["first_name"]
+        faculty["middle_name"] = rng.choice(_base_faculty)["middle_name"]
+        faculty["last_name"] = rng.choice(_base_faculty)["last_name"]
+    return faculty
+
+
+def generate_shard(shard, total_faculty):
+    """Return the faculty and research paper NDJSON lines of one shard"""
+    random.seed(f"{_scale_seed}:{shard}")
+    rng = random.Random(f"{_scale_seed}:{shard}:names")
+
+    faculty_list = [
+        scaled_faculty(index, rng)
+        for index in range(shard * SHARD_SIZE, min((shard + 1) * SHARD_SIZE, total_faculty))
+    ]
+    research_data = generate_faculty_research_data(faculty_list, _papers_factor)
+
+    faculty_lines = "".join(json.dumps(faculty) + "\n" for faculty in faculty_list)
+    paper_lines = "".join(json.dumps(record) + "\n" for record in research_data)
+    paper_count = sum(len(record["papers"]) for record in research_data)
+    return faculty_lines, paper_lines, paper_count
+
+
+def _generate_shard(args):
+    return generate_shard(*args)
+
+
+def generate_scaled_data(
+    faculty_data,
+    output_dir,
+    scale=1,
+    papers_factor=1,
+    seed=42,
+    workers=None
+):
+    """
+    Write scale copies of faculty_data and their research papers to output_dir as NDJSON.
+
+    Every faculty gets 1-3 papers times papers_factor. faculties.ndjson holds one faculty
+    per line in the faculties.json format, faculty_research_papers.ndjson one faculty research
+    record per line. The output only depends on the input, scale, papers_factor and seed.
+    """
+    workers = workers or os.cpu_count() or 1
+    total_faculty = len(faculty_data) * scale
+    shard_count = (total_faculty + SHARD_SIZE - 1) // SHARD_SIZE
+    id_stride = max(int(faculty["faculty_id"]) for faculty in faculty_data) + 1
+    init_args = (faculty_data, id_stride, seed, papers_factor)
+    tasks = [(shard, total_faculty) for shard in range(shard_count)]
+
+    os.makedirs(output_dir, exist_ok=True)
+    faculty_path = os.path.join(output_dir, "faculties.ndjson")
+    papers_path = os.path.join(output_dir, "faculty_research_papers.ndjson")
+    paper_count = 0
+
+    with open(faculty_path, "w") as faculty_file, open(papers_path, "w") as papers_file:
+        if workers == 1:
+            _init_scale_worker(*init_args)
+            shards = map(_generate_shard, tasks)
+            pool = None
+        else:
+            pool = multiprocessing.Pool(workers, initializer=_init_scale_worker, initargs=init_args)
+            # Results come back in shard order, so the files are the same for any worker count.
+            shards = pool.imap(_generate_shard, tasks)
+
+        try:
+            for faculty_lines, paper_lines, shard_papers in shards:
+                faculty_file.write(faculty_lines)
+                papers_file.write(paper_lines)
+                paper_count += shard_papers
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+    return {
+        "faculty": total_faculty,
+        "papers": paper_count,
+        "faculty_path": faculty_path,
+        "papers_path": papers_path,
+    }
+
+
 # ==================== SAMPLE USAGE ====================
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate research papers for the faculty in faculties.json")
+    parser.add_argument(
+        "--scale",
+        type=int,
+        help="Scale mode: write this many copies of the faculty and their papers as NDJSON"
+    )
+    parser.add_argument("--papers-factor", type=int, default=1, help="Multiply the 1-3 papers per faculty by this")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed of scale mode")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes of scale mode")
+    parser.add_argument("--output-dir", default="scaled_data", help="Directory of the scale mode NDJSON files")
+    args = parser.parse_args()
+
     # Load your faculty data (replace this with your actual data loading)
     with open('faculties.json') as f:
         faculty_data = json.load(f)
-    
-    # Generate research papers
-    research_data = generate_faculty_research_data(faculty_data)
-    
-    # Save to JSON file
-    with open('faculty_research_papers.json', 'w') as f:
-        json.dump(research_data, f, indent=2)
-    
-    print(f"Generated research papers for {len(research_data)} faculty members")
+
+    if args.scale:
+        start = time.perf_counter()
+        result = generate_scaled_data(
+            faculty_data, args.output_dir, args.scale, args.papers_factor, args.seed, args.workers
+        )
+        print(
+            f"Generated {result['papers']} research papers for {result['faculty']} faculty members "
+            f"in {time.perf_counter() - start:.1f}s ({result['faculty_path']}, {result['papers_path']})"
+        )
+    else:
+        # Generate research papers
+        research_data = generate_faculty_research_data(faculty_data)
+
+        # Save to JSON file
+        with open('faculty_research_papers.json', 'w') as f:
+            json.dump(research_data, f, indent=2)
+
+        print(f"Generated research papers for {len(research_data)} faculty members")
@@ -0,0 +1,21 @@
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from etl_engine.core.config import settings
+from etl_engine.core.pools import create_pooled_engine
+from etl_engine.loaders.postgres_loader import POSTGRES_URL
+
+# Same database the ETL loads into, reached through asyncpg so queries do not block the event loop.
+ASYNC_POSTGRES_URL = make_url(POSTGRES_URL).set(drivername="postgresql+asyncpg")
+
+async_engine = create_pooled_engine(
+    "postgres_async",
+    ASYNC_POSTGRES_URL,
+    pool_size=settings.POSTGRES_POOL_SIZE,
+    max_overflow=settings.POSTGRES_MAX_OVERFLOW,
+    pool_timeout=settings.POSTGRES_POOL_TIMEOUT,
+    pool_recycle=settings.POSTGRES_POOL_RECYCLE,
+    pool_pre_ping=settings.POSTGRES_POOL_PRE_PING,
+    use_async=True
+)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, expire_on_commit=False, autoflush=False)
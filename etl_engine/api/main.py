@@ -1,18 +1,43 @@
-from fastapi import FastAPI, HTTPException, Depends, Query
+import csv
+import io
+import json
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Depends, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
-from typing import List, Dict, Any, Optional
+from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func, select, cast, Integer, Select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from typing import List, Dict, Any, Optional, Literal, AsyncIterator, Callable
 import pandas as pd
 from pydantic import BaseModel
 
 from etl_engine.loaders.postgres_loader import (
-    get_postgres_db, AnalyticsFaculty, ResearchArea, Publication, FacultyAnalytics, ResearchAnalytics
+    AnalyticsFaculty, ResearchArea, Publication, FacultyAnalytics, ResearchAnalytics, FacultyPublicationStats
 )
+from etl_engine.api.database import AsyncSessionLocal, async_engine
+from etl_engine.core.pools import pool_metrics_report
+from etl_engine.utils.pagination import encode_cursor, decode_cursor
+from etl_engine.search.full_text import research_area_search, faculty_by_name, publication_search
+from etl_engine.search.inverted_index import ReloadingSupervisorIndex
+from etl_engine.core.config import settings
+
+# Supervisor searches are answered from memory, the index reloads when the ETL loads new data.
+supervisor_index = ReloadingSupervisorIndex(check_interval=settings.SUPERVISOR_INDEX_CHECK_INTERVAL)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await run_in_threadpool(supervisor_index.warm_up)
+    yield
+    # Close pooled asyncpg connections on shutdown
+    await async_engine.dispose()
 
 app = FastAPI(
     title="KU ETL API",
     description="API for faculty and research data analytics",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -21,6 +46,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Total-Count"],
 )
 
 class FacultyResponse(BaseModel):
@@ -55,13 +81,204 @@ class FacultySupervisorResponse(BaseModel):
     position: str
     research_areas: List[str]
     recent_publications: int
+    relevance: float
+
+class FacultySearchResponse(FacultyResponse):
+    relevance: float
+
+class PublicationSearchResponse(PublicationResponse):
+    relevance: float
+
+class ResearchAreaSearchResponse(BaseModel):
+    area_name: str
+    relevance: float
+
+
+# Rows fetched per round trip from the server-side cursor of the export endpoints.
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_MEDIA_TYPES = {'ndjson': "application/x-ndjson", 'csv': "text/csv"}
 
 
-def get_db():
-    with get_postgres_db() as db:
+async def get_db():
+    async with AsyncSessionLocal() as db:
         yield db
 
 
+def faculty_with_publication_counts(load_research_areas=joinedload) -> Select:
+    """
+    Select faculty together with their total and recent publication counts.
+
+    The counts are read from faculty_publication_stats, which the ETL refreshes on every load,
+    and research areas are joined into the same statement, so the number of statements does
+    not grow with the number of rows. Streaming callers pass selectinload instead, which
+    loads the research areas of every fetched batch with one extra statement.
+    """
+    return (
+        select(
+            AnalyticsFaculty,
+            func.coalesce(FacultyPublicationStats.publication_count, 0).label('publication_count'),
+            func.coalesce(FacultyPublicationStats.recent_publication_count, 0).label('recent_publications'),
+        )
+        .outerjoin(FacultyPublicationStats, FacultyPublicationStats.faculty_id == AnalyticsFaculty.faculty_id)
+        .options(load_research_areas(AnalyticsFaculty.research_areas))
+    )
+
+
+def filter_faculty(query: Select, position: Optional[str], department: Optional[str], school: Optional[str]) -> Select:
+    if position:
+        query = query.where(AnalyticsFaculty.position.ilike(f"%{position}%"))
+    if department:
+        query = query.where(AnalyticsFaculty.department_name.ilike(f"%{department}%"))
+    if school:
+        query = query.where(AnalyticsFaculty.school_name.ilike(f"%{school}%"))
+    return query
+
+
+def filter_publications(query: Select, faculty_id: Optional[int], year_from: Optional[int], year_to: Optional[int]) -> Select:
+    if faculty_id:
+        query = query.where(Publication.faculty_id == faculty_id)
+    if year_from:
+        query = query.where(Publication.published_year >= year_from)
+    if year_to:
+        query = query.where(Publication.published_year <= year_to)
+    return query
+
+
+def faculty_record(faculty: AnalyticsFaculty, publication_count: int) -> Dict[str, Any]:
+    return {
+        'faculty_id': faculty.faculty_id,
+        'first_name': faculty.first_name,
+        'middle_name': faculty.middle_name,
+        'last_name': faculty.last_name,
+        'normalized_name': faculty.normalized_name,
+        'department_name': faculty.department_name,
+        'school_name': faculty.school_name,
+        'position': faculty.position,
+        'research_areas': [area.area_name for area in faculty.research_areas],
+        'publication_count': publication_count,
+    }
+
+
+def publication_record(pub: Publication) -> Dict[str, Any]:
+    return {
+        'id': pub.id,
+        'faculty_id': pub.faculty_id,
+        'paper_title': pub.paper_title,
+        'published_year': pub.published_year,
+        'journal': pub.journal,
+        'coauthors': pub.coauthors,
+    }
+
+
+def faculty_response(faculty: AnalyticsFaculty, publication_count: int) -> FacultyResponse:
+    return FacultyResponse(**faculty_record(faculty, publication_count))
+
+
+async def stream_export(
+    query: Select,
+    to_record: Callable[[Any], Dict[str, Any]],
+    columns: List[str],
+    export_format: str
+) -> AsyncIterator[str]:
+    """
+    Serialize the rows of query batch by batch from a server-side cursor.
+
+    The generator opens its own session because it keeps running after the endpoint returned.
+    """
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+
+        if export_format == 'csv':
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=columns)
+            writer.writeheader()
+            yield buffer.getvalue()
+
+        async for partition in result.partitions():
+            records = [to_record(row) for row in partition]
+
+            if export_format == 'csv':
+                buffer = io.StringIO()
+                writer = csv.DictWriter(buffer, fieldnames=columns)
+                for record in records:
+                    if 'research_areas' in record:
+                        record['research_areas'] = "; ".join(record['research_areas'])
+                    writer.writerow(record)
+                yield buffer.getvalue()
+            else:
+                yield "".join(json.dumps(record) + "\n" for record in records)
+
+
+def export_response(body: AsyncIterator[str], name: str, export_format: str) -> StreamingResponse:
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{export_format}"'}
+    )
+
+
+def cursor_position(key: str, cursor: Optional[str], skip: int) -> Optional[int]:
+    """Decode the cursor of a keyset page, rejecting requests that also ask for an offset"""
+    if cursor is None:
+        return None
+    if skip:
+        raise HTTPException(status_code=400, detail="Use either skip or cursor, not both")
+    try:
+        return decode_cursor(key, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def set_page_headers(response: Response, key: str, last_values: List[int], limit: int, total: Optional[int]):
+    """Point to the next page when this one is full, and report the total when it was asked for"""
+    if len(last_values) == limit:
+        response.headers["X-Next-Cursor"] = encode_cursor(key, last_values[-1])
+    if total is not None:
+        response.headers["X-Total-Count"] = str(total)
+
+
+async def faculty_total(db: AsyncSession, query: Select, position: Optional[str], department: Optional[str], school: Optional[str]) -> int:
+    """
+    Number of faculty matching the filters.
+
+    With at most one filter the count is summed from faculty_analytics, whose values are the
+    lowercased column values, so it matches the ILIKE filter without scanning analytics_faculty.
+    """
+    filters = [(name, value) for name, value in (('position', position), ('department', department), ('school', school)) if value]
+    if len(filters) > 1:
+        return await db.scalar(select(func.count()).select_from(query.subquery()))
+
+    # Every faculty belongs to exactly one school.
+    metric_name, value = filters[0] if filters else ('school', None)
+    total_query = select(func.coalesce(func.sum(FacultyAnalytics.count), 0)).where(FacultyAnalytics.metric_name == metric_name)
+    if value:
+        total_query = total_query.where(FacultyAnalytics.metric_value.ilike(f"%{value}%"))
+    return await db.scalar(total_query)
+
+
+async def publication_total(db: AsyncSession, query: Select, faculty_id: Optional[int], year_from: Optional[int], year_to: Optional[int]) -> int:
+    """Number of publications matching the filters, read from the analytics tables where they can answer it"""
+    if faculty_id and not (year_from or year_to):
+        count = await db.scalar(
+            select(FacultyPublicationStats.publication_count).where(FacultyPublicationStats.faculty_id == faculty_id)
+        )
+        return count or 0
+
+    if faculty_id:
+        return await db.scalar(select(func.count()).select_from(query.subquery()))
+
+    year = cast(ResearchAnalytics.metric_value, Integer)
+    total_query = select(func.coalesce(func.sum(ResearchAnalytics.count), 0)).where(
+        ResearchAnalytics.metric_name == 'publication_year'
+    )
+    if year_from:
+        total_query = total_query.where(year >= year_from)
+    if year_to:
+        total_query = total_query.where(year <= year_to)
+    return await db.scalar(total_query)
+
+
 # API's
 @app.get("/")
 async def root():
@@ -69,151 +286,202 @@ async def root():
 
 @app.get("/faculty", response_model=List[FacultyResponse])
 async def get_all_faculty(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor header of the previous page"),
+    include_total: bool = Query(False, description="Return the number of matching faculty in X-Total-Count"),
     position: Optional[str] = None,
     department: Optional[str] = None,
     school: Optional[str] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """Get all faculty with optional filters"""
-    query = db.query(AnalyticsFaculty)
+    """Get all faculty with optional filters, paged by offset or by cursor"""
+    after_id = cursor_position('faculty_id', cursor, skip)
+    query = filter_faculty(faculty_with_publication_counts(), position, department, school)
     
-    if position:
-        query = query.filter(AnalyticsFaculty.position.ilike(f"%{position}%"))
-    if department:
-        query = query.filter(AnalyticsFaculty.department_name.ilike(f"%{department}%"))
-    if school:
-        query = query.filter(AnalyticsFaculty.school_name.ilike(f"%{school}%"))
+    total = await faculty_total(db, query, position, department, school) if include_total else None
     
-    faculties = query.offset(skip).limit(limit).all()
+    if after_id is not None:
+        query = query.where(AnalyticsFaculty.faculty_id > after_id)
+    else:
+        query = query.offset(skip)
     
-    result = []
-    for faculty in faculties:
-        publication_count = db.query(Publication).filter(Publication.faculty_id == faculty.faculty_id).count()
-        result.append(FacultyResponse(
-            faculty_id=faculty.faculty_id,
-            first_name=faculty.first_name,
-            middle_name=faculty.middle_name,
-            last_name=faculty.last_name,
-            normalized_name=faculty.normalized_name,
-            department_name=faculty.department_name,
-            school_name=faculty.school_name,
-            position=faculty.position,
-            research_areas=[area.area_name for area in faculty.research_areas],
-            publication_count=publication_count
-        ))
+    result = await db.execute(query.order_by(AnalyticsFaculty.faculty_id).limit(limit))
+    rows = result.unique().all()
     
-    return result
+    set_page_headers(response, 'faculty_id', [faculty.faculty_id for faculty, _, _ in rows], limit, total)
+    
+    return [
+        faculty_response(faculty, publication_count)
+        for faculty, publication_count, _ in rows
+    ]
 
 @app.get("/faculty/{faculty_id}", response_model=FacultyResponse)
-async def get_faculty_by_id(faculty_id: int, db: Session = Depends(get_db)):
+async def get_faculty_by_id(faculty_id: int, db: AsyncSession = Depends(get_db)):
     """Get specific faculty by ID"""
-    faculty = db.query(AnalyticsFaculty).filter(AnalyticsFaculty.faculty_id == faculty_id).first()
+    result = await db.execute(faculty_with_publication_counts().where(AnalyticsFaculty.faculty_id == faculty_id))
+    row = result.unique().first()
     
-    if not faculty:
+    if not row:
         raise HTTPException(status_code=404, detail="Faculty not found")
     
-    publication_count = db.query(Publication).filter(Publication.faculty_id == faculty_id).count()
-    
-    return FacultyResponse(
-        faculty_id=faculty.faculty_id,
-        first_name=faculty.first_name,
-        middle_name=faculty.middle_name,
-        last_name=faculty.last_name,
-        normalized_name=faculty.normalized_name,
-        department_name=faculty.department_name,
-        school_name=faculty.school_name,
-        position=faculty.position,
-        research_areas=[area.area_name for area in faculty.research_areas],
-        publication_count=publication_count
-    )
+    faculty, publication_count, _ = row
+    return faculty_response(faculty, publication_count)
 
 @app.get("/faculty/search/supervisor", response_model=List[FacultySupervisorResponse])
-async def find_supervisors(
+def find_supervisors(
     research_area: str = Query(..., description="Research area to search for"),
     position_filter: Optional[str] = Query(None, description="Filter by position (professor, associate professor, etc.)"),
-    min_publications: int = Query(0, description="Minimum number of publications"),
-    db: Session = Depends(get_db)
+    min_publications: int = Query(0, description="Minimum number of publications")
 ):
-    """Find potential supervisors by research area"""
-    # Find research area
-    area = db.query(ResearchArea).filter(ResearchArea.area_name.ilike(f"%{research_area}%")).first()
-    
-    if not area:
+    """Find potential supervisors by research area, ranked by how well their areas match"""
+    index = supervisor_index.get()
+    if not index.matching_areas(research_area):
         raise HTTPException(status_code=404, detail="Research area not found")
     
-    # Get faculties in this research area
-    query = db.query(AnalyticsFaculty).filter(AnalyticsFaculty.research_areas.contains(area))
-    
-    if position_filter:
-        query = query.filter(AnalyticsFaculty.position.ilike(f"%{position_filter}%"))
-    
-    faculties = query.all()
-    
-    result = []
-    for faculty in faculties:
-        # Count recent publications (last 5 years)
-        recent_pub_count = db.query(Publication).filter(
-            Publication.faculty_id == faculty.faculty_id,
-            Publication.published_year >= 2019
-        ).count()
-        
-        total_pub_count = db.query(Publication).filter(Publication.faculty_id == faculty.faculty_id).count()
-        
-        if total_pub_count >= min_publications:
-            result.append(FacultySupervisorResponse(
-                faculty_id=faculty.faculty_id,
-                name=f"{faculty.first_name} {faculty.middle_name or ''} {faculty.last_name}".strip(),
-                department=faculty.department_name,
-                school=faculty.school_name,
-                position=faculty.position,
-                research_areas=[area.area_name for area in faculty.research_areas],
-                recent_publications=recent_pub_count
-            ))
+    # Best matches first, then by recent publications count
+    matches = index.search(research_area, position=position_filter, min_publications=min_publications)
     
-    # Sort by recent publications count
-    result.sort(key=lambda x: x.recent_publications, reverse=True)
-    
-    return result
+    return [
+        FacultySupervisorResponse(
+            faculty_id=faculty.faculty_id,
+            name=f"{faculty.first_name} {faculty.middle_name or ''} {faculty.last_name}".strip(),
+            department=faculty.department_name,
+            school=faculty.school_name,
+            position=faculty.position,
+            research_areas=list(faculty.research_areas),
+            recent_publications=faculty.recent_publication_count,
+            relevance=round(relevance, 4)
+        )
+        for faculty, relevance in matches
+    ]
+
+@app.get("/search/faculty", response_model=List[FacultySearchResponse])
+async def search_faculty(
+    q: str = Query(..., description="Name or name prefixes to search for"),
+    limit: int = Query(20, ge=1, le=1000),
+    db: AsyncSession = Depends(get_db)
+):
+    """Search faculty by name, best matches first"""
+    matches = faculty_by_name(q)
+    if matches is None:
+        return []
+
+    result = await db.execute(
+        faculty_with_publication_counts()
+        .join(matches, matches.c.faculty_id == AnalyticsFaculty.faculty_id)
+        .add_columns(matches.c.relevance)
+        .order_by(matches.c.relevance.desc(), AnalyticsFaculty.faculty_id)
+        .limit(limit)
+    )
+
+    return [
+        FacultySearchResponse(**faculty_record(faculty, publication_count), relevance=round(relevance, 4))
+        for faculty, publication_count, _, relevance in result.unique().all()
+    ]
+
+@app.get("/search/research-areas", response_model=List[ResearchAreaSearchResponse])
+async def search_research_areas(
+    q: str = Query(..., description="Research area words or word prefixes to search for"),
+    limit: int = Query(20, ge=1, le=1000),
+    db: AsyncSession = Depends(get_db)
+):
+    """Search research areas, best matches first"""
+    query = research_area_search(q)
+    if query is None:
+        return []
+
+    result = await db.execute(query.limit(limit))
+    return [
+        ResearchAreaSearchResponse(area_name=area_name, relevance=round(relevance, 4))
+        for _, area_name, relevance in result.all()
+    ]
+
+@app.get("/search/publications", response_model=List[PublicationSearchResponse])
+async def search_publications(
+    q: str = Query(..., description="Title words or word prefixes to search for"),
+    limit: int = Query(20, ge=1, le=1000),
+    db: AsyncSession = Depends(get_db)
+):
+    """Search publications by title, best matches first"""
+    query = publication_search(q)
+    if query is None:
+        return []
+
+    result = await db.execute(query.limit(limit))
+    return [
+        PublicationSearchResponse(**publication_record(pub), relevance=round(relevance, 4))
+        for pub, relevance in result.all()
+    ]
 
 @app.get("/publications", response_model=List[PublicationResponse])
 async def get_publications(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor header of the previous page"),
+    include_total: bool = Query(False, description="Return the number of matching publications in X-Total-Count"),
     faculty_id: Optional[int] = None,
     year_from: Optional[int] = None,
     year_to: Optional[int] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """Get publications with optional filters"""
-    query = db.query(Publication)
+    """Get publications with optional filters, paged by offset or by cursor"""
+    after_id = cursor_position('publication_id', cursor, skip)
+    query = filter_publications(select(Publication), faculty_id, year_from, year_to)
     
-    if faculty_id:
-        query = query.filter(Publication.faculty_id == faculty_id)
-    if year_from:
-        query = query.filter(Publication.published_year >= year_from)
-    if year_to:
-        query = query.filter(Publication.published_year <= year_to)
+    total = await publication_total(db, query, faculty_id, year_from, year_to) if include_total else None
     
-    publications = query.offset(skip).limit(limit).all()
+    if after_id is not None:
+        query = query.where(Publication.id > after_id)
+    else:
+        query = query.offset(skip)
     
-    return [
-        PublicationResponse(
-            id=pub.id,
-            faculty_id=pub.faculty_id,
-            paper_title=pub.paper_title,
-            published_year=pub.published_year,
-            journal=pub.journal,
-            coauthors=pub.coauthors
-        )
-        for pub in publications
-    ]
+    publications = (await db.execute(query.order_by(Publication.id).limit(limit))).scalars().all()
+    
+    set_page_headers(response, 'publication_id', [pub.id for pub in publications], limit, total)
+    
+    return [PublicationResponse(**publication_record(pub)) for pub in publications]
+
+@app.get("/export/faculty")
+async def export_faculty(
+    format: Literal['ndjson', 'csv'] = Query('ndjson', description="ndjson (one JSON object per line) or csv"),
+    position: Optional[str] = None,
+    department: Optional[str] = None,
+    school: Optional[str] = None
+):
+    """Stream every faculty matching the filters, with constant memory on the server"""
+    query = filter_faculty(faculty_with_publication_counts(selectinload), position, department, school)
+    body = stream_export(
+        query.order_by(AnalyticsFaculty.faculty_id),
+        lambda row: faculty_record(row[0], row[1]),
+        list(FacultyResponse.model_fields),
+        format
+    )
+    return export_response(body, "faculty", format)
+
+@app.get("/export/publications")
+async def export_publications(
+    format: Literal['ndjson', 'csv'] = Query('ndjson', description="ndjson (one JSON object per line) or csv"),
+    faculty_id: Optional[int] = None,
+    year_from: Optional[int] = None,
+    year_to: Optional[int] = None
+):
+    """Stream every publication matching the filters, with constant memory on the server"""
+    query = filter_publications(select(Publication), faculty_id, year_from, year_to)
+    body = stream_export(
+        query.order_by(Publication.id),
+        lambda row: publication_record(row[0]),
+        list(PublicationResponse.model_fields),
+        format
+    )
+    return export_response(body, "publications", format)
 
 @app.get("/analytics/faculty", response_model=List[AnalyticsResponse])
-async def get_faculty_analytics(db: Session = Depends(get_db)):
+async def get_faculty_analytics(db: AsyncSession = Depends(get_db)):
     """Get faculty analytics (positions, departments, schools)"""
-    analytics = db.query(FacultyAnalytics).all()
+    analytics = (await db.execute(select(FacultyAnalytics))).scalars().all()
     
     # Group by metric_name
     grouped = {}
@@ -228,9 +496,9 @@ async def get_faculty_analytics(db: Session = Depends(get_db)):
     ]
 
 @app.get("/analytics/research", response_model=List[AnalyticsResponse])
-async def get_research_analytics(db: Session = Depends(get_db)):
+async def get_research_analytics(db: AsyncSession = Depends(get_db)):
     """Get research analytics (years, areas)"""
-    analytics = db.query(ResearchAnalytics).all()
+    analytics = (await db.execute(select(ResearchAnalytics))).scalars().all()
     
     # Group by metric_name
     grouped = {}
@@ -245,21 +513,23 @@ async def get_research_analytics(db: Session = Depends(get_db)):
     ]
 
 @app.get("/research-areas", response_model=List[str])
-async def get_research_areas(db: Session = Depends(get_db)):
+async def get_research_areas(db: AsyncSession = Depends(get_db)):
     """Get all available research areas"""
-    areas = db.query(ResearchArea).all()
+    areas = (await db.execute(select(ResearchArea))).scalars().all()
     return [area.area_name for area in areas]
 
 @app.get("/statistics/summary")
-async def get_summary_statistics(db: Session = Depends(get_db)):
+async def get_summary_statistics(db: AsyncSession = Depends(get_db)):
     """Get overall summary statistics"""
-    total_faculty = db.query(AnalyticsFaculty).count()
-    total_publications = db.query(Publication).count()
-    total_research_areas = db.query(ResearchArea).count()
+    total_faculty = await db.scalar(select(func.count()).select_from(AnalyticsFaculty))
+    total_publications = await db.scalar(select(func.count()).select_from(Publication))
+    total_research_areas = await db.scalar(select(func.count()).select_from(ResearchArea))
     
     # Get position breakdown
     position_stats = {}
-    positions = db.query(FacultyAnalytics).filter(FacultyAnalytics.metric_name == 'position').all()
+    positions = (await db.execute(
+        select(FacultyAnalytics).where(FacultyAnalytics.metric_name == 'position')
+    )).scalars().all()
     for pos in positions:
         position_stats[pos.metric_value] = pos.count
     
@@ -270,6 +540,16 @@ async def get_summary_statistics(db: Session = Depends(get_db)):
         "position_breakdown": position_stats
     }
 
+@app.get("/metrics/pools")
+async def get_pool_metrics():
+    """Get connection pool configuration, checkouts, wait times and exhaustion events per engine"""
+    return pool_metrics_report()
+
+@app.get("/metrics/supervisor-index")
+def get_supervisor_index_stats():
+    """Get size, data generation and reload counters of the in-memory supervisor index"""
+    return supervisor_index.stats()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -3,13 +3,16 @@ from contextlib import contextmanager
 from dotenv import load_dotenv
 import os
 from .config import settings
+from .pools import MongoPoolListener
 
 load_dotenv()
 
 client = MongoClient(
     settings.MONGO_URL,
     serverselectiontimeoutms=3000,
-    connecttimeoutms=3000
+    connecttimeoutms=3000,
+    maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+    event_listeners=[MongoPoolListener("mongo", settings.MONGO_MAX_POOL_SIZE)]
 )
 
 
@@ -0,0 +1,208 @@
+import threading
+import time
+from typing import Any, Dict
+from pymongo import monitoring
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+
+class PoolMetrics:
+    """Checkout counters, wait times and exhaustion events of one connection pool"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checked_out = 0
+            self.peak_checked_out = 0
+            self.checkouts = 0
+            self.connections_created = 0
+            self.wait_seconds_total = 0.0
+            self.wait_seconds_max = 0.0
+            self.exhausted_checkouts = 0
+            self.timeouts = 0
+
+    def record_wait(self, seconds: float):
+        """Record how long one checkout took"""
+        with self._lock:
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def record_exhausted(self):
+        """Record a checkout that found no connection to hand out and had to wait for a checkin"""
+        with self._lock:
+            self.exhausted_checkouts += 1
+
+    def record_checkout(self):
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+
+    def record_checkin(self):
+        with self._lock:
+            self.checked_out = max(0, self.checked_out - 1)
+
+    def record_connect(self):
+        with self._lock:
+            self.connections_created += 1
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'checked_out': self.checked_out,
+                'peak_checked_out': self.peak_checked_out,
+                'checkouts': self.checkouts,
+                'connections_created': self.connections_created,
+                'wait_ms_total': round(self.wait_seconds_total * 1000, 3),
+                'wait_ms_avg': round(self.wait_seconds_total * 1000 / self.checkouts, 3) if self.checkouts else 0.0,
+                'wait_ms_max': round(self.wait_seconds_max * 1000, 3),
+                'exhausted_checkouts': self.exhausted_checkouts,
+                'timeouts': self.timeouts,
+            }
+
+
+_pool_metrics: Dict[str, PoolMetrics] = {}
+_pool_metrics_lock = threading.Lock()
+# Static configuration of each pool, reported next to its metrics.
+_pool_config: Dict[str, Dict[str, Any]] = {}
+
+
+def pool_metrics(name: str) -> PoolMetrics:
+    with _pool_metrics_lock:
+        if name not in _pool_metrics:
+            _pool_metrics[name] = PoolMetrics(name)
+        return _pool_metrics[name]
+
+
+def pool_metrics_report() -> Dict[str, Dict[str, Any]]:
+    """Configuration and current metrics of every instrumented pool, keyed by pool name"""
+    with _pool_metrics_lock:
+        names = sorted(_pool_metrics)
+    return {
+        name: {'config': _pool_config.get(name, {}), **pool_metrics(name).snapshot()}
+        for name in names
+    }
+
+
+class _InstrumentedPoolMixin:
+    """Time every checkout and count the ones that found the pool exhausted"""
+
+    def _do_get(self):
+        metrics = pool_metrics(self._orig_logging_name)
+        # No idle connection and no overflow left: this checkout has to wait for a checkin.
+        if self._pool.empty() and -1 < self._max_overflow <= self._overflow:
+            metrics.record_exhausted()
+
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            metrics.record_timeout()
+            raise
+        finally:
+            metrics.record_wait(time.perf_counter() - start)
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def create_pooled_engine(
+    name: str,
+    url,
+    pool_size: int,
+    max_overflow: int,
+    pool_timeout: float,
+    pool_recycle: int,
+    pool_pre_ping: bool,
+    use_async: bool = False,
+    **kwargs
+):
+    """Create a SQLAlchemy engine whose pool reports to pool_metrics(name)"""
+    _pool_config[name] = {
+        'pool_size': pool_size,
+        'max_overflow': max_overflow,
+        'pool_timeout': pool_timeout,
+        'pool_recycle': pool_recycle,
+        'pool_pre_ping': pool_pre_ping,
+    }
+    engine_factory = create_async_engine if use_async else create_engine
+    engine = engine_factory(
+        url,
+        poolclass=InstrumentedAsyncQueuePool if use_async else InstrumentedQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=pool_pre_ping,
+        # The pool looks its metrics up by this name, it survives engine.dispose().
+        pool_logging_name=name,
+        **kwargs
+    )
+
+    metrics = pool_metrics(name)
+    sync_engine: Engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    event.listen(sync_engine, "checkout", lambda *args: metrics.record_checkout())
+    event.listen(sync_engine, "checkin", lambda *args: metrics.record_checkin())
+    event.listen(sync_engine, "connect", lambda *args: metrics.record_connect())
+
+    return engine
+
+
+class MongoPoolListener(monitoring.ConnectionPoolListener):
+    """Feed pymongo connection pool events into pool_metrics(name)"""
+
+    def __init__(self, name: str, max_pool_size: int):
+        self.metrics = pool_metrics(name)
+        self.max_pool_size = max_pool_size
+        _pool_config[name] = {'max_pool_size': max_pool_size}
+
+    def connection_check_out_started(self, event):
+        if self.max_pool_size and self.metrics.checked_out >= self.max_pool_size:
+            self.metrics.record_exhausted()
+
+    def connection_checked_out(self, event):
+        self.metrics.record_checkout()
+        self.metrics.record_wait(event.duration)
+
+    def connection_check_out_failed(self, event):
+        if event.reason == monitoring.ConnectionCheckOutFailedReason.TIMEOUT:
+            self.metrics.record_timeout()
+
+    def connection_checked_in(self, event):
+        self.metrics.record_checkin()
+
+    def connection_created(self, event):
+        self.metrics.record_connect()
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        pass
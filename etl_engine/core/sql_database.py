@@ -1,10 +1,18 @@
-from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from contextlib import contextmanager
 from .config import settings
+from .pools import create_pooled_engine
 
-sql_engine = create_engine(settings.SQL_URL)
+sql_engine = create_pooled_engine(
+    "mysql",
+    settings.SQL_URL,
+    pool_size=settings.SQL_POOL_SIZE,
+    max_overflow=settings.SQL_MAX_OVERFLOW,
+    pool_timeout=settings.SQL_POOL_TIMEOUT,
+    pool_recycle=settings.SQL_POOL_RECYCLE,
+    pool_pre_ping=settings.SQL_POOL_PRE_PING
+)
 session_local = sessionmaker(autocommit=False, autoflush=False, bind=sql_engine)
 Base = declarative_base()
 
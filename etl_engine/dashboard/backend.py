@@ -3,17 +3,67 @@ from flask_cors import CORS
 import pandas as pd
 from typing import Dict, Any, List
 import json
+from sqlalchemy import func, select, false
+from sqlalchemy.orm import joinedload
 
 from etl_engine.loaders.postgres_loader import (
     get_postgres_db, AnalyticsFaculty, ResearchArea, Publication, 
-    FacultyAnalytics, ResearchAnalytics
+    FacultyAnalytics, ResearchAnalytics, FacultyPublicationStats
 )
+from etl_engine.dashboard.cache import ResponseCache
+from etl_engine.core.pools import pool_metrics_report
+from etl_engine.utils.pagination import encode_cursor, decode_cursor
+from etl_engine.core.config import settings
+from etl_engine.search.full_text import faculty_by_name
+from etl_engine.search.inverted_index import ReloadingSupervisorIndex
 
 app = Flask(__name__)
 CORS(app)
 
+# Responses only change when the ETL loads new data, which bumps the data generation.
+response_cache = ResponseCache(
+    max_size=settings.DASHBOARD_CACHE_SIZE,
+    ttl=settings.DASHBOARD_CACHE_TTL,
+    generation_check_interval=settings.DASHBOARD_GENERATION_CHECK_INTERVAL
+)
+# Supervisor searches are answered from memory, the index reloads when the ETL loads new data.
+supervisor_index = ReloadingSupervisorIndex(check_interval=settings.SUPERVISOR_INDEX_CHECK_INTERVAL)
+
 class DashboardService:
     @staticmethod
+    @response_cache.cached
+    def get_overview():
+        """Get dashboard overview counts"""
+        allowed_positions = [
+            'Professor',
+            'Associate Professor',
+            'Assistant Professor',
+            'Lecturer',
+            'Visiting Faculty'
+        ]
+
+        with get_postgres_db() as db:
+            total_faculty = db.query(AnalyticsFaculty).filter(
+                    AnalyticsFaculty.position.in_(allowed_positions)
+                ).count()
+
+            total_publications = db.query(Publication).count()
+            total_research_areas = db.query(ResearchArea).count()
+
+            # Get unique departments among filtered positions
+            unique_departments = db.query(AnalyticsFaculty.department_name).filter(
+                    AnalyticsFaculty.position.in_(allowed_positions)
+                ).distinct().count()
+
+        return {
+            'total_faculty': total_faculty,
+            'total_publications': total_publications,
+            'total_research_areas': total_research_areas,
+            'total_departments': unique_departments
+        }
+
+    @staticmethod
+    @response_cache.cached
     def get_faculty_position_stats():
         """Get filtered faculty statistics by position for dashboard"""
         with get_postgres_db() as db:
@@ -42,6 +92,7 @@ class DashboardService:
             return position_data
 
     @staticmethod
+    @response_cache.cached
     def get_publications_by_year():
         """Get publications trend by year"""
         with get_postgres_db() as db:
@@ -58,6 +109,7 @@ class DashboardService:
             ]
     
     @staticmethod
+    @response_cache.cached
     def get_research_areas_distribution():
         """Get all research areas"""
         with get_postgres_db() as db:
@@ -84,6 +136,7 @@ class DashboardService:
             return research_data
     
     @staticmethod
+    @response_cache.cached
     def get_department_faculty_count():
         """Get faculty count by department (restricted to allowed positions)"""
         with get_postgres_db() as db:
@@ -100,6 +153,7 @@ class DashboardService:
             ]
  
     @staticmethod
+    @response_cache.cached
     def get_recent_publications(limit=10):
         """Get recent publications"""
         with get_postgres_db() as db:
@@ -120,6 +174,7 @@ class DashboardService:
             return result
     
     @staticmethod
+    @response_cache.cached
     def get_top_productive_faculty(limit=10):
         """Get faculty with most publications"""
         with get_postgres_db() as db:
@@ -131,23 +186,20 @@ class DashboardService:
                 'Visiting Faculty'
             ]
 
-            # Get publication counts per faculty
+            # Publication counts per faculty are precomputed by the ETL
             faculty_pub_counts = db.query(
                 AnalyticsFaculty.faculty_id,
                 AnalyticsFaculty.first_name,
                 AnalyticsFaculty.last_name,
                 AnalyticsFaculty.department_name,
                 AnalyticsFaculty.position,
-                db.func.count(Publication.id).label('pub_count')
+                FacultyPublicationStats.publication_count.label('pub_count')
             ).join(
-                Publication, AnalyticsFaculty.faculty_id == Publication.faculty_id
+                FacultyPublicationStats, AnalyticsFaculty.faculty_id == FacultyPublicationStats.faculty_id
             ).filter(
-                AnalyticsFaculty.position.in_(allowed_positions),
                 AnalyticsFaculty.position.in_(allowed_positions)
-            ).group_by(
-                AnalyticsFaculty.faculty_id
             ).order_by(
-                db.func.count(Publication.id).desc()
+                FacultyPublicationStats.publication_count.desc()
             ).limit(limit).all()
             
             result = []
@@ -162,52 +214,40 @@ class DashboardService:
             return result
     
     @staticmethod
+    @response_cache.cached
     def search_faculty_by_research_area(research_area: str):
-        """Search faculty by research area"""
-        with get_postgres_db() as db:
-            # Find research area
-            area = db.query(ResearchArea).filter(
-                ResearchArea.area_name.ilike(f"%{research_area}%")
-            ).first()
-            
-            if not area:
-                return []
+        """Search faculty by research area, best matching areas first"""
+        allowed_positions = [
+            'Professor',
+            'Associate Professor',
+            'Assistant Professor',
+            'Lecturer',
+            'Visiting Faculty'
+        ]
 
-            allowed_positions = [
-                'Professor',
-                'Associate Professor',
-                'Assistant Professor',
-                'Lecturer',
-                'Visiting Faculty'
-            ]
-            
-            # Get faculties in this area
-            faculties = db.query(AnalyticsFaculty).filter(
-                AnalyticsFaculty.research_areas.contains(area),
-                AnalyticsFaculty.position.in_(allowed_positions)
-            ).all()            
-            result = []
-            for faculty in faculties:
-                # Get publication count
-                pub_count = db.query(Publication).filter(
-                    Publication.faculty_id == faculty.faculty_id
-                ).count()
-                
-                result.append({
-                    'faculty_id': faculty.faculty_id,
-                    'name': f"{faculty.first_name} {faculty.last_name}",
-                    'department': faculty.department_name,
-                    'school': faculty.school_name,
-                    'position': faculty.position,
-                    'research_areas': [area.area_name for area in faculty.research_areas],
-                    'publication_count': pub_count
-                })
-            
-            return result
+        result = []
+        for faculty, relevance in supervisor_index.get().search(research_area, positions=allowed_positions):
+            result.append({
+                'faculty_id': faculty.faculty_id,
+                'name': f"{faculty.first_name} {faculty.last_name}",
+                'department': faculty.department_name,
+                'school': faculty.school_name,
+                'position': faculty.position,
+                'research_areas': list(faculty.research_areas),
+                'publication_count': faculty.publication_count,
+                'relevance': round(relevance, 4)
+            })
+        
+        return result
     
     @staticmethod
-    def get_all_faculty_info(limit=None, offset=0, department=None, position=None, search_name=None):
-        """Get all faculty information with optional filtering and pagination"""
+    @response_cache.cached
+    def get_all_faculty_info(
+        limit=None, offset=0, department=None, position=None, search_name=None, cursor=None, include_total=True
+    ):
+        """Get all faculty information with optional filtering and offset or cursor pagination"""
+        after_id = decode_cursor('faculty_id', cursor) if cursor else None
+
         with get_postgres_db() as db:
             allowed_positions = [
                 'Professor',
@@ -229,32 +269,49 @@ class DashboardService:
                 query = query.filter(AnalyticsFaculty.position.ilike(f"%{position}%"))
 
             if search_name:
-                search_term = f"%{search_name}%"
-                query = query.filter(
-                    db.or_(
-                        AnalyticsFaculty.first_name.ilike(search_term),
-                        AnalyticsFaculty.last_name.ilike(search_term),
-                        db.func.concat(AnalyticsFaculty.first_name, ' ', AnalyticsFaculty.last_name).ilike(search_term)
-                    )
-                )
+                name_matches = faculty_by_name(search_name)
+                if name_matches is None:
+                    # Nothing searchable in the input, so no name can match it.
+                    query = query.filter(false())
+                else:
+                    query = query.filter(AnalyticsFaculty.faculty_id.in_(select(name_matches.c.faculty_id)))
 
             # Get total count for pagination
-            total_count = query.count()
+            total_count = None
+            if include_total and not department and not search_name:
+                # Positions are counted case-insensitively in faculty_analytics
+                position_counts = db.query(func.coalesce(func.sum(FacultyAnalytics.count), 0)).filter(
+                    FacultyAnalytics.metric_name == 'position',
+                    FacultyAnalytics.metric_value.in_([allowed.lower() for allowed in allowed_positions])
+                )
+                if position:
+                    position_counts = position_counts.filter(FacultyAnalytics.metric_value.ilike(f"%{position}%"))
+                total_count = position_counts.scalar()
+            elif include_total:
+                total_count = query.count()
+
+            # Publication counts are precomputed by the ETL
+            query = query.add_columns(
+                func.coalesce(FacultyPublicationStats.publication_count, 0)
+            ).outerjoin(
+                FacultyPublicationStats, AnalyticsFaculty.faculty_id == FacultyPublicationStats.faculty_id
+            ).options(
+                joinedload(AnalyticsFaculty.research_areas)
+            )
 
             # Apply pagination
-            query = query.offset(offset)
+            query = query.order_by(AnalyticsFaculty.faculty_id)
+            if after_id is not None:
+                query = query.filter(AnalyticsFaculty.faculty_id > after_id)
+            else:
+                query = query.offset(offset)
             if limit:
                 query = query.limit(limit)
 
             faculties = query.all()
 
             result = []
-            for faculty in faculties:
-                # Get publication count for each faculty
-                pub_count = db.query(Publication).filter(
-                    Publication.faculty_id == faculty.faculty_id
-                ).count()
-
+            for faculty, pub_count in faculties:
                 result.append({
                     'faculty_id': faculty.faculty_id,
                     'first_name': faculty.first_name,
@@ -268,12 +325,17 @@ class DashboardService:
                     'publication_count': pub_count
                 })
 
+            next_cursor = None
+            if limit and len(result) == limit:
+                next_cursor = encode_cursor('faculty_id', result[-1]['faculty_id'])
+
             return {
                 'faculty': result,
                 'total_count': total_count,
                 'returned_count': len(result),
                 'offset': offset,
-                'limit': limit
+                'limit': limit,
+                'next_cursor': next_cursor
             }
 
 dashboard_service = DashboardService()
@@ -286,37 +348,8 @@ def home():
 def dashboard_overview():
     """Get dashboard overview data"""
     try:
-        allowed_positions = [
-            'Professor',
-            'Associate Professor',
-            'Assistant Professor',
-            'Lecturer',
-            'Visiting Faculty'
-        ]
-
-        with get_postgres_db() as db:
-            total_faculty = db.query(AnalyticsFaculty).filter(
-                    AnalyticsFaculty.position.in_(allowed_positions)
-                ).count()
-
-            total_publications = db.query(Publication).count()
-            total_research_areas = db.query(ResearchArea).count()
-
-            # Get unique departments among filtered positions
-            unique_departments = db.query(AnalyticsFaculty.department_name).filter(
-                    AnalyticsFaculty.position.in_(allowed_positions)
-                ).distinct().count()
-
-        return jsonify({
-            'status': 'success',
-            'data': {
-                'total_faculty': total_faculty,
-                'total_publications': total_publications,
-                'total_research_areas': total_research_areas,
-                'total_departments': unique_departments
-            }
-        })
-
+        data = dashboard_service.get_overview()
+        return jsonify({'status': 'success', 'data': data})
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
@@ -376,6 +409,21 @@ def top_faculty():
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
+@app.route('/api/dashboard/cache-stats')
+def cache_stats():
+    """Get hit/miss counters of the dashboard response cache"""
+    return jsonify({'status': 'success', 'data': response_cache.stats()})
+
+@app.route('/api/dashboard/supervisor-index')
+def supervisor_index_stats():
+    """Get size, data generation and reload counters of the in-memory supervisor index"""
+    return jsonify({'status': 'success', 'data': supervisor_index.stats()})
+
+@app.route('/api/dashboard/pool-metrics')
+def pool_metrics():
+    """Get connection pool checkouts, wait times and exhaustion events per engine"""
+    return jsonify({'status': 'success', 'data': pool_metrics_report()})
+
 @app.route('/api/all-faculty')
 def get_all_faculty():
     """Get all faculty information with optional filtering and pagination"""
@@ -386,21 +434,31 @@ def get_all_faculty():
         department = request.args.get('department', '')
         position = request.args.get('position', '')
         search_name = request.args.get('search', '')
+        cursor = request.args.get('cursor', '')
+        include_total = request.args.get('include_total', 'true').lower() not in ('0', 'false', 'no')
         
         # Convert empty strings to None for optional parameters
         department = department if department else None
         position = position if position else None
         search_name = search_name if search_name else None
+        cursor = cursor if cursor else None
+
+        if cursor and offset:
+            return jsonify({'status': 'error', 'message': 'Use either offset or cursor, not both'}), 400
         
         data = dashboard_service.get_all_faculty_info(
             limit=limit,
             offset=offset,
             department=department,
             position=position,
-            search_name=search_name
+            search_name=search_name,
+            cursor=cursor,
+            include_total=include_total
         )
         
         return jsonify({'status': 'success', 'data': data})
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
@@ -491,4 +549,5 @@ def collaboration_analytics():
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
 if __name__ == '__main__':
+    supervisor_index.warm_up()
     app.run(debug=True, host='0.0.0.0', port=5000)
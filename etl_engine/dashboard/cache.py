@@ -0,0 +1,119 @@
+import functools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from etl_engine.loaders.postgres_loader import read_data_generation
+
+
+class ResponseCache:
+    """
+    LRU cache with per-entry TTL for read-only service methods.
+
+    Every entry belongs to the data generation it was computed under. The generation is re-read
+    at most once per generation_check_interval seconds and the whole cache is dropped when it
+    changes, so responses never outlive the ETL run that produced their data by more than that.
+    Cached values are shared between callers and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        generation_reader: Callable[[], Optional[int]] = read_data_generation,
+        max_size: int = 256,
+        ttl: float = 300.0,
+        generation_check_interval: float = 2.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.generation_reader = generation_reader
+        self.max_size = max_size
+        self.ttl = ttl
+        self.generation_check_interval = generation_check_interval
+        self.clock = clock
+
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation: Optional[int] = None
+        self._generation_checked_at: Optional[float] = None
+        self._counters = {'hits': 0, 'misses': 0, 'expired': 0, 'evictions': 0, 'invalidations': 0, 'generation_errors': 0}
+
+    def cached(self, function: Callable) -> Callable:
+        """Decorator caching function results by function name and arguments"""
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            key = (function.__qualname__, args, tuple(sorted(kwargs.items())))
+            return self.get_or_compute(key, lambda: function(*args, **kwargs))
+
+        return wrapper
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        self._check_generation()
+        now = self.clock()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._counters['hits'] += 1
+                    return value
+
+                del self._entries[key]
+                self._counters['expired'] += 1
+            self._counters['misses'] += 1
+            generation = self._generation
+
+        value = compute()
+
+        with self._lock:
+            # Results computed while the generation changed may already be stale.
+            if generation != self._generation:
+                return value
+
+            self._entries[key] = (now + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._counters['evictions'] += 1
+
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._counters['hits'] + self._counters['misses']
+            return {
+                **self._counters,
+                'hit_ratio': round(self._counters['hits'] / lookups, 4) if lookups else 0.0,
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'ttl': self.ttl,
+                'generation': self._generation,
+            }
+
+    def _check_generation(self):
+        """Drop every entry when the ETL data generation changed since the last check"""
+        now = self.clock()
+        with self._lock:
+            if self._generation_checked_at is not None and now - self._generation_checked_at < self.generation_check_interval:
+                return
+            self._generation_checked_at = now
+
+        try:
+            generation = self.generation_reader()
+        except Exception:
+            # Keep serving what is cached, entries still expire by TTL.
+            with self._lock:
+                self._counters['generation_errors'] += 1
+            return
+
+        with self._lock:
+            if generation != self._generation:
+                if self._entries:
+                    self._counters['invalidations'] += 1
+                self._entries.clear()
+                self._generation = generation
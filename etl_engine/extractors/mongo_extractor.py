@@ -1,7 +1,21 @@
 import pandas as pd
+from bson import ObjectId
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from pymongo.errors import ServerSelectionTimeoutError
 from .base_extractor import BaseExtractor
 from etl_engine.core.mongo_database import get_mongo_db, client
+from etl_engine.core.config import settings
+from etl_engine.utils.dataframes import compact_dtypes, concat_frames
+
+# Optional field that writers can set when they modify a research paper document in place.
+UPDATED_AT_FIELD = "updated_at"
+
+# Fields of a research paper document that the ETL reads.
+PROJECTED_FIELDS = [
+    'faculty_id', 'faculty_name', 'department', 'school', 'research_area',
+    'papers.title', 'papers.year', 'papers.journal', 'papers.co_authors'
+]
 
 
 class MongoExtractor(BaseExtractor):
@@ -13,49 +27,157 @@ class MongoExtractor(BaseExtractor):
             print(f"Connection failed: {e}")
             return False
 
-    def extract(self) -> pd.DataFrame:
+    def extract(self, query: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
         try:
-            with get_mongo_db() as db:
-                papers = []
-
-                for doc in db.research_papers_v2.find():
-                    for paper in doc['papers']:
-                        first_name = None
-                        middle_name = None
-                        last_name = None
-                        full_name = doc['faculty_name'].strip().split()
-
-                        if len(full_name) == 2:
-                            first_name = full_name[0]
-                            last_name = full_name[1]
-                        elif len(full_name) == 3:
-                            first_name = full_name[0]
-                            middle_name = full_name[1]
-                            last_name = full_name[2]
-
-                        paper_info = {
-                            'faculty_id': doc['faculty_id'],
-                            'first_name': first_name,
-                            'middle_name': middle_name,
-                            'last_name': last_name,
-                            'department': doc['school'] if 'department' not in doc or doc['department'] in [None, "NULL"] else doc['department'],
-                            'school': doc['school'],
-                            'research_area': doc['research_area'],
-                            'paper_title': paper['title'],
-                            'published_year': paper['year'],
-                            'journal': paper['journal'],
-                            'coauthors': paper['co_authors']
-                        }
-
-                        papers.append(paper_info)
-
-                if papers:
-                    research_paper_df = pd.DataFrame(papers)
-                    return research_paper_df
-                else:
-                    print("No research paper data found.")
-                    return pd.DataFrame()
+            chunks = list(self.extract_chunks(query=query))
+
+            if chunks:
+                research_paper_df = concat_frames(chunks)
+                return research_paper_df
+            else:
+                print("No research paper data found.")
+                return pd.DataFrame()
 
         except Exception as e:
             print(f"Extraction of research papers failed: {e}")
             return pd.DataFrame()
+
+    def extract_chunks(
+        self,
+        chunk_size: int = settings.ETL_CHUNK_SIZE,
+        batch_size: int = settings.MONGO_BATCH_SIZE,
+        query: Optional[Dict[str, Any]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream the research papers as DataFrames of at most chunk_size rows.
+
+        Papers are unwound on the server and only the fields the ETL needs are sent back,
+        batch_size documents per round trip.
+        """
+        pipeline = [
+            {'$match': query or {}},
+            {'$project': {'_id': 0, **{field: 1 for field in PROJECTED_FIELDS}}},
+            {'$unwind': '$papers'},
+            {'$project': {
+                'faculty_id': 1,
+                'faculty_name': 1,
+                'department': 1,
+                'school': 1,
+                'research_area': 1,
+                'paper_title': '$papers.title',
+                'published_year': '$papers.year',
+                'journal': '$papers.journal',
+                'coauthors': '$papers.co_authors',
+            }},
+        ]
+
+        with get_mongo_db() as db:
+            cursor = db.research_papers_v2.aggregate(pipeline, batchSize=batch_size, allowDiskUse=True)
+
+            rows = []
+            for row in cursor:
+                rows.append(row)
+                if len(rows) >= chunk_size:
+                    yield self._build_chunk(rows)
+                    rows = []
+
+            if rows:
+                yield self._build_chunk(rows)
+
+    def extract_watermark(self) -> Dict[str, Any]:
+        """Snapshot the collection so that the next incremental run only reads what changed after it"""
+        with get_mongo_db() as db:
+            documents = {
+                str(doc['_id']): str(doc['faculty_id'])
+                for doc in db.research_papers_v2.find({}, {'faculty_id': 1})
+            }
+            latest = db.research_papers_v2.find_one(
+                {UPDATED_AT_FIELD: {'$exists': True}}, {UPDATED_AT_FIELD: 1}, sort=[(UPDATED_AT_FIELD, -1)]
+            )
+
+        return {
+            'last_object_id': max(documents) if documents else None,
+            'last_updated_at': latest[UPDATED_AT_FIELD].isoformat() if latest else None,
+            'documents': documents,
+        }
+
+    def extract_changes(
+        self,
+        watermark: Dict[str, Any],
+        extra_faculty_ids: Optional[List[str]] = None
+    ) -> Tuple[pd.DataFrame, List[str], List[str], Dict[str, Any]]:
+        """
+        Find documents inserted or updated after the watermark, plus the documents of
+        extra_faculty_ids, and extract every paper of the faculty they or deleted documents belong to.
+
+        Returns those papers, the faculty ids of changed documents, the faculty ids whose
+        documents were deleted and the new watermark. Documents modified in place are only
+        picked up when their writer sets `updated_at`.
+        """
+        new_watermark = self.extract_watermark()
+        known_documents = watermark.get('documents', {})
+
+        deleted_faculty_ids = [
+            faculty_id for object_id, faculty_id in known_documents.items()
+            if object_id not in new_watermark['documents']
+        ]
+
+        if watermark.get('last_object_id'):
+            conditions = [{'_id': {'$gt': ObjectId(watermark['last_object_id'])}}]
+            if watermark.get('last_updated_at'):
+                conditions.append({UPDATED_AT_FIELD: {'$gt': datetime.fromisoformat(watermark['last_updated_at'])}})
+            else:
+                conditions.append({UPDATED_AT_FIELD: {'$exists': True}})
+            if extra_faculty_ids:
+                conditions.append({'faculty_id': {'$in': extra_faculty_ids}})
+            query = {'$or': conditions}
+        else:
+            # Without a previous watermark every document counts as new.
+            query = {}
+
+        with get_mongo_db() as db:
+            changed_faculty_ids = [
+                str(doc['faculty_id']) for doc in db.research_papers_v2.find(query, {'faculty_id': 1})
+            ]
+
+        # The loader replaces every publication of these faculty, so read all of their documents,
+        # not only the changed ones.
+        affected_faculty_ids = sorted(set(changed_faculty_ids) | set(deleted_faculty_ids))
+        research_df = pd.DataFrame()
+        if affected_faculty_ids:
+            research_df = self.extract({'faculty_id': {'$in': self.faculty_id_values(affected_faculty_ids)}})
+
+        return research_df, changed_faculty_ids, deleted_faculty_ids, new_watermark
+
+    @staticmethod
+    def faculty_id_values(faculty_ids: List[str]) -> List[Any]:
+        """The ids as documents may store them, as text or as numbers"""
+        return [*faculty_ids, *(int(faculty_id) for faculty_id in faculty_ids if faculty_id.isdigit())]
+
+    @staticmethod
+    def _build_chunk(rows: List[Dict[str, Any]]) -> pd.DataFrame:
+        """Split faculty names and fill missing departments for a batch of unwound papers"""
+        chunk_df = pd.DataFrame(rows).reindex(columns=[
+            'faculty_id', 'faculty_name', 'department', 'school', 'research_area',
+            'paper_title', 'published_year', 'journal', 'coauthors'
+        ])
+
+        # Names are "first last" or "first middle last", anything else is left empty.
+        name_parts = chunk_df['faculty_name'].str.strip().str.split()
+        part_count = name_parts.str.len()
+        has_name = part_count.isin([2, 3])
+
+        chunk_df['first_name'] = name_parts.str[0].where(has_name, None)
+        chunk_df['middle_name'] = name_parts.str[1].where(part_count == 3, None)
+        chunk_df['last_name'] = name_parts.str[-1].where(has_name, None)
+
+        # School of management and school of arts does not have departments. so use school instead.
+        missing_department = chunk_df['department'].isna() | (chunk_df['department'] == "NULL")
+        chunk_df['department'] = chunk_df['department'].where(~missing_department, chunk_df['school'])
+
+        compact_dtypes(chunk_df)
+
+        return chunk_df[[
+            'faculty_id', 'first_name', 'middle_name', 'last_name', 'department', 'school',
+            'research_area', 'paper_title', 'published_year', 'journal', 'coauthors'
+        ]]
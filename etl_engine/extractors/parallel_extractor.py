@@ -0,0 +1,49 @@
+import time
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+from .sql_extractor import SQLExtractor
+from .mongo_extractor import MongoExtractor
+
+
+class ParallelExtractor:
+    """Run the independent source reads concurrently on a thread pool"""
+
+    def __init__(self, sql_extractor: SQLExtractor, mongo_extractor: Optional[MongoExtractor] = None):
+        self.sql_extractor = sql_extractor
+        self.mongo_extractor = mongo_extractor
+        # Seconds spent in each read, plus the wall-clock time of the whole extraction.
+        self.timings: Dict[str, float] = {}
+
+    def extract(self) -> Dict[str, pd.DataFrame]:
+        """
+        Read faculties, departments, schools and (when a MongoExtractor is given) research papers.
+
+        Returns the DataFrames keyed by source name once every read has finished.
+        """
+        tasks: Dict[str, Callable[[], pd.DataFrame]] = {
+            'faculties': self.sql_extractor.extract_faculty,
+            'departments': self.sql_extractor.extract_departments,
+            'schools': self.sql_extractor.extract_schools,
+        }
+        if self.mongo_extractor is not None:
+            tasks['research_papers'] = self.mongo_extractor.extract
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix="extract") as pool:
+            futures = {name: pool.submit(self._timed, name, task) for name, task in tasks.items()}
+            results = {name: future.result() for name, future in futures.items()}
+        self.timings['total'] = time.perf_counter() - start
+
+        return results
+
+    def print_timings(self):
+        for name, seconds in self.timings.items():
+            print(f"  {name:<16} {seconds:.2f}s")
+
+    def _timed(self, name: str, task: Callable[[], Any]) -> Any:
+        start = time.perf_counter()
+        try:
+            return task()
+        finally:
+            self.timings[name] = time.perf_counter() - start
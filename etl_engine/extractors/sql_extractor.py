@@ -1,13 +1,47 @@
-from sqlalchemy import text
+from sqlalchemy import Select, func, select, text
 import pandas as pd
+from typing import Dict, Iterable, Optional
 from .base_extractor import BaseExtractor
 from etl_engine.models.faculty_model import Faculty
 from etl_engine.models.department_model import Department
 from etl_engine.models.school_model import School
 from etl_engine.core.sql_database import get_sql_db
+from etl_engine.core.config import settings
+from etl_engine.utils.dataframes import compact_dtypes, concat_frames
+
+
+def faculty_query(faculty_ids: Optional[Iterable[int]] = None) -> Select:
+    """Columns of faculties the ETL needs, with the department fallback done by the database"""
+    query = select(
+        Faculty.faculty_id.label('faculty_id'),
+        Faculty.first_name.label('first_name'),
+        Faculty.middle_name.label('middle_name'),
+        Faculty.last_name.label('last_name'),
+        # School of management and school of arts does not have departments. so use school instead.
+        func.coalesce(Faculty.department_name, Faculty.school_name).label('department_name'),
+        Faculty.school_name.label('school_name'),
+        Faculty.position.label('position'),
+    )
+    if faculty_ids is not None:
+        query = query.where(Faculty.faculty_id.in_(list(faculty_ids)))
+
+    return query
+
+
+DEPARTMENT_QUERY = select(
+    Department.department_name.label('department_name'),
+    Department.school_name.label('school'),
+    Department.number_of_faculty.label('number_of_faculty'),
+)
+
+SCHOOL_QUERY = select(School.school_name.label('school_name'))
 
 
 class SQLExtractor(BaseExtractor):
+    def __init__(self, chunk_size: int = settings.ETL_CHUNK_SIZE):
+        super().__init__()
+        self.chunk_size = chunk_size
+
     def connect(self) -> bool:
         try:
             # Test the connection.
@@ -21,47 +55,60 @@ class SQLExtractor(BaseExtractor):
             return False
 
     def extract(self) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-        faculty_df = self.__extract_faculty_information()
-        department_df = self.__extract_department_information()
-        school_df = self.__extract_school_information()
-
-        # School of management and school of arts does not have departments. so use school instead.
-        faculty_df['department_name'] = faculty_df.apply(
-            lambda row: row['school_name'] if pd.isna(row['department_name']) else row['department_name'],
-            axis=1
-        )
+        faculty_df = self.extract_faculty()
+        department_df = self.extract_departments()
+        school_df = self.extract_schools()
 
         return faculty_df, department_df, school_df
 
-    def __extract_faculty_information(self) -> pd.DataFrame:
+    def extract_departments(self) -> pd.DataFrame:
+        return self.__extract_department_information()
+
+    def extract_schools(self) -> pd.DataFrame:
+        return self.__extract_school_information()
+
+    def extract_faculty(self, faculty_ids: Optional[Iterable[int]] = None) -> pd.DataFrame:
+        """Extract all faculty, or only the given faculty ids"""
+        return self.__extract_faculty_information(faculty_ids)
+
+    def extract_faculty_hashes(self) -> Dict[int, str]:
+        """Fingerprint every faculty row so that changed rows can be found without extracting them"""
+        query = text("""
+            SELECT faculty_id,
+                   MD5(CONCAT_WS('|', first_name, COALESCE(middle_name, ''), last_name,
+                                 COALESCE(department, ''), school, position)) AS row_hash
+            FROM faculties
+        """)
+        with get_sql_db() as db:
+            return {faculty_id: row_hash for faculty_id, row_hash in db.execute(query)}
+
+    def __extract_faculty_information(self, faculty_ids: Optional[Iterable[int]] = None) -> pd.DataFrame:
         try:
-            with get_sql_db() as db:
-                faculties = db.query(Faculty).all()
-                faculty_data = [faculty.as_dict() for faculty in faculties]
-                faculty_df = pd.DataFrame(faculty_data)
-                return faculty_df
+            return self._read_query(faculty_query(faculty_ids))
         except Exception as e:
             print(f"Extraction of faculty information failed: {e}")
             return pd.DataFrame()
 
     def __extract_department_information(self) -> pd.DataFrame:
         try:
-            with get_sql_db() as db:
-                departments = db.query(Department).all()
-                department_data = [department.as_dict() for department in departments]
-                department_df = pd.DataFrame(department_data)
-                return department_df
+            return self._read_query(DEPARTMENT_QUERY)
         except Exception as e:
             print(f"Extraction of department information failed: {e}")
             return pd.DataFrame()
 
     def __extract_school_information(self) -> pd.DataFrame:
         try:
-            with get_sql_db() as db:
-                schools = db.query(School).all()
-                school_data = [school.as_dict() for school in schools]
-                school_df = pd.DataFrame(school_data)
-                return school_df
+            return self._read_query(SCHOOL_QUERY)
         except Exception as e:
             print(f"Extraction of school information failed: {e}")
             return pd.DataFrame()
+
+    def _read_query(self, query: Select) -> pd.DataFrame:
+        """Fetch the selected columns straight into compact DataFrames, chunk_size rows at a time"""
+        with get_sql_db() as db:
+            connection = db.connection(execution_options={'stream_results': True})
+            chunks = [compact_dtypes(chunk) for chunk in pd.read_sql(query, connection, chunksize=self.chunk_size)]
+
+        if not chunks:
+            return pd.DataFrame()
+        return concat_frames(chunks)
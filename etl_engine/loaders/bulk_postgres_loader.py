@@ -0,0 +1,194 @@
+import io
+import time
+import pandas as pd
+from typing import Dict, Any, List, Iterable, Optional, Sequence
+from psycopg2.extras import execute_values
+from etl_engine.utils.dataframes import null_values
+from .postgres_loader import (
+    PostgreSQLLoader, RunManifest, PUBLICATION_STATS_SQL, RESEARCH_AREA_ANALYTICS_SQL, FACULTY_COLUMNS, faculty_filter
+)
+
+# Rows written per COPY / execute_values round trip.
+DEFAULT_CHUNK_SIZE = 50000
+
+# Marker used for NULL in the CSV stream so that empty strings stay empty strings.
+COPY_NULL = "\\N"
+
+
+class BulkPostgreSQLLoader(PostgreSQLLoader):
+    """Loader that streams DataFrames with COPY FROM STDIN instead of building ORM objects"""
+
+    def __init__(self, method: str = "copy", chunk_size: int = DEFAULT_CHUNK_SIZE):
+        super().__init__()
+        if method not in ("copy", "values"):
+            raise ValueError(f"Unknown bulk load method: {method}")
+
+        self.method = method
+        self.chunk_size = chunk_size
+        self.load_stats: Dict[str, Dict[str, float]] = {}
+
+    def load_faculty_data(
+        self,
+        faculty_df: pd.DataFrame,
+        research_by_faculty: Dict[str, List[str]],
+        research_edges: Optional[pd.DataFrame] = None,
+        manifest: Optional[RunManifest] = None
+    ):
+        """Load faculty data and their research areas"""
+        if research_edges is None:
+            research_edges = self.research_edges_from_mapping(research_by_faculty)
+
+        checkpoint = self.checkpoint(manifest, 'faculty', lambda: self.faculty_fingerprint(faculty_df, research_edges))
+        if checkpoint.completed:
+            print(f"Faculty members were loaded by the resumed run, skipping {len(faculty_df)} records")
+            return
+
+        connection = self.engine.raw_connection()
+        try:
+            with connection.cursor() as cursor:
+                # Clear existing data
+                cursor.execute("TRUNCATE faculty_research_area, publicaionts, research_areas, analytics_faculty")
+
+                area_df = pd.DataFrame({'area_name': sorted(set(research_edges['area_name']))})
+                self._write_frame(cursor, 'research_areas', ['area_name'], area_df)
+
+                cursor.execute("SELECT area_name, id FROM research_areas")
+                research_area_map = dict(cursor.fetchall())
+
+                faculty_rows = faculty_df.reindex(columns=FACULTY_COLUMNS)
+                self._write_frame(cursor, 'analytics_faculty', FACULTY_COLUMNS, faculty_rows)
+
+                link_df = self.research_area_link_frame(faculty_df['faculty_id'], research_edges, research_area_map)
+                self._write_frame(cursor, 'faculty_research_area', ['faculty_id', 'research_area_id'], link_df)
+
+                checkpoint.save(cursor, len(faculty_df), completed=True)
+            connection.commit()
+        finally:
+            connection.close()
+
+        print(f"Loaded {len(faculty_df)} faculty members")
+
+    def load_publication_data(self, research_df: pd.DataFrame, manifest: Optional[RunManifest] = None):
+        """Load publication data, committing every chunk together with the stage's checkpoint"""
+        publication_df = self.publication_frame(research_df)
+        checkpoint = self.checkpoint(manifest, 'publications', lambda: RunManifest.frame_fingerprint(publication_df))
+        if checkpoint.completed:
+            print(f"Publications were loaded by the resumed run, skipping {len(publication_df)} records")
+            return
+        if checkpoint.rows_done:
+            print(f"Resuming the publication load after {checkpoint.rows_done} of {len(publication_df)} records")
+
+        connection = self.engine.raw_connection()
+        try:
+            with connection.cursor() as cursor:
+                if manifest is not None and not checkpoint.rows_done:
+                    # Rows of an earlier attempt whose faculty load was resumed.
+                    cursor.execute("DELETE FROM publicaionts")
+
+                for offset in range(checkpoint.rows_done, len(publication_df), self.chunk_size):
+                    chunk = publication_df.iloc[offset:offset + self.chunk_size]
+                    self._write_frame(cursor, 'publicaionts', list(publication_df.columns), chunk)
+                    checkpoint.save(cursor, offset + len(chunk))
+                    connection.commit()
+
+                checkpoint.save(cursor, len(publication_df), completed=True)
+            connection.commit()
+        finally:
+            connection.close()
+
+        print(f"Loaded {len(publication_df)} publication records")
+
+    def load_analytics_data(
+        self,
+        faculty_analysis: Dict[str, Any],
+        research_analysis: Dict[str, Any],
+        manifest: Optional[RunManifest] = None
+    ):
+        """Load pre-computed analytics data"""
+        checkpoint = self.checkpoint(
+            manifest, 'analytics', lambda: RunManifest.value_fingerprint([faculty_analysis, research_analysis])
+        )
+        if checkpoint.completed:
+            print("Analytics data was loaded by the resumed run, skipping it")
+            return
+
+        columns = ['metric_name', 'metric_value', 'count']
+        faculty_metrics = pd.DataFrame(self.faculty_metric_rows(faculty_analysis), columns=columns)
+        research_metrics = pd.DataFrame(self.research_metric_rows(research_analysis, research_areas=False), columns=columns)
+
+        connection = self.engine.raw_connection()
+        try:
+            with connection.cursor() as cursor:
+                # Clear existing analytics
+                cursor.execute("TRUNCATE faculty_analytics, research_analytics, faculty_publication_stats")
+
+                self._write_frame(cursor, 'faculty_analytics', columns, faculty_metrics)
+                self._write_frame(cursor, 'research_analytics', columns, research_metrics)
+                # Research areas are counted from the loaded links, as incremental runs count them.
+                cursor.execute(RESEARCH_AREA_ANALYTICS_SQL)
+                cursor.execute(PUBLICATION_STATS_SQL.format(faculty_filter=faculty_filter('publicaionts', None)))
+                checkpoint.save(cursor, len(faculty_metrics) + len(research_metrics), completed=True)
+            connection.commit()
+        finally:
+            connection.close()
+
+        print("Analytics data loaded successfully")
+
+    def throughput_report(self) -> List[Dict[str, Any]]:
+        """Rows, elapsed seconds and rows/sec for every table written so far"""
+        return [
+            {'table': table, **stats}
+            for table, stats in self.load_stats.items()
+        ]
+
+    def print_throughput_report(self):
+        print(f"Bulk load throughput ({self.method}):")
+        for entry in self.throughput_report():
+            print(
+                f"  {entry['table']:<25} {entry['rows']:>10} rows "
+                f"in {entry['seconds']:.2f}s ({entry['rows_per_sec']:.0f} rows/sec)"
+            )
+
+    def _write_frame(self, cursor, table: str, columns: Sequence[str], df: pd.DataFrame):
+        """Write a DataFrame into a table chunk by chunk and record its throughput"""
+        start = time.perf_counter()
+
+        for offset in range(0, len(df), self.chunk_size):
+            chunk = df.iloc[offset:offset + self.chunk_size]
+            if self.method == "copy" and hasattr(cursor, "copy_expert"):
+                self._copy_chunk(cursor, table, columns, chunk)
+            else:
+                self._insert_chunk(cursor, table, columns, chunk)
+
+        elapsed = time.perf_counter() - start
+        stats = self.load_stats.setdefault(table, {'rows': 0, 'seconds': 0.0, 'rows_per_sec': 0.0})
+        stats['rows'] += len(df)
+        stats['seconds'] += elapsed
+        stats['rows_per_sec'] = stats['rows'] / stats['seconds'] if stats['seconds'] > 0 else 0.0
+
+    @staticmethod
+    def _copy_chunk(cursor, table: str, columns: Sequence[str], chunk: pd.DataFrame):
+        buffer = io.StringIO()
+        chunk.to_csv(buffer, index=False, header=False, na_rep=COPY_NULL)
+        buffer.seek(0)
+
+        column_list = ", ".join(columns)
+        cursor.copy_expert(
+            f"COPY {table} ({column_list}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')",
+            buffer
+        )
+
+    @staticmethod
+    def _insert_chunk(cursor, table: str, columns: Sequence[str], chunk: pd.DataFrame):
+        column_list = ", ".join(columns)
+        execute_values(
+            cursor,
+            f"INSERT INTO {table} ({column_list}) VALUES %s",
+            list(_frame_rows(chunk)),
+            page_size=1000
+        )
+
+
+def _frame_rows(df: pd.DataFrame) -> Iterable[tuple]:
+    """Yield rows as plain python tuples with NaN/NA turned into None"""
+    return null_values(df).itertuples(index=False, name=None)
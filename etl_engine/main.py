@@ -1,102 +1,543 @@
 import pandas as pd
 from etl_engine.extractors.sql_extractor import SQLExtractor
 from etl_engine.extractors.mongo_extractor import MongoExtractor
+from etl_engine.extractors.parallel_extractor import ParallelExtractor
 from etl_engine.transformers.faculty_transformer import FacultyTransformer
 from etl_engine.transformers.research_transformer import ResearchTransformer
-from etl_engine.loaders.postgres_loader import PostgreSQLLoader
-from typing import Dict, Any
+from etl_engine.transformers.partitioned_transformer import PartitionedTransformer
+from etl_engine.loaders.postgres_loader import PostgreSQLLoader, RunManifest
+from etl_engine.loaders.bulk_postgres_loader import BulkPostgreSQLLoader
+from etl_engine.models.transformer_models import FacultyAnalysis, ResearchAnalysis
+from etl_engine.utils.watermark_store import WatermarkStore
+from etl_engine.utils.staging import StagingStore
+from etl_engine.utils.profiler import StageProfiler, PROFILERS
+from etl_engine.core.config import settings
+from typing import Dict, Any, Optional
+import argparse
 import sys
 import os
 
-def main():
+# Staged outputs a run can resume from without the source databases, and those that skip the transforms too.
+EXTRACT_STAGES = ('faculty', 'research', 'watermarks')
+TRANSFORM_STAGES = ('faculty_analysis', 'research_analysis', 'research_areas')
+
+def main(
+    bulk: bool = False,
+    bulk_method: str = "copy",
+    stream: bool = False,
+    chunk_size: int = settings.ETL_CHUNK_SIZE,
+    batch_size: int = settings.MONGO_BATCH_SIZE,
+    parallel_extract: bool = False,
+    transform_workers: int = settings.ETL_TRANSFORM_WORKERS,
+    staging_dir: Optional[str] = None,
+    from_staging: bool = False,
+    resume: bool = False,
+    profiler: Optional[StageProfiler] = None
+):
     print("Starting ETL Process...")
+    profiler = profiler or StageProfiler()
 
     sql_extractor = SQLExtractor()
     mongo_extractor = MongoExtractor()
     faculty_transformer = FacultyTransformer()
     research_transformer = ResearchTransformer()
-    postgres_loader = PostgreSQLLoader()
+    analysis_transformer = PartitionedTransformer(transform_workers)
+    postgres_loader = BulkPostgreSQLLoader(method=bulk_method) if bulk else PostgreSQLLoader()
 
-    # Test database connections
-    if not sql_extractor.connect():
-        print("SQL connection failed")
-        return
-    
-    if not mongo_extractor.connect():
-        print("MongoDB connection failed")
-        return
+    staging = StagingStore(staging_dir) if staging_dir else None
+    if stream and staging is not None:
+        # Streamed chunks are loaded as they are read, there is no whole stage output to persist.
+        print("Staging is not supported with --stream, running without it")
+        staging = None
+    if stream and resume:
+        print("Resuming is not supported with --stream, loading everything again")
 
-    if not postgres_loader.test_connection():
-        print("PostgreSQL connection failed")
-        return
+    # Checkpoints of the load stages, a resumed run continues where they say the last run stopped.
+    manifest = RunManifest(resume)
 
-    # Extract data from SQL
-    print("Extracting data from SQL...")
-    try:
-        faculty_df, deparment_df, school_df = sql_extractor.extract()
-        print(f"Extracted {len(faculty_df)} faculty records")
+    if from_staging:
+        if staging is None:
+            print("Resuming from staged data needs a staging directory")
+            return
+        if staging.has(*EXTRACT_STAGES):
+            load_from_staging(staging, research_transformer, analysis_transformer, postgres_loader, manifest, profiler)
+            return
+        print(f"No staged extraction found in {staging.path}, extracting from the sources...")
 
-        # Normalize faculty names
-        faculty_df = faculty_transformer.normalize_faculty_names(faculty_df)
-    except Exception as e:
-        print(f"SQL extraction failed: {e}")
+    # Test database connections
+    if not connect_sources(profiler, sql_extractor, mongo_extractor, postgres_loader):
         return
 
-    # Extract data from MongoDB
-    print("Extracting data from MongoDB...")
+    # Read the watermarks before extracting, so changes made during the run are picked up next time.
     try:
-        research_df = mongo_extractor.extract()
-        print(f"Extracted {len(research_df)} research paper records")
+        with profiler.stage("extract.watermarks") as stage:
+            faculty_hashes = sql_extractor.extract_faculty_hashes()
+            mongo_watermark = mongo_extractor.extract_watermark()
+            stage.rows_out = len(faculty_hashes)
     except Exception as e:
-        print(f"MongoDB extraction failed: {e}")
+        print(f"Reading source watermarks failed, incremental runs will need a full run first: {e}")
+        faculty_hashes, mongo_watermark = None, None
+
+    research_df = None
+
+    if parallel_extract:
+        # The reads hit independent servers, so run them side by side.
+        print("Extracting data from SQL and MongoDB in parallel...")
+        try:
+            with profiler.stage("extract.parallel") as stage:
+                parallel_extractor = ParallelExtractor(sql_extractor, None if stream else mongo_extractor)
+                extracted = parallel_extractor.extract()
+                faculty_df = extracted['faculties']
+                research_df = extracted.get('research_papers')
+                stage.rows_out = sum(len(df) for df in extracted.values())
+            print(f"Extracted {len(faculty_df)} faculty records")
+            if research_df is not None:
+                print(f"Extracted {len(research_df)} research paper records")
+            parallel_extractor.print_timings()
+
+            # Normalize faculty names
+            faculty_df = normalize_names(profiler, faculty_transformer, faculty_df)
+        except Exception as e:
+            print(f"Parallel extraction failed: {e}")
+            return
+    else:
+        # Extract data from SQL
+        print("Extracting data from SQL...")
+        try:
+            with profiler.stage("extract.sql") as stage:
+                faculty_df, deparment_df, school_df = sql_extractor.extract()
+                stage.rows_out = len(faculty_df) + len(deparment_df) + len(school_df)
+            print(f"Extracted {len(faculty_df)} faculty records")
+
+            # Normalize faculty names
+            faculty_df = normalize_names(profiler, faculty_transformer, faculty_df)
+        except Exception as e:
+            print(f"SQL extraction failed: {e}")
+            return
+
+    if stream:
+        if stream_research_data(
+            mongo_extractor, research_transformer, analysis_transformer, postgres_loader,
+            faculty_df, chunk_size, batch_size, profiler
+        ):
+            finish_run(postgres_loader, faculty_hashes, mongo_watermark, profiler)
+        return
+
+    if research_df is None:
+        # Extract data from MongoDB
+        print("Extracting data from MongoDB...")
+        try:
+            with profiler.stage("extract.mongo") as stage:
+                research_df = mongo_extractor.extract()
+                stage.rows_out = len(research_df)
+            print(f"Extracted {len(research_df)} research paper records")
+        except Exception as e:
+            print(f"MongoDB extraction failed: {e}")
+            return
+
+    if staging is not None:
+        staging = stage_extraction(staging, faculty_df, research_df, faculty_hashes, mongo_watermark, profiler)
+
+    transformed = transform_data(research_transformer, analysis_transformer, faculty_df, research_df, profiler)
+    if transformed is None:
         return
 
-    # Transform the data
+    if staging is not None:
+        stage_transformation(staging, transformed, profiler)
+
+    if load_data(postgres_loader, faculty_df, research_df, transformed, manifest, profiler):
+        finish_run(postgres_loader, faculty_hashes, mongo_watermark, profiler)
+
+def transform_data(
+    research_transformer: ResearchTransformer,
+    analysis_transformer: PartitionedTransformer,
+    faculty_df: pd.DataFrame,
+    research_df: pd.DataFrame,
+    profiler: StageProfiler
+) -> Optional[Dict[str, Any]]:
+    """Compute the analyses and the faculty to research area mapping, None when it fails"""
     print("Transforming data...")
     try:
-        faculty_analysis = faculty_transformer.transform_facutly_data(faculty_df)
-        research_analysis = research_transformer.transform_research_data(research_df)
+        with profiler.stage("transform.faculty", rows_in=len(faculty_df)):
+            faculty_analysis = analysis_transformer.transform_facutly_data(faculty_df)
+        with profiler.stage("transform.research", rows_in=len(research_df)):
+            research_analysis = analysis_transformer.transform_research_data(research_df)
 
         # Create faculty-research mapping
-        research_by_faculty = research_transformer.get_research_areas_by_faculty(research_df)
+        with profiler.stage("transform.research_areas", rows_in=len(research_df)) as stage:
+            research_by_faculty, research_edges = research_transformer.get_research_areas_by_faculty(
+                research_df, return_edges=True
+            )
+            stage.rows_out = len(research_edges)
         # print(research_by_faculty)
 
-        faculty_details = faculty_df.set_index('faculty_id').to_dict('index')
-        enhanced_mapping = {}
-
-        for faculty_id, research_area in research_by_faculty.items():
-            if int(faculty_id) in faculty_details:
-                faculty_id_int = int(faculty_id)
-                enhanced_mapping[faculty_id] = {
-                    'research_areas': research_area,
-                    'department': faculty_details[faculty_id_int].get('department_name'),
-                    'school': faculty_details[faculty_id_int].get('school_name'),
-                    'position': faculty_details[faculty_id_int].get('position', ''),
-                }
+        with profiler.stage("transform.faculty_mapping", rows_in=len(research_by_faculty)) as stage:
+            faculty_details = faculty_df.set_index('faculty_id').to_dict('index')
+            enhanced_mapping = {}
+
+            for faculty_id, research_area in research_by_faculty.items():
+                if int(faculty_id) in faculty_details:
+                    faculty_id_int = int(faculty_id)
+                    enhanced_mapping[faculty_id] = {
+                        'research_areas': research_area,
+                        'department': faculty_details[faculty_id_int].get('department_name'),
+                        'school': faculty_details[faculty_id_int].get('school_name'),
+                        'position': faculty_details[faculty_id_int].get('position', ''),
+                    }
+            stage.rows_out = len(enhanced_mapping)
 
     except Exception as e:
         print(f"Data transformation failed: {e}")
-        return
-    
-    # Load to PostgreSQL
+        return None
+
+    return {
+        'faculty_analysis': faculty_analysis,
+        'research_analysis': research_analysis,
+        'research_by_faculty': research_by_faculty,
+        'research_edges': research_edges,
+    }
+
+def load_data(
+    postgres_loader: PostgreSQLLoader,
+    faculty_df: pd.DataFrame,
+    research_df: pd.DataFrame,
+    transformed: Dict[str, Any],
+    manifest: RunManifest,
+    profiler: StageProfiler
+) -> bool:
+    """Load the extracted and transformed data to PostgreSQL, checkpointing every stage in manifest"""
     print("Loading data to PostgreSQL...")
     try:
         # Create tables
-        postgres_loader.create_tables()
+        with profiler.stage("create_tables"):
+            postgres_loader.create_tables()
 
         # Load faculty and research area data
-        postgres_loader.load_faculty_data(faculty_df, research_by_faculty)
+        with profiler.stage("load.faculty", rows_in=len(faculty_df)):
+            postgres_loader.load_faculty_data(
+                faculty_df, transformed['research_by_faculty'], transformed['research_edges'], manifest
+            )
 
         # Load publications data
-        postgres_loader.load_publication_data(research_df)
+        with profiler.stage("load.publications", rows_in=len(research_df)):
+            postgres_loader.load_publication_data(research_df, manifest)
 
         # Load analytics data
-        postgres_loader.load_analytics_data(faculty_analysis, research_analysis)
-    
+        with profiler.stage("load.analytics"):
+            postgres_loader.load_analytics_data(
+                transformed['faculty_analysis'], transformed['research_analysis'], manifest
+            )
+
+    except Exception as e:
+        print(f"PostgreSQL loading failed: {e}")
+        return False
+
+    return True
+
+def stage_extraction(
+    staging: StagingStore,
+    faculty_df: pd.DataFrame,
+    research_df: pd.DataFrame,
+    faculty_hashes,
+    mongo_watermark,
+    profiler: StageProfiler
+) -> Optional[StagingStore]:
+    """Replace the staged data with this run's extraction, None when staging is unavailable"""
+    print(f"Staging extracted data in {staging.path}...")
+    try:
+        with profiler.stage("staging.write.extract", rows_in=len(faculty_df) + len(research_df)):
+            staging.reset()
+            staging.write_frame('faculty', faculty_df)
+            staging.write_frame('research', research_df)
+            staging.write_json('watermarks', {
+                'faculty_hashes': None if faculty_hashes is None else {
+                    str(faculty_id): row_hash for faculty_id, row_hash in faculty_hashes.items()
+                },
+                'mongo_watermark': mongo_watermark,
+            })
+    except Exception as e:
+        print(f"Staging the extracted data failed, continuing without staging: {e}")
+        return None
+
+    return staging
+
+def stage_transformation(staging: StagingStore, transformed: Dict[str, Any], profiler: StageProfiler):
+    """Stage the analyses and the research area mapping next to the extraction they came from"""
+    try:
+        with profiler.stage("staging.write.transform"):
+            staging.write_analysis('faculty_analysis', transformed['faculty_analysis'])
+            staging.write_analysis('research_analysis', transformed['research_analysis'])
+            staging.write_frame('research_areas', research_area_frame(
+                transformed['research_by_faculty'], transformed['research_edges']
+            ))
+    except Exception as e:
+        print(f"Staging the transformed data failed: {e}")
+
+def load_from_staging(
+    staging: StagingStore,
+    research_transformer: ResearchTransformer,
+    analysis_transformer: PartitionedTransformer,
+    postgres_loader: PostgreSQLLoader,
+    manifest: RunManifest,
+    profiler: StageProfiler
+):
+    """Load the staged data of an earlier run without reading the source databases"""
+    print(f"Resuming from the data staged in {staging.path} at {staging.manifest['created_at']}...")
+    with profiler.stage("connect") as stage:
+        if not postgres_loader.test_connection():
+            stage.fail("PostgreSQL connection failed")
+    if stage.error:
+        print(stage.error)
+        return
+
+    try:
+        with profiler.stage("staging.read") as stage:
+            faculty_df = staging.read_frame('faculty')
+            research_df = staging.read_frame('research')
+            watermarks = staging.read_json('watermarks')
+            transformed = None
+            if staging.has(*TRANSFORM_STAGES):
+                transformed = read_staged_transformation(staging)
+            stage.rows_out = len(faculty_df) + len(research_df)
+        print(f"Read {len(faculty_df)} faculty and {len(research_df)} research paper records from staging")
+    except Exception as e:
+        print(f"Reading the staged data failed: {e}")
+        return
+
+    if transformed is None:
+        transformed = transform_data(research_transformer, analysis_transformer, faculty_df, research_df, profiler)
+        if transformed is None:
+            return
+        stage_transformation(staging, transformed, profiler)
+
+    if load_data(postgres_loader, faculty_df, research_df, transformed, manifest, profiler):
+        faculty_hashes = watermarks['faculty_hashes']
+        if faculty_hashes is not None:
+            faculty_hashes = {int(faculty_id): row_hash for faculty_id, row_hash in faculty_hashes.items()}
+        finish_run(postgres_loader, faculty_hashes, watermarks['mongo_watermark'], profiler)
+
+def read_staged_transformation(staging: StagingStore) -> Dict[str, Any]:
+    research_areas = staging.read_frame('research_areas')
+    research_edges = research_areas[research_areas['area_name'].notna()].reset_index(drop=True)
+
+    # Faculty without a readable research area are staged with a null area.
+    research_by_faculty = {faculty_id: [] for faculty_id in research_areas['faculty_id'].unique()}
+    research_by_faculty.update(research_edges.groupby('faculty_id', sort=False)['area_name'].agg(list).to_dict())
+
+    return {
+        'faculty_analysis': staging.read_analysis('faculty_analysis', FacultyAnalysis),
+        'research_analysis': staging.read_analysis('research_analysis', ResearchAnalysis),
+        'research_by_faculty': research_by_faculty,
+        'research_edges': research_edges,
+    }
+
+def research_area_frame(research_by_faculty: Dict[str, Any], research_edges: pd.DataFrame) -> pd.DataFrame:
+    """The (faculty_id, area_name) edges plus a null-area row per faculty without research areas"""
+    without_areas = [faculty_id for faculty_id, areas in research_by_faculty.items() if not areas]
+    return pd.concat([
+        research_edges[['faculty_id', 'area_name']],
+        pd.DataFrame({'faculty_id': without_areas, 'area_name': [None] * len(without_areas)}, dtype=object),
+    ], ignore_index=True)
+
+def connect_sources(
+    profiler: StageProfiler,
+    sql_extractor: SQLExtractor,
+    mongo_extractor: MongoExtractor,
+    postgres_loader: PostgreSQLLoader
+) -> bool:
+    """Check that every database is reachable"""
+    with profiler.stage("connect") as stage:
+        if not sql_extractor.connect():
+            stage.fail("SQL connection failed")
+        elif not mongo_extractor.connect():
+            stage.fail("MongoDB connection failed")
+        elif not postgres_loader.test_connection():
+            stage.fail("PostgreSQL connection failed")
+
+    if stage.error:
+        print(stage.error)
+        return False
+    return True
+
+def normalize_names(profiler: StageProfiler, faculty_transformer: FacultyTransformer, faculty_df: pd.DataFrame) -> pd.DataFrame:
+    with profiler.stage("normalize", rows_in=len(faculty_df)) as stage:
+        faculty_df = faculty_transformer.normalize_faculty_names(faculty_df)
+        stage.rows_out = len(faculty_df)
+    return faculty_df
+
+def stream_research_data(
+    mongo_extractor: MongoExtractor,
+    research_transformer: ResearchTransformer,
+    analysis_transformer: PartitionedTransformer,
+    postgres_loader: PostgreSQLLoader,
+    faculty_df: pd.DataFrame,
+    chunk_size: int,
+    batch_size: int,
+    profiler: StageProfiler
+) -> bool:
+    """Extract, transform and load the research papers chunk by chunk so memory stays bounded"""
+    print("Loading faculty data to PostgreSQL...")
+    try:
+        with profiler.stage("transform.faculty", rows_in=len(faculty_df)):
+            faculty_analysis = analysis_transformer.transform_facutly_data(faculty_df)
+
+        with profiler.stage("create_tables"):
+            postgres_loader.create_tables()
+        # Research areas are linked once every chunk has been seen.
+        with profiler.stage("load.faculty", rows_in=len(faculty_df)):
+            postgres_loader.load_faculty_data(faculty_df, {})
+    except Exception as e:
+        print(f"PostgreSQL loading failed: {e}")
+        return False
+
+    print(f"Streaming research papers from MongoDB in chunks of {chunk_size}...")
+    research_analysis = {}
+    research_by_faculty = {}
+    research_edges = []
+    try:
+        # Extraction, transformation and loading interleave per chunk, so the chunks are one stage.
+        with profiler.stage("stream.research_chunks") as stage:
+            stage.rows_in = 0
+            for chunk_number, research_df in enumerate(mongo_extractor.extract_chunks(chunk_size, batch_size), start=1):
+                research_analysis = research_transformer.merge_research_analysis(
+                    research_analysis, analysis_transformer.transform_research_data(research_df)
+                )
+                chunk_research_areas, chunk_edges = research_transformer.get_research_areas_by_faculty(
+                    research_df, return_edges=True
+                )
+                research_by_faculty = research_transformer.merge_research_areas(research_by_faculty, chunk_research_areas)
+                research_edges.append(chunk_edges)
+                postgres_loader.load_publication_data(research_df)
+                stage.rows_in += len(research_df)
+                print(f"Processed chunk {chunk_number} ({len(research_df)} research paper records)")
+
+        research_edges = pd.concat(research_edges).drop_duplicates() if research_edges else None
+        with profiler.stage("load.research_areas") as stage:
+            postgres_loader.load_research_areas(research_by_faculty, research_edges)
+            stage.rows_in = len(research_edges) if research_edges is not None else 0
+        with profiler.stage("load.analytics"):
+            postgres_loader.load_analytics_data(faculty_analysis, research_analysis)
+    except Exception as e:
+        print(f"Streaming research papers failed: {e}")
+        return False
+
+    return True
+
+def finish_run(postgres_loader: PostgreSQLLoader, faculty_hashes, mongo_watermark, profiler: StageProfiler):
+    """Report bulk throughput and record the watermarks of a successful run"""
+    if isinstance(postgres_loader, BulkPostgreSQLLoader):
+        postgres_loader.print_throughput_report()
+
+    with profiler.stage("finish"):
+        bump_data_generation(postgres_loader)
+
+        try:
+            RunManifest.clear()
+        except Exception as e:
+            print(f"Clearing the load checkpoints failed, a later --resume may skip stages of this run: {e}")
+
+        if faculty_hashes is not None:
+            WatermarkStore(settings.ETL_STATE_FILE).save(faculty_hashes, mongo_watermark)
+
+def bump_data_generation(postgres_loader: PostgreSQLLoader):
+    """Tell the API and dashboard caches that the loaded data changed"""
+    try:
+        generation = postgres_loader.bump_generation()
+        print(f"Data generation is now {generation}")
+    except Exception as e:
+        print(f"Bumping the data generation failed, cached responses expire by TTL only: {e}")
+
+def run_incremental(profiler: Optional[StageProfiler] = None):
+    """Extract only what changed since the last successful run and apply the diff to PostgreSQL"""
+    profiler = profiler or StageProfiler()
+    watermark_store = WatermarkStore(settings.ETL_STATE_FILE)
+    state = watermark_store.load()
+    if state is None:
+        print("No watermark from a previous run found, running a full ETL instead...")
+        main(profiler=profiler)
+        return
+
+    print(f"Starting incremental ETL Process (last run: {state['completed_at']})...")
+
+    sql_extractor = SQLExtractor()
+    mongo_extractor = MongoExtractor()
+    faculty_transformer = FacultyTransformer()
+    research_transformer = ResearchTransformer()
+    postgres_loader = PostgreSQLLoader()
+
+    if not connect_sources(profiler, sql_extractor, mongo_extractor, postgres_loader):
+        return
+
+    print("Extracting changed data...")
+    try:
+        with profiler.stage("extract.watermarks") as stage:
+            faculty_hashes = sql_extractor.extract_faculty_hashes()
+            stage.rows_out = len(faculty_hashes)
+        previous_hashes = state['mysql_faculties']
+
+        changed_faculty_ids = [
+            faculty_id for faculty_id, row_hash in faculty_hashes.items()
+            if previous_hashes.get(str(faculty_id)) != row_hash
+        ]
+        deleted_faculty_ids = [
+            int(faculty_id) for faculty_id in previous_hashes
+            if int(faculty_id) not in faculty_hashes
+        ]
+        # Papers of faculty that are new to the SQL source could not be linked before.
+        new_faculty_ids = [
+            str(faculty_id) for faculty_id in changed_faculty_ids
+            if str(faculty_id) not in previous_hashes
+        ]
+
+        with profiler.stage("extract.sql") as stage:
+            faculty_df = sql_extractor.extract_faculty(changed_faculty_ids) if changed_faculty_ids else pd.DataFrame()
+            stage.rows_out = len(faculty_df)
+        with profiler.stage("extract.mongo") as stage:
+            research_df, research_faculty_ids, deleted_research_faculty_ids, mongo_watermark = mongo_extractor.extract_changes(
+                state['mongo_research_papers'], extra_faculty_ids=new_faculty_ids
+            )
+            stage.rows_out = len(research_df)
+        print(
+            f"Found {len(faculty_df)} changed and {len(deleted_faculty_ids)} deleted faculty records, "
+            f"{len(research_df)} research paper records of {len(research_faculty_ids)} changed "
+            f"and {len(deleted_research_faculty_ids)} deleted documents"
+        )
+    except Exception as e:
+        print(f"Incremental extraction failed: {e}")
+        return
+
+    print("Transforming data...")
+    try:
+        if not faculty_df.empty:
+            faculty_df = normalize_names(profiler, faculty_transformer, faculty_df)
+
+        with profiler.stage("transform.research_areas", rows_in=len(research_df)) as stage:
+            research_by_faculty = research_transformer.get_research_areas_by_faculty(research_df) if not research_df.empty else {}
+            stage.rows_out = sum(len(areas) for areas in research_by_faculty.values())
+    except Exception as e:
+        print(f"Data transformation failed: {e}")
+        return
+
+    print("Loading changes to PostgreSQL...")
+    try:
+        with profiler.stage("create_tables"):
+            postgres_loader.create_tables()
+        with profiler.stage("load.incremental", rows_in=len(faculty_df) + len(research_df)):
+            postgres_loader.load_incremental_changes(
+                faculty_df,
+                deleted_faculty_ids,
+                research_df,
+                research_by_faculty,
+                research_faculty_ids + deleted_research_faculty_ids
+            )
     except Exception as e:
         print(f"PostgreSQL loading failed: {e}")
         return
 
+    with profiler.stage("finish"):
+        bump_data_generation(postgres_loader)
+        watermark_store.save(faculty_hashes, mongo_watermark)
+
 def run_api_server():
     """Start the FastAPI server for data access through API."""
     try:
@@ -110,23 +551,117 @@ def run_api_server():
 def run_dashboard_server():
     """Start the backend dashboard server"""
     try:
-        from etl_engine.dashboard.backend import app
+        from etl_engine.dashboard.backend import app, supervisor_index
+        supervisor_index.warm_up()
         print("Starting the Dashboard backend server on http://localhost:5000")
         app.run(debug=True, host='0.0.0.0', port=5000)
     except Exception as e:
         print(f"Failed to start dashboard server: {e}")
 
 if __name__ == "__main__":
-    if len(sys.argv) > 1:
-        command = sys.argv[1]
-
-        if command == "api":
-            run_api_server()
-        elif command == "dashboard":
-            run_dashboard_server()
-        elif command == "etl":
-            main()
-        else:
-            print("Usage: python3 -m etl_engine.main [etl|api|dashboard]")
+    parser = argparse.ArgumentParser(prog="python3 -m etl_engine.main")
+    parser.add_argument("command", nargs="?", default="etl", choices=["etl", "api", "dashboard"])
+    parser.add_argument("--bulk", action="store_true", help="Load PostgreSQL with COPY instead of the ORM")
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Extract, transform and load MongoDB research papers in fixed-size chunks"
+    )
+    parser.add_argument("--chunk-size", type=int, default=settings.ETL_CHUNK_SIZE, help="Rows per chunk for --stream")
+    parser.add_argument("--batch-size", type=int, default=settings.MONGO_BATCH_SIZE, help="MongoDB cursor batch size")
+    parser.add_argument(
+        "--parallel-extract",
+        action="store_true",
+        help="Read the faculty, department, school and research paper sources concurrently"
+    )
+    parser.add_argument(
+        "--transform-workers",
+        type=int,
+        default=settings.ETL_TRANSFORM_WORKERS,
+        help="Processes that compute the faculty and research analyses, split by faculty_id"
+    )
+    parser.add_argument(
+        "--staging-dir",
+        help="Persist the extracted and transformed data as Parquet files in this directory (needs pyarrow)"
+    )
+    parser.add_argument(
+        "--from-staging",
+        action="store_true",
+        help="Load the data staged in --staging-dir by an earlier run instead of reading the sources again"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue the load stages of a failed run from their last committed batch, when the data is unchanged"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only extract and load what changed since the last successful run"
+    )
+    parser.add_argument(
+        "--bulk-method",
+        choices=["copy", "values"],
+        default="copy",
+        help="Use COPY FROM STDIN (default) or batched execute_values inserts for --bulk"
+    )
+    parser.add_argument("--report", help="Write a JSON report of the per-stage timings, memory and row counts here")
+    parser.add_argument("--profile-dir", help="Profile every stage and write one profile per stage to this directory")
+    parser.add_argument(
+        "--profiler",
+        choices=PROFILERS,
+        default="cprofile",
+        help="Profiler for --profile-dir: cProfile .prof files (default) or pyinstrument .html files"
+    )
+    args = parser.parse_args()
+
+    if args.command == "api":
+        run_api_server()
+    elif args.command == "dashboard":
+        run_dashboard_server()
     else:
-        main()
+        try:
+            profiler = StageProfiler(
+                profile_dir=args.profile_dir,
+                profiler=args.profiler,
+                metadata={
+                    'incremental': args.incremental,
+                    'bulk': args.bulk,
+                    'bulk_method': args.bulk_method,
+                    'stream': args.stream,
+                    'chunk_size': args.chunk_size,
+                    'batch_size': args.batch_size,
+                    'parallel_extract': args.parallel_extract,
+                    'transform_workers': args.transform_workers,
+                    'staging_dir': args.staging_dir,
+                    'from_staging': args.from_staging,
+                    'resume': args.resume,
+                }
+            )
+        except ValueError as e:
+            parser.error(str(e))
+
+        if args.incremental:
+            run_incremental(profiler)
+        else:
+            main(
+                bulk=args.bulk,
+                bulk_method=args.bulk_method,
+                stream=args.stream,
+                chunk_size=args.chunk_size,
+                batch_size=args.batch_size,
+                parallel_extract=args.parallel_extract,
+                transform_workers=args.transform_workers,
+                staging_dir=args.staging_dir,
+                from_staging=args.from_staging,
+                resume=args.resume,
+                profiler=profiler
+            )
+
+        profiler.print_summary()
+        if args.report:
+            try:
+                profiler.write_report(args.report)
+                print(f"Run report written to {args.report}")
+            except OSError as e:
+                print(f"Writing the run report failed: {e}")
@@ -1,18 +1,59 @@
 from pydantic import BaseModel
-from typing import Dict, List
-
-class FacultyAnalysis(BaseModel):
-    total_faculty: int
-    positions_counts: Dict[str, int]
-    department_counts: Dict[str, int]
-    school_counts: Dict[str, int]
-
-class ResearchAnalysis(BaseModel):
-    total_publications: int
-    year_counts: Dict[int, int]
-    research_area_counts: Dict[str, int]
-    department_counts: Dict[str, int]
-    school_counts: Dict[str, int]
+from typing import Callable, Dict, List
+
+class MergeableAnalysis(BaseModel):
+    """
+    Counts computed from a set of rows that combine without the rows themselves.
+
+    merge gives the analysis of both row sets together and is associative, so chunks and
+    partitions can be analysed separately and added up in any grouping. subtract takes the
+    rows another analysis was computed from out again, e.g. rows that were deleted or replaced,
+    and raises ValueError when a count would go negative, as the rows were never counted here.
+    Totals are summed, count maps are summed per key and keys whose count drops to zero disappear.
+    """
+
+    def merge(self, other: "MergeableAnalysis") -> "MergeableAnalysis":
+        return self._combine(other, lambda left, right: left + right)
+
+    def subtract(self, other: "MergeableAnalysis") -> "MergeableAnalysis":
+        return self._combine(other, lambda left, right: left - right)
+
+    def __add__(self, other: "MergeableAnalysis") -> "MergeableAnalysis":
+        return self.merge(other)
+
+    def __sub__(self, other: "MergeableAnalysis") -> "MergeableAnalysis":
+        return self.subtract(other)
+
+    def _combine(self, other: "MergeableAnalysis", operation: Callable) -> "MergeableAnalysis":
+        values = {}
+        for name in type(self).model_fields:
+            left, right = getattr(self, name), getattr(other, name)
+            if isinstance(left, dict):
+                combined = dict(left)
+                for key, count in right.items():
+                    combined[key] = operation(combined.get(key, 0), count)
+                negative = [key for key, count in combined.items() if count < 0]
+                values[name] = {key: count for key, count in combined.items() if count != 0}
+            else:
+                values[name] = operation(left, right)
+                negative = values[name] < 0
+
+            if negative:
+                raise ValueError(f"{type(self).__name__}.{name} would become negative: {negative}")
+        return type(self)(**values)
+
+class FacultyAnalysis(MergeableAnalysis):
+    total_faculty: int = 0
+    positions_counts: Dict[str, int] = {}
+    department_counts: Dict[str, int] = {}
+    school_counts: Dict[str, int] = {}
+
+class ResearchAnalysis(MergeableAnalysis):
+    total_publications: int = 0
+    year_counts: Dict[int, int] = {}
+    research_area_counts: Dict[str, int] = {}
+    department_counts: Dict[str, int] = {}
+    school_counts: Dict[str, int] = {}
 
 class FacultyResearchMapping(BaseModel):
     faculty_name: str
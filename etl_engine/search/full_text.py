@@ -0,0 +1,111 @@
+import re
+from typing import Optional
+from sqlalchemy import Boolean, Select, Subquery, func, literal_column, select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import GenericFunction
+
+from etl_engine.loaders.postgres_loader import (
+    AnalyticsFaculty, ResearchArea, Publication, faculty_research_areas,
+    NAME_SEARCH_CONFIG, TEXT_SEARCH_CONFIG
+)
+
+
+class ts_match(GenericFunction):
+    """tsvector @@ tsquery, rendered as a plain function call on databases without full text search"""
+    type = Boolean()
+    inherit_cache = True
+
+
+@compiles(ts_match, "postgresql")
+def _compile_ts_match(element, compiler, **kw):
+    vector, query = list(element.clauses)
+    return f"{compiler.process(vector, **kw)} @@ {compiler.process(query, **kw)}"
+
+
+def search_query_text(term: str) -> Optional[str]:
+    """
+    Turn user input into a tsquery matching every word as a prefix, e.g. "mach learn" -> "mach:* & learn:*".
+
+    Returns None when the input holds no searchable words.
+    """
+    words = re.findall(r"\w+", term or "")
+    if not words:
+        return None
+    return " & ".join(f"{word}:*" for word in words)
+
+
+def _vector(config: str, column):
+    # The configuration is rendered inline so the expression matches the one in SEARCH_INDEX_SQL.
+    return func.to_tsvector(literal_column(f"'{config}'"), column)
+
+
+def _query(config: str, query_text: str):
+    return func.to_tsquery(literal_column(f"'{config}'"), query_text)
+
+
+def _match_and_rank(config: str, column, query_text: str):
+    vector = _vector(config, column)
+    query = _query(config, query_text)
+    return ts_match(vector, query), func.ts_rank(vector, query)
+
+
+def research_area_search(term: str) -> Optional[Select]:
+    """Research areas matching term as (id, area_name, relevance), best match first"""
+    query_text = search_query_text(term)
+    if query_text is None:
+        return None
+
+    match, rank = _match_and_rank(TEXT_SEARCH_CONFIG, ResearchArea.area_name, query_text)
+    return (
+        select(ResearchArea.id, ResearchArea.area_name, rank.label('relevance'))
+        .where(match)
+        .order_by(rank.desc(), ResearchArea.area_name)
+    )
+
+
+def faculty_by_research_area(term: str) -> Optional[Subquery]:
+    """
+    Faculty working on any research area matching term, as (faculty_id, relevance).
+
+    A faculty's relevance is that of their best matching area.
+    """
+    query_text = search_query_text(term)
+    if query_text is None:
+        return None
+
+    match, rank = _match_and_rank(TEXT_SEARCH_CONFIG, ResearchArea.area_name, query_text)
+    return (
+        select(faculty_research_areas.c.faculty_id, func.max(rank).label('relevance'))
+        .join(ResearchArea, ResearchArea.id == faculty_research_areas.c.research_area_id)
+        .where(match)
+        .group_by(faculty_research_areas.c.faculty_id)
+        .subquery('research_area_matches')
+    )
+
+
+def faculty_by_name(term: str) -> Optional[Subquery]:
+    """Faculty whose normalized name contains every word of term as a word prefix, as (faculty_id, relevance)"""
+    query_text = search_query_text(term)
+    if query_text is None:
+        return None
+
+    match, rank = _match_and_rank(NAME_SEARCH_CONFIG, AnalyticsFaculty.normalized_name, query_text)
+    return (
+        select(AnalyticsFaculty.faculty_id, rank.label('relevance'))
+        .where(match)
+        .subquery('name_matches')
+    )
+
+
+def publication_search(term: str) -> Optional[Select]:
+    """Publications whose title matches term as (Publication, relevance), best match first"""
+    query_text = search_query_text(term)
+    if query_text is None:
+        return None
+
+    match, rank = _match_and_rank(TEXT_SEARCH_CONFIG, Publication.paper_title, query_text)
+    return (
+        select(Publication, rank.label('relevance'))
+        .where(match)
+        .order_by(rank.desc(), Publication.id)
+    )
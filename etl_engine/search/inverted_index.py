@@ -0,0 +1,273 @@
+import bisect
+import re
+import threading
+import time
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from etl_engine.loaders.postgres_loader import (
+    get_postgres_db, read_data_generation, AnalyticsFaculty, ResearchArea,
+    FacultyPublicationStats, faculty_research_areas
+)
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    return re.findall(r"\w+", (text or "").lower())
+
+
+class SupervisorEntry(NamedTuple):
+    faculty_id: int
+    first_name: str
+    middle_name: Optional[str]
+    last_name: str
+    department_name: Optional[str]
+    school_name: str
+    position: str
+    research_areas: Tuple[str, ...]
+    publication_count: int
+    recent_publication_count: int
+
+
+class SupervisorIndex:
+    """
+    Read-only in-memory index answering supervisor searches by research area.
+
+    Words of research area names map to arrays of area numbers and every area to an array of
+    faculty numbers (positions in entries, which is sorted by faculty_id). Going through the
+    areas keeps a multi-word term matching within one area, as the SQL search does. Every word
+    of the term is matched as a prefix of a word in the area name.
+    """
+
+    def __init__(
+        self,
+        entries: List[SupervisorEntry],
+        area_names: List[str],
+        area_faculty: List[array],
+        generation: Optional[int] = None
+    ):
+        self.entries = entries
+        self.area_names = area_names
+        self.area_faculty = area_faculty
+        self.generation = generation
+
+        self.area_tokens = [set(tokenize(name)) for name in area_names]
+        postings: Dict[str, array] = {}
+        for area, tokens in enumerate(self.area_tokens):
+            for token in tokens:
+                postings.setdefault(token, array('i')).append(area)
+        self.tokens = sorted(postings)
+        self.token_areas = [postings[token] for token in self.tokens]
+
+    @classmethod
+    def load(cls, db: Session, generation: Optional[int] = None) -> "SupervisorIndex":
+        """Build the index from the loaded analytics tables in three statements"""
+        faculty_rows = db.execute(
+            select(
+                AnalyticsFaculty.faculty_id,
+                AnalyticsFaculty.first_name,
+                AnalyticsFaculty.middle_name,
+                AnalyticsFaculty.last_name,
+                AnalyticsFaculty.department_name,
+                AnalyticsFaculty.school_name,
+                AnalyticsFaculty.position,
+                func.coalesce(FacultyPublicationStats.publication_count, 0),
+                func.coalesce(FacultyPublicationStats.recent_publication_count, 0)
+            )
+            .outerjoin(FacultyPublicationStats, AnalyticsFaculty.faculty_id == FacultyPublicationStats.faculty_id)
+            .order_by(AnalyticsFaculty.faculty_id)
+        ).all()
+        areas = db.execute(select(ResearchArea.id, ResearchArea.area_name).order_by(ResearchArea.area_name)).all()
+        links = db.execute(select(faculty_research_areas.c.faculty_id, faculty_research_areas.c.research_area_id)).all()
+
+        faculty_numbers = {row[0]: number for number, row in enumerate(faculty_rows)}
+        area_numbers = {area_id: number for number, (area_id, _) in enumerate(areas)}
+        area_names = [area_name for _, area_name in areas]
+
+        area_faculty = [array('i') for _ in areas]
+        faculty_areas: List[List[int]] = [[] for _ in faculty_rows]
+        for faculty_id, area_id in links:
+            if faculty_id in faculty_numbers and area_id in area_numbers:
+                area_faculty[area_numbers[area_id]].append(faculty_numbers[faculty_id])
+                faculty_areas[faculty_numbers[faculty_id]].append(area_numbers[area_id])
+
+        for postings in area_faculty:
+            postings[:] = array('i', sorted(postings))
+
+        entries = [
+            SupervisorEntry(
+                *row[:7],
+                research_areas=tuple(area_names[area] for area in sorted(faculty_areas[number])),
+                publication_count=row[7],
+                recent_publication_count=row[8]
+            )
+            for number, row in enumerate(faculty_rows)
+        ]
+        return cls(entries, area_names, area_faculty, generation)
+
+    def matching_areas(self, term: str) -> Dict[int, float]:
+        """
+        Areas whose name matches every word of term, with a relevance between 0 and 1.
+
+        The relevance is the share of the area name's words that the term matched.
+        """
+        words = tokenize(term)
+        if not words:
+            return {}
+
+        areas = None
+        for word in words:
+            matched = set()
+            position = bisect.bisect_left(self.tokens, word)
+            while position < len(self.tokens) and self.tokens[position].startswith(word):
+                matched.update(self.token_areas[position])
+                position += 1
+            areas = matched if areas is None else areas & matched
+            if not areas:
+                return {}
+
+        return {
+            area: sum(1 for token in self.area_tokens[area] if any(token.startswith(word) for word in words))
+            / len(self.area_tokens[area])
+            for area in areas
+        }
+
+    def search(
+        self,
+        research_area: str,
+        position: Optional[str] = None,
+        positions: Optional[Iterable[str]] = None,
+        min_publications: int = 0
+    ) -> List[Tuple[SupervisorEntry, float]]:
+        """
+        Faculty working on any area matching research_area, with the relevance of their best area.
+
+        position keeps faculty whose position contains it (case-insensitive), positions those whose
+        position is one of them. Best matches come first, then faculty with more recent publications.
+        """
+        best: Dict[int, float] = {}
+        for area, relevance in self.matching_areas(research_area).items():
+            for number in self.area_faculty[area]:
+                if relevance > best.get(number, -1.0):
+                    best[number] = relevance
+
+        position = position.lower() if position else None
+        allowed_positions = set(positions) if positions is not None else None
+
+        results = []
+        for number, relevance in best.items():
+            entry = self.entries[number]
+            if position and position not in entry.position.lower():
+                continue
+            if allowed_positions is not None and entry.position not in allowed_positions:
+                continue
+            if entry.publication_count < min_publications:
+                continue
+            results.append((entry, relevance))
+
+        results.sort(key=lambda result: (-result[1], -result[0].recent_publication_count, result[0].faculty_id))
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'generation': self.generation,
+            'faculty': len(self.entries),
+            'research_areas': len(self.area_names),
+            'tokens': len(self.tokens),
+            'links': sum(len(postings) for postings in self.area_faculty),
+        }
+
+
+class ReloadingSupervisorIndex:
+    """
+    Hands out a SupervisorIndex that follows the ETL data generation.
+
+    The generation is re-read at most once per check_interval seconds and the index is rebuilt
+    when it changed. Searches keep using the previous index while a new one is built.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any] = get_postgres_db,
+        generation_reader: Callable[[], Optional[int]] = read_data_generation,
+        check_interval: float = 2.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.session_factory = session_factory
+        self.generation_reader = generation_reader
+        self.check_interval = check_interval
+        self.clock = clock
+
+        self._index: Optional[SupervisorIndex] = None
+        self._checked_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._building = False
+        self._counters = {'reloads': 0, 'generation_errors': 0}
+        self._last_build_seconds: Optional[float] = None
+
+    def get(self) -> SupervisorIndex:
+        """Return the current index, loading or reloading it first if the data changed"""
+        now = self.clock()
+        index = self._index
+        if index is not None and self._checked_at is not None and now - self._checked_at < self.check_interval:
+            return index
+
+        with self._lock:
+            # Another thread may have refreshed the index while this one waited, or is rebuilding it.
+            if self._index is not None and (
+                self._building or (self._checked_at is not None and self.clock() - self._checked_at < self.check_interval)
+            ):
+                return self._index
+            self._checked_at = self.clock()
+
+            try:
+                generation = self.generation_reader()
+            except Exception:
+                if self._index is None:
+                    raise
+                # Keep answering from the index we have.
+                self._counters['generation_errors'] += 1
+                return self._index
+
+            if self._index is None:
+                # Nothing to answer from yet, so the first load is built while holding the lock.
+                self._index = self._build(generation)
+                return self._index
+            if generation == self._index.generation:
+                return self._index
+            self._building = True
+
+        # Rebuild without the lock, other threads keep getting the previous index meanwhile.
+        try:
+            index = self._build(generation)
+            with self._lock:
+                self._index = index
+        finally:
+            self._building = False
+        return index
+
+    def warm_up(self):
+        """Load the index at startup so the first search does not pay for it"""
+        try:
+            index = self.get()
+            print(f"Loaded supervisor index: {index.stats()}")
+        except Exception as e:
+            print(f"Failed to load supervisor index, it will be loaded on the first search: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        index = self._index
+        return {
+            **self._counters,
+            'loaded': index is not None,
+            'build_seconds': self._last_build_seconds,
+            **(index.stats() if index is not None else {}),
+        }
+
+    def _build(self, generation: Optional[int]) -> SupervisorIndex:
+        start = time.perf_counter()
+        with self.session_factory() as db:
+            index = SupervisorIndex.load(db, generation)
+        self._last_build_seconds = round(time.perf_counter() - start, 4)
+        self._counters['reloads'] += 1
+        return index
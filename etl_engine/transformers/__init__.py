@@ -1,2 +1,3 @@
 from .faculty_transformer import FacultyTransformer
 from .research_transformer import ResearchTransformer
+from .partitioned_transformer import PartitionedTransformer
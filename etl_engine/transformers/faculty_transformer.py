@@ -1,7 +1,8 @@
 import pandas as pd
 from typing import Dict, Any
-from collections import Counter
 from etl_engine.models.transformer_models import FacultyAnalysis
+from etl_engine.utils.dataframes import count_values
+from .name_normalizer import normalize_names
 
 class FacultyTransformer:
     @staticmethod
@@ -11,13 +12,13 @@ class FacultyTransformer:
             return {}
 
         # Count faculty by position
-        position_counts = dict(Counter(faculty_df['position'].str.lower()))
+        position_counts = count_values(faculty_df['position'], lower=True)
 
         # Count faculty by department
-        department_counts = dict(Counter(faculty_df['department_name'].str.lower()))
+        department_counts = count_values(faculty_df['department_name'], lower=True)
 
         # Count faculty by school
-        school_counts = dict(Counter(faculty_df['school_name'].str.lower()))
+        school_counts = count_values(faculty_df['school_name'], lower=True)
 
         return FacultyAnalysis(
             total_faculty=len(faculty_df),
@@ -29,13 +30,6 @@ class FacultyTransformer:
     @staticmethod
     def normalize_faculty_names(faculty_df: pd.DataFrame) -> pd.DataFrame:
         """Create a standardized name format"""
-        faculty_df['normalized_name'] = faculty_df.apply(
-            lambda row: " ".join(filter(None, [
-                row['first_name'].lower().strip() if 'first_name' in row else '',
-                row['middle_name'].lower().strip() if 'middle_name' in row and row['middle_name'] else '',
-                row['last_name'].lower().strip() if 'last_name' in row else '',
-            ])),
-            axis=1
-        )
+        faculty_df['normalized_name'] = normalize_names(faculty_df)
 
         return faculty_df
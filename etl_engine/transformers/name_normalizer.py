@@ -0,0 +1,26 @@
+import numpy as np
+import pandas as pd
+from typing import Sequence
+
+NAME_COLUMNS = ('first_name', 'middle_name', 'last_name')
+
+
+def normalize_names(df: pd.DataFrame, columns: Sequence[str] = NAME_COLUMNS) -> pd.Series:
+    """
+    Build "first middle last" in lower case for every row using whole-column string operations.
+
+    Missing or blank name parts are skipped, so no double or trailing spaces are produced.
+    """
+    normalized = pd.Series('', index=df.index, dtype=object)
+
+    for column in columns:
+        if column not in df:
+            continue
+
+        part = df[column]
+        part = part.where(part.notna(), '').astype(str).str.lower().str.strip()
+
+        separator = np.where((normalized != '') & (part != ''), ' ', '')
+        normalized = normalized + separator + part
+
+    return normalized
@@ -0,0 +1,119 @@
+import multiprocessing
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from itertools import repeat
+from typing import Any, Callable, Dict, List, Union
+from etl_engine.core.config import settings
+from etl_engine.models.transformer_models import FacultyAnalysis, ResearchAnalysis
+from etl_engine.utils.dataframes import count_values
+from .faculty_transformer import FacultyTransformer
+from .research_transformer import ResearchTransformer
+
+RESEARCH_COUNT_COLUMNS = {
+    'year_counts': 'published_year',
+    'research_area_counts': 'research_area',
+    'department_counts': 'department',
+    'school_counts': 'school',
+}
+FACULTY_COUNT_COLUMNS = {
+    'positions_counts': 'position',
+    'department_counts': 'department_name',
+    'school_counts': 'school_name',
+}
+
+# Frame and partition codes of the running transform, inherited by forked workers.
+_shared: Dict[str, Any] = {}
+
+
+def _partition_frame(partition: Union[int, pd.DataFrame]) -> pd.DataFrame:
+    if isinstance(partition, pd.DataFrame):
+        return partition
+    return _shared['frame'][_shared['codes'] == partition]
+
+
+def _research_counts(partition: Union[int, pd.DataFrame], explode_areas: bool) -> ResearchAnalysis:
+    """Analysis of one partition of the research papers, run in a worker process"""
+    partition = _partition_frame(partition)
+    counts = {}
+    for name, column in RESEARCH_COUNT_COLUMNS.items():
+        values = partition[column]
+        if name == 'research_area_counts' and explode_areas:
+            values = values.explode()
+        counts[name] = count_values(values)
+    return ResearchAnalysis(total_publications=len(partition), **counts)
+
+
+def _faculty_counts(partition: Union[int, pd.DataFrame]) -> FacultyAnalysis:
+    """Analysis of one partition of the faculty, run in a worker process"""
+    partition = _partition_frame(partition)
+    return FacultyAnalysis(
+        total_faculty=len(partition),
+        **{name: count_values(partition[column], lower=True) for name, column in FACULTY_COUNT_COLUMNS.items()}
+    )
+
+
+class PartitionedTransformer:
+    """
+    Compute the faculty and research analyses on a process pool.
+
+    Rows are split into one partition per worker by a hash of faculty_id, every worker analyses
+    its partition and the partial analyses are merged into the same FacultyAnalysis and
+    ResearchAnalysis the single-process transformers return. Inputs smaller than min_rows,
+    or a single worker, go through the single-process transformers instead.
+
+    Where processes can be forked the workers select their partition from the frame they
+    inherit, elsewhere the partitions are pickled to them.
+    """
+
+    def __init__(self, workers: int = settings.ETL_TRANSFORM_WORKERS, min_rows: int = settings.ETL_TRANSFORM_MIN_ROWS):
+        self.workers = max(1, workers)
+        self.min_rows = min_rows
+
+    def transform_research_data(self, research_df: pd.DataFrame) -> Dict[str, Any]:
+        if not self._use_pool(research_df):
+            return ResearchTransformer.transform_research_data(research_df)
+
+        # Decided once for the whole frame, as the single-process transform does.
+        explode_areas = isinstance(research_df['research_area'].iloc[0], list)
+        partial_analyses = self._analyse(
+            research_df[['faculty_id', *RESEARCH_COUNT_COLUMNS.values()]],
+            lambda pool, partitions: pool.map(_research_counts, partitions, repeat(explode_areas))
+        )
+        return reduce(ResearchAnalysis.merge, partial_analyses, ResearchAnalysis()).dict()
+
+    def transform_facutly_data(self, faculty_df: pd.DataFrame) -> Dict[str, Any]:
+        if not self._use_pool(faculty_df):
+            return FacultyTransformer.transform_facutly_data(faculty_df)
+
+        partial_analyses = self._analyse(
+            faculty_df[['faculty_id', *FACULTY_COUNT_COLUMNS.values()]],
+            lambda pool, partitions: pool.map(_faculty_counts, partitions)
+        )
+        return reduce(FacultyAnalysis.merge, partial_analyses, FacultyAnalysis()).dict()
+
+    def _analyse(self, df: pd.DataFrame, run: Callable[[ProcessPoolExecutor, List], Any]) -> List[Any]:
+        codes = self.partition_codes(df, self.workers)
+
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            partitions = [group for _, group in df.groupby(codes, sort=False)]
+            with ProcessPoolExecutor(max_workers=len(partitions)) as pool:
+                return list(run(pool, partitions))
+
+        _shared.update(frame=df, codes=codes)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context('fork')
+            ) as pool:
+                return list(run(pool, range(self.workers)))
+        finally:
+            _shared.clear()
+
+    @staticmethod
+    def partition_codes(df: pd.DataFrame, partitions: int) -> np.ndarray:
+        """Partition number of every row, rows of the same faculty_id share a partition"""
+        return pd.util.hash_pandas_object(df['faculty_id'], index=False).to_numpy() % partitions
+
+    def _use_pool(self, df: pd.DataFrame) -> bool:
+        return self.workers > 1 and not df.empty and len(df) >= self.min_rows and 'faculty_id' in df
@@ -1,7 +1,8 @@
 import pandas as pd
-from typing import Counter, Dict, List, Any
-from collections import defaultdict
+from typing import Dict, List, Any
 from etl_engine.models.transformer_models import ResearchAnalysis
+from etl_engine.utils.dataframes import count_values
+from .name_normalizer import normalize_names
 
 class ResearchTransformer:
     @staticmethod
@@ -11,27 +12,20 @@ class ResearchTransformer:
             return {}
 
         # Convert the name into normalized form.
-        research_df['normalized_name'] = research_df.apply(
-            lambda row: " ".join(filter(None, [
-                str(row['first_name']).lower().strip() if pd.notna(row['first_name']) else '',
-                str(row['middle_name']).lower().strip() if pd.notna(row['middle_name']) else '',
-                str(row['last_name']).lower().strip() if pd.notna(row['last_name']) else ''
-            ])),
-            axis=1
-        )
+        research_df['normalized_name'] = normalize_names(research_df)
 
         # Number of publications by year
-        year_counts = dict(Counter(research_df['published_year']))
+        year_counts = count_values(research_df['published_year'])
 
         # Number of publications by research area
         research_areas = research_df['research_area'].explode() if isinstance(research_df['research_area'].iloc[0], list) else research_df['research_area']
-        area_counts = dict(Counter(research_areas))
+        area_counts = count_values(research_areas)
 
         # Number of publications by department
-        dept_counts = dict(Counter(research_df['department']))
+        dept_counts = count_values(research_df['department'])
 
         # Number of publications by school
-        school_counts = dict(Counter(research_df['school']))
+        school_counts = count_values(research_df['school'])
 
         return ResearchAnalysis(
             total_publications=len(research_df),
@@ -42,23 +36,66 @@ class ResearchTransformer:
         ).dict()
 
     @staticmethod
-    def get_research_areas_by_faculty(research_df: pd.DataFrame) -> Dict[str, Any]:
-        """Create a mapping of faculty names to their research areas"""
-        faculty_research = defaultdict(set)
-
-        for _, row in research_df.iterrows():
-            research_area = row['research_area']
-
-            if isinstance(research_area, str):
-                areas = [area.strip() for area in research_area.split(',')]
-            elif isinstance(research_area, list):
-                areas = research_area
-            else:
-                areas = []
-
-            # Research area for main author
-            main_author = row.get('faculty_id')
-            if main_author:
-                faculty_research[main_author].update(areas)
-
-        return {k: list(set(v)) for k, v in faculty_research.items()}
+    def merge_research_analysis(left: Dict[str, Any], right: Dict[str, Any]) -> Dict[str, Any]:
+        """Combine the analyses of two chunks of research data"""
+        if not left:
+            return right
+        if not right:
+            return left
+
+        return ResearchAnalysis(**left).merge(ResearchAnalysis(**right)).dict()
+
+    @staticmethod
+    def merge_research_areas(left: Dict[str, List[str]], right: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        """Combine the faculty to research area mappings of two chunks of research data"""
+        merged = {faculty_id: set(areas) for faculty_id, areas in left.items()}
+        for faculty_id, areas in right.items():
+            merged.setdefault(faculty_id, set()).update(areas)
+
+        return {k: list(v) for k, v in merged.items()}
+
+    @staticmethod
+    def get_research_areas_by_faculty(research_df: pd.DataFrame, return_edges: bool = False):
+        """
+        Create a mapping of faculty names to their research areas.
+
+        With return_edges=True the (faculty_id, area_name) edge list it was built from is returned as well.
+        """
+        research_edges = ResearchTransformer.get_research_area_edges(research_df)
+
+        faculty_research = {}
+        if 'faculty_id' in research_df:
+            faculty_ids = research_df['faculty_id']
+            # Faculty whose research area could not be read still get an (empty) entry.
+            for faculty_id in faculty_ids[faculty_ids.notna() & faculty_ids.astype(bool)].unique():
+                faculty_research[faculty_id] = []
+
+            grouped = research_edges.groupby('faculty_id', sort=False)['area_name'].agg(list)
+            faculty_research.update(grouped.to_dict())
+
+        if return_edges:
+            return faculty_research, research_edges
+        return faculty_research
+
+    @staticmethod
+    def get_research_area_edges(research_df: pd.DataFrame) -> pd.DataFrame:
+        """Unique (faculty_id, area_name) pairs, splitting comma separated research areas"""
+        if research_df.empty or 'faculty_id' not in research_df or 'research_area' not in research_df:
+            return pd.DataFrame(columns=['faculty_id', 'area_name'])
+
+        pairs = research_df[['faculty_id', 'research_area']]
+        pairs = pairs[pairs['faculty_id'].notna() & pairs['faculty_id'].astype(bool)]
+
+        value_types = pairs['research_area'].map(type)
+
+        # Every paper of a faculty repeats the same area string, so split each distinct pair once.
+        string_pairs = pairs[value_types == str].drop_duplicates()
+        string_edges = string_pairs.assign(area_name=string_pairs['research_area'].str.split(',')).explode('area_name')
+        string_edges['area_name'] = string_edges['area_name'].str.strip()
+
+        list_pairs = pairs[value_types == list]
+        list_edges = list_pairs.assign(area_name=list_pairs['research_area']).explode('area_name')
+        list_edges = list_edges[list_edges['area_name'].notna()]
+
+        research_edges = pd.concat([string_edges, list_edges])[['faculty_id', 'area_name']]
+        return research_edges.drop_duplicates().reset_index(drop=True)
@@ -0,0 +1,72 @@
+import pandas as pd
+from collections import Counter
+from pandas.api.types import union_categoricals
+from typing import Any, Dict, List
+
+# String columns of the extracted frames that repeat a few distinct values across many rows.
+CATEGORICAL_COLUMNS = ('position', 'department_name', 'school_name', 'department', 'school', 'research_area', 'journal')
+
+# Integer columns whose values fit a nullable 16-bit integer.
+SMALL_INT_COLUMNS = ('published_year',)
+
+
+def compact_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store the repeated string columns as categoricals and the small integer columns as Int16, in place.
+
+    A column that cannot be converted, e.g. research areas given as lists or years given as
+    text, keeps its dtype.
+    """
+    for column in CATEGORICAL_COLUMNS:
+        if column in df and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            try:
+                df[column] = df[column].astype('category')
+            except TypeError:
+                pass
+
+    for column in SMALL_INT_COLUMNS:
+        if column in df and df[column].dtype != 'Int16':
+            try:
+                df[column] = df[column].astype('Int16')
+            except (TypeError, ValueError, OverflowError):
+                pass
+
+    return df
+
+
+def concat_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """pd.concat for chunks of one extraction, categorical columns stay categorical when the chunks' categories differ"""
+    if len(frames) == 1:
+        return frames[0].reset_index(drop=True)
+
+    columns = {}
+    for column in frames[0].columns:
+        parts = [frame[column] for frame in frames]
+        if all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+            columns[column] = pd.Series(union_categoricals(parts))
+        else:
+            columns[column] = pd.concat(parts, ignore_index=True)
+
+    return pd.DataFrame(columns)
+
+
+def null_values(df: pd.DataFrame) -> pd.DataFrame:
+    """Copy of df as plain python objects with NaN/NA turned into None, as the database stores them"""
+    return df.astype(object).where(df.notna(), None)
+
+
+def count_values(series: pd.Series, lower: bool = False) -> Dict[Any, int]:
+    """
+    Number of rows per distinct value, as collections.Counter counts them.
+
+    Categoricals are counted from their codes, so lower only lower-cases the distinct values.
+    Other typed columns are counted by pandas, object columns by Counter.
+    """
+    if series.dtype != object:
+        counts = series.value_counts(sort=False, dropna=False)
+        counts = counts[counts > 0]
+        if lower:
+            counts = counts.groupby(counts.index.astype(object).str.lower(), sort=False, dropna=False).sum()
+        return {value: int(count) for value, count in counts.items()}
+
+    return dict(Counter(series.str.lower() if lower else series))
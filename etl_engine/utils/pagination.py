@@ -0,0 +1,23 @@
+import base64
+import binascii
+import json
+
+
+def encode_cursor(key: str, last_value: int) -> str:
+    """Opaque next-page token that resumes after last_value of the key column"""
+    payload = json.dumps({'key': key, 'after': last_value}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(key: str, cursor: str) -> int:
+    """Return the key value a token resumes after, or raise ValueError if it is not a token for key"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+    if not isinstance(payload, dict) or payload.get('key') != key or not isinstance(payload.get('after'), int):
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+    return payload['after']
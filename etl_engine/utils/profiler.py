@@ -0,0 +1,235 @@
+import cProfile
+import json
+import os
+import re
+import resource
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+PROFILERS = ("cprofile", "pyinstrument")
+
+
+def current_rss_bytes() -> Optional[int]:
+    """Resident set size of this process, or None where /proc is not available"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def process_peak_rss_bytes() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def children_cpu_seconds() -> float:
+    """User and system CPU time of the child processes that have exited and been waited for"""
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+class _RssSampler:
+    """Track the highest resident set size seen while a stage runs"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.peak = current_rss_bytes()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self.peak is None:
+            return
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Optional[int]:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+        self._sample()
+        return self.peak
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def _sample(self):
+        rss = current_rss_bytes()
+        if rss is not None and (self.peak is None or rss > self.peak):
+            self.peak = rss
+
+
+class Stage:
+    """Measurements of one ETL stage, rows_in and rows_out are filled in by the stage itself"""
+
+    def __init__(self, name: str, rows_in: Optional[int] = None):
+        self.name = name
+        self.rows_in = rows_in
+        self.rows_out: Optional[int] = None
+        self.status = "ok"
+        self.error: Optional[str] = None
+        self.started_at: Optional[str] = None
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.peak_rss_bytes: Optional[int] = None
+        self.profile_path: Optional[str] = None
+
+    def fail(self, error: Any):
+        self.status = "failed"
+        self.error = str(error)
+
+    @property
+    def rows_per_sec(self) -> Optional[float]:
+        rows = self.rows_out if self.rows_out is not None else self.rows_in
+        if rows is None or self.wall_seconds <= 0:
+            return None
+        return rows / self.wall_seconds
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'status': self.status,
+            'error': self.error,
+            'started_at': self.started_at,
+            'wall_seconds': round(self.wall_seconds, 6),
+            'cpu_seconds': round(self.cpu_seconds, 6),
+            'peak_rss_mb': round(self.peak_rss_bytes / 2 ** 20, 2) if self.peak_rss_bytes is not None else None,
+            'rows_in': self.rows_in,
+            'rows_out': self.rows_out,
+            'rows_per_sec': round(self.rows_per_sec, 2) if self.rows_per_sec is not None else None,
+            'profile_path': self.profile_path,
+        }
+
+
+class StageProfiler:
+    """
+    Record wall time, CPU time, peak RSS and row counts of every ETL stage.
+
+    Wrap a stage in `with profiler.stage("load.faculty") as stage:` and set stage.rows_out
+    inside. When profile_dir is given every stage is also run under cProfile (or pyinstrument)
+    and its profile written there. cProfile only sees the thread that runs the stage.
+    CPU time is the process-wide time plus that of child processes the stage waited for, so it
+    includes every thread and every worker process the stage uses.
+    """
+
+    def __init__(
+        self,
+        profile_dir: Optional[str] = None,
+        profiler: str = "cprofile",
+        rss_sample_interval: float = 0.05,
+        metadata: Optional[Dict[str, Any]] = None
+    ):
+        if profiler not in PROFILERS:
+            raise ValueError(f"Unknown profiler {profiler}, expected one of {', '.join(PROFILERS)}")
+
+        self.profile_dir = profile_dir
+        self.profiler = profiler
+        self.rss_sample_interval = rss_sample_interval
+        self.metadata = dict(metadata or {})
+        self.stages: List[Stage] = []
+        self.started_at = datetime.now()
+        self._start = time.perf_counter()
+        self._pyinstrument_profiler = None
+
+        if profile_dir:
+            if profiler == "pyinstrument":
+                try:
+                    from pyinstrument import Profiler
+                except ImportError:
+                    raise ValueError("The pyinstrument profiler needs pyinstrument, install it with: pip install pyinstrument")
+                self._pyinstrument_profiler = Profiler
+            os.makedirs(profile_dir, exist_ok=True)
+
+    @contextmanager
+    def stage(self, name: str, rows_in: Optional[int] = None) -> Iterator[Stage]:
+        stage = Stage(name, rows_in)
+        stage.started_at = datetime.now().isoformat()
+        self.stages.append(stage)
+
+        sampler = _RssSampler(self.rss_sample_interval)
+        sampler.start()
+        stage_profiler = None
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time() + children_cpu_seconds()
+        try:
+            stage_profiler = self._start_profiler()
+            yield stage
+        except BaseException as e:
+            stage.fail(e)
+            raise
+        finally:
+            stage.wall_seconds = time.perf_counter() - wall_start
+            stage.cpu_seconds = time.process_time() + children_cpu_seconds() - cpu_start
+            stage.peak_rss_bytes = sampler.stop()
+            if stage_profiler is not None:
+                stage.profile_path = self._save_profile(stage_profiler, len(self.stages), name)
+
+    def report(self) -> Dict[str, Any]:
+        peak = process_peak_rss_bytes()
+        return {
+            'started_at': self.started_at.isoformat(),
+            'finished_at': datetime.now().isoformat(),
+            'wall_seconds': round(time.perf_counter() - self._start, 6),
+            'process_peak_rss_mb': round(peak / 2 ** 20, 2),
+            'status': "failed" if any(stage.status != "ok" for stage in self.stages) else "ok",
+            'metadata': self.metadata,
+            'stages': [stage.as_dict() for stage in self.stages],
+        }
+
+    def write_report(self, path: str):
+        """Write the JSON run report, replacing any previous report at path"""
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(self.report(), f, indent=2)
+        os.replace(temp_path, path)
+
+    def print_summary(self):
+        print("Stage timings:")
+        print(f"  {'stage':<28} {'wall s':>9} {'cpu s':>9} {'peak MB':>9} {'rows':>10} {'rows/s':>11}")
+        for stage in self.stages:
+            entry = stage.as_dict()
+            rows = entry['rows_out'] if entry['rows_out'] is not None else entry['rows_in']
+            print(
+                f"  {stage.name:<28} {entry['wall_seconds']:>9.3f} {entry['cpu_seconds']:>9.3f} "
+                f"{self._format(entry['peak_rss_mb'], '.1f'):>9} {self._format(rows, 'd'):>10} "
+                f"{self._format(entry['rows_per_sec'], ',.0f'):>11}"
+                f"{'' if stage.status == 'ok' else '  FAILED'}"
+            )
+
+    @staticmethod
+    def _format(value, spec: str) -> str:
+        return "-" if value is None else format(value, spec)
+
+    def _start_profiler(self):
+        if not self.profile_dir:
+            return None
+
+        if self.profiler == "pyinstrument":
+            profiler = self._pyinstrument_profiler()
+            profiler.start()
+            return profiler
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return profiler
+
+    def _save_profile(self, profiler, number: int, name: str) -> str:
+        file_name = f"{number:02d}_{re.sub(r'[^A-Za-z0-9_.-]', '_', name)}"
+        if self.profiler == "pyinstrument":
+            profiler.stop()
+            path = os.path.join(self.profile_dir, f"{file_name}.html")
+            with open(path, 'w') as f:
+                f.write(profiler.output_html())
+            return path
+
+        profiler.disable()
+        path = os.path.join(self.profile_dir, f"{file_name}.prof")
+        profiler.dump_stats(path)
+        return path
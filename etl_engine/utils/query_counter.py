@@ -0,0 +1,25 @@
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from typing import List
+
+
+class QueryCounter:
+    """Count the SQL statements an engine sends to the database while the context is active"""
+
+    def __init__(self, engine: Engine, keep_statements: bool = False):
+        self.engine = engine
+        self.keep_statements = keep_statements
+        self.count = 0
+        self.statements: List[str] = []
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+        if self.keep_statements:
+            self.statements.append(statement)
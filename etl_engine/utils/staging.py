@@ -0,0 +1,171 @@
+import json
+import os
+import shutil
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from typing import Any, Dict, Type
+from pydantic import BaseModel
+from etl_engine.core.config import settings
+from etl_engine.utils.dataframes import concat_frames
+
+MANIFEST_FILE = "manifest.json"
+
+
+def _arrow():
+    import pyarrow
+    import pyarrow.parquet
+    return pyarrow, pyarrow.parquet
+
+
+class StagingStore:
+    """
+    Persist the output of the ETL stages as Parquet files in a local directory.
+
+    Every staged frame is a directory of Parquet parts of at most rows_per_file rows, and
+    manifest.json lists what has been staged. A later run can read the staged data back with
+    memory-mapped Arrow reads instead of extracting or transforming it again. Columns Arrow
+    cannot store as they are, e.g. mixed strings and lists, are staged as JSON text.
+    """
+
+    def __init__(self, path: str, rows_per_file: int = settings.ETL_CHUNK_SIZE):
+        self.path = path
+        self.rows_per_file = rows_per_file
+
+    @property
+    def manifest(self) -> Dict[str, Any]:
+        manifest_path = os.path.join(self.path, MANIFEST_FILE)
+        if not os.path.exists(manifest_path):
+            return {'created_at': None, 'stages': {}}
+
+        with open(manifest_path) as f:
+            return json.load(f)
+
+    def has(self, *names: str) -> bool:
+        stages = self.manifest['stages']
+        return all(name in stages for name in names)
+
+    def reset(self):
+        """Forget everything staged by a previous run"""
+        for name in self.manifest['stages']:
+            shutil.rmtree(os.path.join(self.path, name), ignore_errors=True)
+
+        os.makedirs(self.path, exist_ok=True)
+        self._write_manifest({'created_at': datetime.now().isoformat(), 'stages': {}})
+
+    def write_frame(self, name: str, df: pd.DataFrame):
+        pa, pq = _arrow()
+        df = df.reset_index(drop=True)
+        json_columns = []
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            df, json_columns = self._encode_mixed_columns(df)
+            table = pa.Table.from_pandas(df, preserve_index=False)
+
+        list_columns = [
+            field.name for field in table.schema
+            if pa.types.is_list(field.type) or pa.types.is_large_list(field.type)
+        ]
+
+        temp_dir = os.path.join(self.path, f"{name}.tmp")
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        os.makedirs(temp_dir)
+
+        files = []
+        for number, offset in enumerate(range(0, max(len(df), 1), self.rows_per_file)):
+            file_name = f"part-{number:05d}.parquet"
+            pq.write_table(table.slice(offset, self.rows_per_file), os.path.join(temp_dir, file_name))
+            files.append(file_name)
+
+        self._replace_stage(name, temp_dir, {
+            'rows': len(df),
+            'files': files,
+            'json_columns': json_columns,
+            'list_columns': list_columns,
+        })
+
+    def read_frame(self, name: str) -> pd.DataFrame:
+        _, pq = _arrow()
+        stage = self.manifest['stages'][name]
+
+        frames = [
+            pq.read_table(os.path.join(self.path, name, file_name), memory_map=True).to_pandas()
+            for file_name in stage['files']
+        ]
+        df = concat_frames(frames)
+
+        for column in stage['json_columns']:
+            df[column] = df[column].map(lambda value: None if value is None else json.loads(value))
+        for column in stage['list_columns']:
+            # Arrow hands list values back as numpy arrays.
+            df[column] = df[column].map(lambda value: value.tolist() if isinstance(value, np.ndarray) else value)
+
+        return df
+
+    def write_analysis(self, name: str, analysis: Dict[str, Any]):
+        """Stage an analysis dict as (field, key, count) rows, totals have no key"""
+        rows = []
+        for field, value in analysis.items():
+            if isinstance(value, dict):
+                rows.extend((field, str(key), count) for key, count in value.items())
+            else:
+                rows.append((field, None, value))
+
+        self.write_frame(name, pd.DataFrame(rows, columns=['field', 'key', 'count']))
+
+    def read_analysis(self, name: str, model: Type[BaseModel]) -> Dict[str, Any]:
+        values: Dict[str, Any] = {}
+        for field, key, count in self.read_frame(name).itertuples(index=False, name=None):
+            if key is None:
+                values[field] = count
+            else:
+                values.setdefault(field, {})[key] = count
+
+        return model(**values).dict() if values else {}
+
+    def write_json(self, name: str, value: Any):
+        temp_path = os.path.join(self.path, f"{name}.json.tmp")
+        with open(temp_path, 'w') as f:
+            json.dump(value, f)
+
+        temp_dir = os.path.join(self.path, f"{name}.tmp")
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        os.makedirs(temp_dir)
+        os.replace(temp_path, os.path.join(temp_dir, "value.json"))
+        self._replace_stage(name, temp_dir, {})
+
+    def read_json(self, name: str) -> Any:
+        with open(os.path.join(self.path, name, "value.json")) as f:
+            return json.load(f)
+
+    @staticmethod
+    def _encode_mixed_columns(df: pd.DataFrame):
+        pa, _ = _arrow()
+        df = df.copy()
+        json_columns = []
+        for column in df.columns:
+            if df[column].dtype != object:
+                continue
+            try:
+                pa.array(df[column], from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                df[column] = df[column].map(lambda value: None if value is None else json.dumps(value, default=str))
+                json_columns.append(column)
+        return df, json_columns
+
+    def _replace_stage(self, name: str, temp_dir: str, entry: Dict[str, Any]):
+        """Swap in a completely written stage directory, then record it in the manifest"""
+        final_dir = os.path.join(self.path, name)
+        shutil.rmtree(final_dir, ignore_errors=True)
+        os.replace(temp_dir, final_dir)
+
+        manifest = self.manifest
+        manifest['stages'][name] = {**entry, 'staged_at': datetime.now().isoformat()}
+        self._write_manifest(manifest)
+
+    def _write_manifest(self, manifest: Dict[str, Any]):
+        temp_path = os.path.join(self.path, f"{MANIFEST_FILE}.tmp")
+        with open(temp_path, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(temp_path, os.path.join(self.path, MANIFEST_FILE))
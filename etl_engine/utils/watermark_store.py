@@ -0,0 +1,32 @@
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+class WatermarkStore:
+    """Persist the per-source watermarks of the last successful ETL run in a JSON file"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Return the saved state, or None when no run has completed yet"""
+        if not os.path.exists(self.path):
+            return None
+
+        with open(self.path) as f:
+            return json.load(f)
+
+    def save(self, mysql_faculties: Dict[Any, str], mongo_research_papers: Dict[str, Any]):
+        """Atomically replace the saved state"""
+        state = {
+            'completed_at': datetime.now().isoformat(),
+            'mysql_faculties': {str(faculty_id): row_hash for faculty_id, row_hash in mysql_faculties.items()},
+            'mongo_research_papers': mongo_research_papers,
+        }
+
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(state, f)
+        os.replace(temp_path, self.path)